@@ -0,0 +1,206 @@
+"""Benchmark container build and resolution on synthetic graphs.
+
+Usage: python -m benchmarks [--sizes 10 100] [--shapes wide deep] [--output results.json] [--compare previous.json]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any
+
+from benchmarks.graphs import SHAPES
+from imbue import Container, Context, ContextualizedDependency
+
+# Number of resolutions per measure, scaled down for bigger graphs.
+OPERATIONS = 20_000
+REPEAT = 3
+
+
+def _container(
+    classes: list[type], context: Context, root_context: Context
+) -> Container:
+    *dependencies, root = classes
+    return Container(
+        *(ContextualizedDependency(cls, context) for cls in dependencies),
+        ContextualizedDependency(root, root_context),
+    )
+
+
+def _best(measure: Callable[[], float]) -> float:
+    return min(measure() for _ in range(REPEAT))
+
+
+def _per_operation(func: Callable[[], Any], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number
+
+
+async def _async_per_operation(
+    func: Callable[[], Awaitable[Any]], number: int
+) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        await func()
+    return (time.perf_counter() - start) / number
+
+
+def bench_build(classes: list[type]) -> float:
+    def _build() -> float:
+        start = time.perf_counter()
+        _container(classes, Context.APPLICATION, Context.APPLICATION)
+        return time.perf_counter() - start
+
+    return _best(_build)
+
+
+async def bench_async(classes: list[type], number: int) -> dict[str, float]:
+    root = classes[-1]
+    results = {}
+
+    container = _container(classes, Context.APPLICATION, Context.APPLICATION)
+    async with container.application_context() as app_container:
+        await app_container.get(root)
+        results["application_hit"] = await _async_per_operation(
+            lambda: app_container.get(root), number
+        )
+        async with app_container.task_context() as task_container:
+            results["task_hit"] = await _async_per_operation(
+                lambda: task_container.get(root), number
+            )
+
+    container = _container(classes, Context.TASK, Context.TASK)
+    async with container.application_context() as app_container:
+
+        async def _task() -> None:
+            async with app_container.task_context() as task_container:
+                await task_container.get(root)
+
+        results["task_cold"] = await _async_per_operation(_task, number)
+
+    container = _container(classes, Context.APPLICATION, Context.FACTORY)
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            await task_container.get(root)
+            results["factory"] = await _async_per_operation(
+                lambda: task_container.get(root), number
+            )
+    return results
+
+
+def bench_sync(classes: list[type], number: int) -> dict[str, float]:
+    root = classes[-1]
+    results = {}
+
+    container = _container(classes, Context.APPLICATION, Context.APPLICATION)
+    with container.sync_application_context() as app_container:
+        app_container.get(root)
+        results["application_hit"] = _per_operation(
+            lambda: app_container.get(root), number
+        )
+        with app_container.task_context() as task_container:
+            results["task_hit"] = _per_operation(
+                lambda: task_container.get(root), number
+            )
+
+    container = _container(classes, Context.TASK, Context.TASK)
+    with container.sync_application_context() as app_container:
+
+        def _task() -> None:
+            with app_container.task_context() as task_container:
+                task_container.get(root)
+
+        results["task_cold"] = _per_operation(_task, number)
+
+    container = _container(classes, Context.APPLICATION, Context.FACTORY)
+    with container.sync_application_context() as app_container:
+        with app_container.task_context() as task_container:
+            task_container.get(root)
+            results["factory"] = _per_operation(
+                lambda: task_container.get(root), number
+            )
+    return results
+
+
+def run(shapes: list[str], sizes: list[int]) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+
+    def _add(shape: str, size: int, metric: str, value: float | None, **extra) -> None:
+        results.append(
+            {"shape": shape, "size": size, "metric": metric, "seconds": value, **extra}
+        )
+        if value is not None:
+            print(f"{shape:>8} {size:>6} {metric:<24} {value * 1e6:>12.2f} us")
+        else:
+            print(f"{shape:>8} {size:>6} {metric:<24} {extra.get('error')}")
+
+    for shape in shapes:
+        for size in sizes:
+            classes = SHAPES[shape](size)
+            number = max(OPERATIONS // size, 10)
+            try:
+                _add(shape, size, "build", bench_build(classes))
+                for metric, value in asyncio.run(bench_async(classes, number)).items():
+                    _add(shape, size, f"async_{metric}", value)
+                for metric, value in bench_sync(classes, number).items():
+                    _add(shape, size, f"sync_{metric}", value)
+            except Exception as e:
+                _add(shape, size, "error", None, error=repr(e))
+    return results
+
+
+def compare(results: list[dict[str, Any]], previous: list[dict[str, Any]]) -> None:
+    """Print the ratio of the current to the previous results, above 1 is slower."""
+    by_key = {(r["shape"], r["size"], r["metric"]): r["seconds"] for r in previous}
+    for result in results:
+        before = by_key.get((result["shape"], result["size"], result["metric"]))
+        if before and result["seconds"]:
+            print(
+                f"{result['shape']:>8} {result['size']:>6} {result['metric']:<24} "
+                f"{result['seconds'] / before:>8.2f}x"
+            )
+
+
+def _version() -> str:
+    try:
+        return version("imbue")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=list(SHAPES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 100, 1000, 10000])
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument(
+        "--compare", help="JSON results of a previous run to compare to"
+    )
+    args = parser.parse_args()
+
+    results = run(args.shapes, args.sizes)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "imbue": _version(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f)["results"])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
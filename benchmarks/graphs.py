@@ -0,0 +1,49 @@
+"""Synthetic dependency graphs, each class depends on the classes of its fields."""
+
+from collections.abc import Callable
+from dataclasses import make_dataclass
+
+
+def _make(name: str, dependencies: list[type]) -> type:
+    return make_dataclass(name, [(f"d{i}", d) for i, d in enumerate(dependencies)])
+
+
+def wide(size: int) -> list[type]:
+    """A root depending on all other classes."""
+    leaves = [_make(f"Leaf{i}", []) for i in range(size - 1)]
+    return [*leaves, _make("Root", leaves)]
+
+
+def deep(size: int) -> list[type]:
+    """A chain where each class depends on the previous one."""
+    classes = [_make("Node0", [])]
+    for i in range(1, size):
+        classes.append(_make(f"Node{i}", [classes[-1]]))
+    return classes
+
+
+def diamond(size: int, width: int = 10) -> list[type]:
+    """Layers of classes, each depending on two classes of the previous layer,
+    so that dependencies are shared by multiple dependents.
+    """
+    classes: list[type] = []
+    previous: list[type] = []
+    while len(classes) < size - 1:
+        layer = []
+        for i in range(min(width, size - 1 - len(classes))):
+            dependencies = (
+                [previous[i % len(previous)], previous[(i + 1) % len(previous)]]
+                if previous
+                else []
+            )
+            layer.append(_make(f"Node{len(classes) + i}", dependencies))
+        classes.extend(layer)
+        previous = layer
+    return [*classes, _make("Root", previous)]
+
+
+SHAPES: dict[str, Callable[[int], list[type]]] = {
+    "wide": wide,
+    "deep": deep,
+    "diamond": diamond,
+}
@@ -1,3 +1,9 @@
+from imbue.ambient import (
+    current_sync_task_container,
+    current_task_container,
+    get,
+    sync_get,
+)
 from imbue.container import Container
 from imbue.contexts.application import (
     ApplicationContainer,
@@ -5,18 +11,37 @@ from imbue.contexts.application import (
     application_context,
 )
 from imbue.contexts.base import (
+    CacheOptions,
+    ContainerOptions,
     Context,
     ContextualizedDependency,
     ContextualizedProvider,
+    PoolOptions,
     auto_context,
 )
+from imbue.contexts.cached import (
+    CachedContainer,
+    CacheStats,
+    SyncCachedContainer,
+    cached_context,
+)
 from imbue.contexts.factory import (
     FactoryContainer,
     SyncFactoryContainer,
     factory_context,
 )
+from imbue.contexts.pooled import (
+    PooledContainer,
+    PoolStats,
+    SyncPooledContainer,
+    pooled_context,
+)
+from imbue.contexts.scope import ScopeContainer, SyncScopeContainer, scope_context
 from imbue.contexts.task import SyncTaskContainer, TaskContainer, task_context
 from imbue.contexts.thread import SyncThreadContainer, ThreadContainer, thread_context
 from imbue.dependency import Interfaced
+from imbue.factory import Factory, SyncFactory
+from imbue.hooks import Event, EventKind, Hook, ProviderStats, TimingAggregator
+from imbue.lazy import Lazy, SyncLazy
 from imbue.package import Package
-from imbue.utils import extend, get_annotations, partial
+from imbue.utils import annotations_cache, extend, get_annotations, partial
@@ -3,15 +3,40 @@ from collections.abc import Iterator
 
 from imbue.contexts.base import Context, ContextualizedProvider
 from imbue.dependency import Interface, SubDependency
+from imbue.hooks import Hook
+from imbue.plan import ResolutionPlan
 
 
 class InternalContainer(ABC):
     """Internal abstract to define an interface to a container to other parts of the injection system."""
 
+    @property
+    @abstractmethod
+    def slots(self) -> int:
+        """Number of slots needed to store provided dependencies."""
+
+    @property
+    @abstractmethod
+    def locations(self) -> dict[Interface, tuple[Context, int]]:
+        """Context and slot of each interface whose plan is compiled, to look up provided ones."""
+
+    @property
+    @abstractmethod
+    def hooks(self) -> list[Hook]:
+        """Hooks notified of provisioning events."""
+
     @abstractmethod
     def get_provider(self, interface: Interface) -> ContextualizedProvider:
         """Get a provider for an interface."""
 
+    @abstractmethod
+    def get_plan(self, interface: Interface) -> ResolutionPlan:
+        """Get the resolution plan for an interface."""
+
+    @abstractmethod
+    def get_batch_plan(self, interfaces: tuple[Interface, ...]) -> ResolutionPlan:
+        """Get a resolution plan providing all interfaces at once."""
+
     @abstractmethod
     def get_sub_dependencies(self, interface: Interface) -> Iterator[SubDependency]:
         """Get all dependencies from a provider."""
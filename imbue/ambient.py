@@ -0,0 +1,59 @@
+from collections.abc import Callable
+from typing import Any, TypeVar, overload
+
+from imbue.contexts.task import (
+    SyncTaskContainer,
+    TaskContainer,
+    current_sync_task,
+    current_task,
+)
+from imbue.dependency import Interface
+from imbue.exceptions import DependencyError
+
+V = TypeVar("V")
+
+
+def current_task_container() -> TaskContainer:
+    """Get the task container bound to the current context, in ambient mode."""
+    container = current_task.get()
+    if container is None:
+        raise DependencyError("no task container bound to the current context")
+    return container
+
+
+def current_sync_task_container() -> SyncTaskContainer:
+    """Get the sync task container bound to the current context, in ambient mode."""
+    container = current_sync_task.get()
+    if container is None:
+        raise DependencyError("no task container bound to the current context")
+    return container
+
+
+@overload
+async def get(interface: type[V]) -> V:
+    """Specific type annotation for classes."""
+
+
+@overload
+async def get(interface: Callable) -> Callable:
+    """Specific type annotation for functions."""
+
+
+async def get(interface: Interface) -> Any:
+    """Get a dependency from the task container bound to the current context."""
+    return await current_task_container().get(interface)
+
+
+@overload
+def sync_get(interface: type[V]) -> V:
+    """Specific type annotation for classes."""
+
+
+@overload
+def sync_get(interface: Callable) -> Callable:
+    """Specific type annotation for functions."""
+
+
+def sync_get(interface: Interface) -> Any:
+    """Get a dependency from the sync task container bound to the current context."""
+    return current_sync_task_container().get(interface)
@@ -0,0 +1,5 @@
+from imbue.asgi.middleware import (
+    TASK_CONTAINER_KEY,
+    ImbueMiddleware,
+    get_task_container,
+)
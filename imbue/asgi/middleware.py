@@ -0,0 +1,135 @@
+from collections.abc import Awaitable, Callable, MutableMapping
+from typing import Any
+
+from imbue.container import Container
+from imbue.contexts.application import ApplicationContainer
+from imbue.contexts.task import TaskContainer
+from imbue.exceptions import DependencyError
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# Key of the task container in the connection scope.
+TASK_CONTAINER_KEY = "imbue.task_container"
+
+
+def get_task_container(scope: Scope) -> TaskContainer:
+    """Get the task container of the connection."""
+    if TASK_CONTAINER_KEY not in scope:
+        raise DependencyError("no task container found, is the middleware installed?")
+    return scope[TASK_CONTAINER_KEY]
+
+
+class ImbueMiddleware:
+    """ASGI middleware handling containers, without relying on a framework.
+    The application container is entered and closed with the lifespan events
+    and stored in the lifespan state as `app_container` when supported.
+    Lifespan events are answered by the middleware if the app does not handle them.
+    A task container is entered for each http and websocket connection
+    and stored in the scope, see `get_task_container`.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        container: Container,
+        task_pool_size: int = 0,
+        ambient: bool = False,
+        concurrent_init: bool = False,
+        concurrent_teardown: bool = False,
+        teardown_timeout: float | None = None,
+        cache_size: int | None = None,
+        max_scopes: int | None = None,
+    ):
+        self.app = app
+        self._container = container
+        self._task_pool_size = task_pool_size
+        self._ambient = ambient
+        self._concurrent_init = concurrent_init
+        self._concurrent_teardown = concurrent_teardown
+        self._teardown_timeout = teardown_timeout
+        self._cache_size = cache_size
+        self._max_scopes = max_scopes
+        self._app_container: ApplicationContainer | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(scope, receive, send)
+        elif scope["type"] in ("http", "websocket"):
+            if self._app_container is None:
+                raise DependencyError(
+                    "application container not initialized, is lifespan enabled?"
+                )
+            async with self._app_container.task_context() as task_container:
+                scope[TASK_CONTAINER_KEY] = task_container
+                await self.app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+    async def _lifespan(self, scope: Scope, receive: Receive, send: Send) -> None:
+        received = False
+
+        async def _receive() -> Message:
+            nonlocal received
+            received = True
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self._startup(scope)
+            return message
+
+        async def _send(message: Message) -> None:
+            if message["type"] in (
+                "lifespan.shutdown.complete",
+                "lifespan.shutdown.failed",
+            ):
+                await self._shutdown()
+            await send(message)
+
+        try:
+            await self.app(scope, _receive, _send)
+        except Exception:
+            if received:
+                raise
+        if not received:
+            # The app ignored the lifespan scope, returning or raising right away.
+            await self._answer_lifespan(scope, receive, send)
+
+    async def _answer_lifespan(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self._startup(scope)
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self._shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _startup(self, scope: Scope) -> None:
+        app_container = self._container.application_context(
+            task_pool_size=self._task_pool_size,
+            ambient=self._ambient,
+            concurrent_init=self._concurrent_init,
+            concurrent_teardown=self._concurrent_teardown,
+            teardown_timeout=self._teardown_timeout,
+            cache_size=self._cache_size,
+            max_scopes=self._max_scopes,
+        )
+        await app_container.__aenter__()
+        self._app_container = app_container
+        if "state" in scope:
+            scope["state"]["app_container"] = app_container
+
+    async def _shutdown(self) -> None:
+        if self._app_container is not None:
+            app_container, self._app_container = self._app_container, None
+            await app_container.close()
@@ -1,60 +1,72 @@
+import os
+import threading
 from collections import defaultdict
-from collections.abc import Iterator
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
 from typing import cast
 
 from imbue.abstract import InternalContainer
 from imbue.contexts.application import ApplicationContainer, SyncApplicationContainer
 from imbue.contexts.base import (
+    ContainerOptions,
     Context,
     ContextualizedDependency,
     ContextualizedProvider,
 )
 from imbue.dependency import Dependency, Interface, SubDependency
 from imbue.exceptions import DependencyResolutionError
+from imbue.hooks import Hook
 from imbue.package import Package
+from imbue.plan import ResolutionPlan, ResolutionStep
+from imbue.snapshot import GraphSnapshot, ProviderSnapshot, qualified_name, snapshot_key
 
 
-@dataclass
-class DependencyChain:
-    """Dependency chain, representing the graph of dependencies.
-    Its role is to check whether there are no cycles nor context issues.
-    """
-
-    chain: list[ContextualizedProvider]
+def _format_chain(chain: list[ContextualizedProvider]) -> str:
+    return "\n".join(
+        (f"{' ' * i}-> {p.interface} ({p.context})" for i, p in enumerate(chain)),
+    )
 
-    def add(self, provider: ContextualizedProvider) -> "DependencyChain":
-        """Create a new chain, adding the provider at the end."""
-        chain = DependencyChain([*self.chain, provider])
-        # Check for cycles.
-        if provider in self.chain:
-            raise DependencyResolutionError(f"circular dependency found:\n{chain}")
-        return chain
 
-    def check(self) -> None:
-        if self.last.context is None:
+def _check_context(
+    path: list[ContextualizedProvider],
+    provider: ContextualizedProvider,
+    factory: bool = False,
+) -> None:
+    """Check the context of a provider against its dependent, the last of the path.
+    With `factory`, the dependent is injected a factory handle of the provider.
+    """
+    if provider.context is None:
+        raise DependencyResolutionError(
+            f"provider {provider} does not have a context set"
+        )
+    # Factory handles create instances in the task of their dependent.
+    if factory:
+        if provider.context is not Context.FACTORY:
             raise DependencyResolutionError(
-                f"provider {self.last} does not have a context set"
+                f"context error, factory handles can only provide factory dependencies:\n{_format_chain([*path, provider])}"
             )
-        # If previous context is not set, it will be done automatically so no check is required.
-        if len(self.chain) < 2 or self.chain[-2].context is None:
-            return
-        # The deeper the chain, the lower the context must be.
-        # App dependencies cannot have task dependencies but the inverse is possible.
-        if self.last.context > self.chain[-2].context:
-            raise DependencyResolutionError(f"context error:\n{self}")
-
-    @property
-    def last(self) -> ContextualizedProvider:
-        """Get the last provider in the chain."""
-        return self.chain[-1]
-
-    def __str__(self) -> str:
-        return "\n".join(
-            (
-                f"{' ' * i}-> {p.interface} ({p.context})"
-                for i, p in enumerate(self.chain)
-            ),
+        if path and path[-1].context is not None and path[-1].context < Context.TASK:
+            raise DependencyResolutionError(
+                f"context error, factory handles can only be used by task and factory dependencies:\n{_format_chain([*path, provider])}"
+            )
+        return
+    # If dependent context is not set, it will be done automatically so no check is required.
+    if not path or path[-1].context is None:
+        return
+    # The deeper the chain, the lower the context must be.
+    # App dependencies cannot have task dependencies but the inverse is possible.
+    if provider.context > path[-1].context:
+        raise DependencyResolutionError(
+            f"context error:\n{_format_chain([*path, provider])}"
+        )
+    # Threads are shared by all scopes.
+    if provider.context is Context.SCOPE and path[-1].context is Context.THREAD:
+        raise DependencyResolutionError(
+            f"context error, scope dependencies cannot be used by thread ones:\n{_format_chain([*path, provider])}"
+        )
+    # Pooled and cached dependencies are only borrowed for a task.
+    if provider.context.borrowed and path[-1].context < Context.TASK:
+        raise DependencyResolutionError(
+            f"context error, {provider.context.name.lower()} dependencies can only be used by task and factory ones:\n{_format_chain([*path, provider])}"
         )
 
 
@@ -62,11 +74,31 @@ class Container(InternalContainer):
     def __init__(
         self,
         *dependencies_or_packages: Dependency | ContextualizedDependency | Package,
+        concurrent: bool = False,
+        hooks: Iterable[Hook] = (),
+        snapshot: str | os.PathLike | None = None,
+        lazy: bool = False,
     ):
+        """With `snapshot`, the validated graph is loaded from this file if the providers
+        and their source modules did not change, otherwise it is written there after validation.
+        In `lazy` mode, the graph of an interface is only validated when it is first requested,
+        call `validate` to check the whole graph, which also writes a stale snapshot.
+        """
+        # Resolve independent sub dependencies concurrently for all providers.
+        self._concurrent = concurrent
+        # Notified of provisioning events, kept empty to avoid any overhead.
+        self._hooks: list[Hook] = list(hooks)
         # The link between an interface and its provider.
         self._providers: dict[Interface, ContextualizedProvider] = {}
+        # Slot assigned to each interface, to store provided dependencies.
+        self._slots: dict[Interface, int] = {}
         # Cache sub dependencies for each interface.
         self._sub_dependencies: dict[Interface, list[SubDependency]] = {}
+        # Resolution plans for each interface, compiled on first use.
+        self._plans: dict[Interface, ResolutionPlan] = {}
+        self._batch_plans: dict[tuple[Interface, ...], ResolutionPlan] = {}
+        # Context and slot of the target of each compiled plan, for lookups of provided ones.
+        self._locations: dict[Interface, tuple[Context, int]] = {}
         # All providers that should be eager inited.
         self._by_context_eager_providers: dict[
             Context, list[ContextualizedProvider]
@@ -74,6 +106,16 @@ class Container(InternalContainer):
             list,
         )
 
+        # Sub dependencies are only resolved when needed.
+        self._lazy = lazy
+        # Guard resolution in lazy mode, as it can happen from any thread.
+        self._lock = threading.Lock()
+        self._eager_resolved = not lazy
+        # The whole graph is resolved, no need to lock anymore.
+        self._resolved = not lazy
+        # Path and key of a stale snapshot, in lazy mode.
+        self._stale_snapshot: tuple[str | os.PathLike, str] | None = None
+
         # Add all dependencies.
         for dep_or_pkg in dependencies_or_packages:
             if isinstance(dep_or_pkg, (ContextualizedDependency, Package)):
@@ -86,46 +128,177 @@ class Container(InternalContainer):
                         "multiple providers found for the same type: "
                         f"{self._providers[provider.interface]!r}, {provider!r}",
                     )
-                self._providers[provider.interface] = provider
+                self._register(provider)
         # Resolve the graph.
+        if snapshot is None:
+            if not lazy:
+                self._resolve_all()
+        else:
+            # The key depends on declared contexts, compute it before they are inferred.
+            key = snapshot_key(self._providers.values())
+            if not self._load_snapshot(snapshot, key):
+                if lazy:
+                    # Stay lazy, the snapshot is written once `validate` checked the whole graph.
+                    self._stale_snapshot = (snapshot, key)
+                else:
+                    self._resolve_all()
+                    self._dump_snapshot(snapshot, key)
+
+    def _register(self, provider: ContextualizedProvider) -> None:
+        self._providers[provider.interface] = provider
+        self._slots[provider.interface] = len(self._slots)
+
+    def _resolve_all(self) -> None:
         for provider in self._providers.values():
-            self._resolve(DependencyChain([provider]))
-
-    def _resolve(self, chain: DependencyChain) -> None:
-        """Construct the graph of sub dependencies."""
-        provider = chain.last
-        if provider.interface in self._sub_dependencies:
-            # Already handled, we just need to check the full chain.
-            chain.check()
+            self._resolve(provider)
+
+    def _resolve(self, root: ContextualizedProvider) -> None:
+        """Construct the graph of sub dependencies.
+        The graph is walked depth first, iteratively so that deep graphs are supported.
+        Providers being resolved are kept in the path, to detect cycles.
+        """
+        if root.interface in self._sub_dependencies:
+            _check_context([], root)
             return
-        dependencies: list[SubDependency] = []
-        sub_providers: list[ContextualizedProvider] = []
-        for sub_dependency in provider.sub_dependencies:
-            if (
-                not sub_dependency.mandatory
-                and sub_dependency.interface not in self._providers
-            ):
+        path: list[ContextualizedProvider] = []
+        resolving: set[Interface] = set()
+        # For each provider of the path: its remaining sub dependencies,
+        # the resolved ones and their providers.
+        frames: list[
+            tuple[
+                Iterator[SubDependency],
+                list[SubDependency],
+                list[ContextualizedProvider],
+            ]
+        ] = []
+
+        def _push(provider: ContextualizedProvider) -> None:
+            path.append(provider)
+            resolving.add(provider.interface)
+            frames.append((iter(list(provider.sub_dependencies)), [], []))
+
+        _push(root)
+        while frames:
+            provider = path[-1]
+            pending, dependencies, sub_providers = frames[-1]
+            sub_dependency = next(pending, None)
+            if sub_dependency is not None:
+                if sub_dependency.interface not in self._providers:
+                    if not sub_dependency.mandatory:
+                        continue
+                    raise DependencyResolutionError(
+                        f"no provider found for {sub_dependency.interface}, from provider {provider!r}",
+                    )
+                sub_provider = self._providers[sub_dependency.interface]
+                if sub_provider.interface in resolving:
+                    raise DependencyResolutionError(
+                        f"circular dependency found:\n{_format_chain([*path, sub_provider])}"
+                    )
+                sub_providers.append(sub_provider)
+                dependencies.append(sub_dependency)
+                if sub_provider.interface in self._sub_dependencies:
+                    # Already handled, we just need to check the context.
+                    _check_context(path, sub_provider, sub_dependency.factory)
+                else:
+                    _push(sub_provider)
                 continue
-            if sub_dependency.interface not in self._providers:
+            # All sub dependencies are resolved.
+            path.pop()
+            resolving.discard(provider.interface)
+            frames.pop()
+            # Set the context automatically based on dependencies if not set.
+            # We want to set the lowest context possible.
+            if provider.context is None:
+                # Factory handles are bound to a task.
+                contexts = [
+                    Context.TASK if d.factory else cast(Context, s.context)
+                    for d, s in zip(dependencies, sub_providers, strict=True)
+                ]
+                provider.context = max(contexts, default=Context.APPLICATION)
+                if any(c.borrowed for c in contexts) or (
+                    provider.context is Context.THREAD and Context.SCOPE in contexts
+                ):
+                    provider.context = max(provider.context, Context.TASK)
+            # Handles are bound to the task borrowing the dependency, it would outlive them.
+            if provider.context.borrowed and any(d.lazy for d in dependencies):
                 raise DependencyResolutionError(
-                    f"no provider found for {sub_dependency.interface}, from provider {provider!r}",
+                    f"context error, {provider.context.name.lower()} dependencies cannot have lazy ones:\n{_format_chain([*path, provider])}"
                 )
-            sub_provider = self._providers[sub_dependency.interface]
-            sub_providers.append(sub_provider)
-            self._resolve(chain.add(sub_provider))
-            dependencies.append(sub_dependency)
-        # Set the context automatically based on dependencies if not set.
-        # We want to set the lowest context possible.
-        if provider.context is None:
-            provider.context = (
-                max(cast(Context, s.context) for s in sub_providers)
-                if sub_providers
-                else Context.APPLICATION
-            )
-        chain.check()
-        self._sub_dependencies[provider.interface] = dependencies
-        if provider.eager:
-            self._by_context_eager_providers[provider.context].append(provider)
+            # Scopes are created on first use, from synchronous code, they have nothing to init.
+            if provider.eager and provider.context is Context.SCOPE:
+                raise DependencyResolutionError(
+                    f"context error, scope dependencies cannot be eager:\n{_format_chain([*path, provider])}"
+                )
+            # The dependent is the last of the path, with the sub dependency leading here.
+            _check_context(path, provider, bool(frames) and frames[-1][1][-1].factory)
+            self._sub_dependencies[provider.interface] = dependencies
+            if provider.eager:
+                self._by_context_eager_providers[provider.context].append(provider)
+
+    def validate(self) -> None:
+        """Check the whole graph, only needed in lazy mode.
+        A stale snapshot is written again once checked.
+        """
+        with self._lock:
+            self._resolve_all()
+        self._eager_resolved = True
+        self._resolved = True
+        if self._stale_snapshot is not None:
+            self._dump_snapshot(*self._stale_snapshot)
+            self._stale_snapshot = None
+
+    def _ensure_resolved(self, interfaces: Iterable[Interface]) -> None:
+        """In lazy mode, resolve the graphs of interfaces if not done already.
+        Only lock if some are not resolved, they are only added once their graph is.
+        """
+        if self._resolved:
+            return
+        pending = [i for i in interfaces if i not in self._sub_dependencies]
+        if not pending:
+            return
+        with self._lock:
+            for interface in pending:
+                if interface not in self._providers:
+                    raise DependencyResolutionError(f"unknow interface {interface}")
+                if interface not in self._sub_dependencies:
+                    self._resolve(self._providers[interface])
+            self._resolved = len(self._sub_dependencies) == len(self._providers)
+
+    def _load_snapshot(self, path: str | os.PathLike, key: str) -> bool:
+        """Use the graph of a snapshot instead of resolving it, if not stale."""
+        interfaces = {qualified_name(i): i for i in self._providers}
+        if len(interfaces) != len(self._providers):
+            # Names are ambiguous.
+            return False
+        graph = GraphSnapshot.load(path, key, interfaces)
+        if graph is None or {p.interface for p in graph.providers} != set(
+            self._providers
+        ):
+            return False
+        for snapshot in graph.providers:
+            provider = self._providers[snapshot.interface]
+            provider.context = snapshot.context
+            self._sub_dependencies[snapshot.interface] = snapshot.sub_dependencies
+            if snapshot.eager:
+                self._by_context_eager_providers[snapshot.context].append(provider)
+        return True
+
+    def _dump_snapshot(self, path: str | os.PathLike, key: str) -> None:
+        """Write the resolved graph, in resolution order."""
+        if len({qualified_name(i) for i in self._providers}) != len(self._providers):
+            return
+        GraphSnapshot(
+            key=key,
+            providers=[
+                ProviderSnapshot(
+                    interface=interface,
+                    context=cast(Context, self._providers[interface].context),
+                    eager=self._providers[interface].eager,
+                    sub_dependencies=sub_dependencies,
+                )
+                for interface, sub_dependencies in self._sub_dependencies.items()
+            ],
+        ).dump(path)
 
     def add(self, dependency: Dependency, context: Context = Context.TASK) -> None:
         """Add another interface, used to eagerly add all task functions/methods as providers.
@@ -137,27 +310,218 @@ class Container(InternalContainer):
         ):
             if provider.interface in self._providers:
                 continue
-            self._providers[provider.interface] = provider
-            self._resolve(DependencyChain([provider]))
+            self._register(provider)
+            self._resolve(provider)
+
+    def _compile(self, *interfaces: Interface) -> ResolutionPlan:
+        """Flatten the graph of sub dependencies of interfaces into a resolution plan.
+        Lazy sub dependencies and factory handles are not part of the plan,
+        they have their own when first used.
+        """
+        steps: list[ResolutionStep] = []
+        indexes: dict[Interface, int] = {}
+
+        def _add(root: ContextualizedProvider) -> int:
+            """Add the steps of the provider after the ones of its sub dependencies."""
+            if root.interface in indexes:
+                return indexes[root.interface]
+            # For each provider being added: the argument name for its dependent,
+            # its remaining sub dependencies, its arguments, its lazy arguments
+            # and its factory handles.
+            stack: list[
+                tuple[
+                    ContextualizedProvider,
+                    str,
+                    Iterator[SubDependency],
+                    list[tuple[str, int]],
+                    list[tuple[str, Interface]],
+                    list[tuple[str, Interface]],
+                ]
+            ] = [(root, "", iter(self._sub_dependencies[root.interface]), [], [], [])]
+            while True:
+                provider, name, pending, arguments, lazy, factories = stack[-1]
+                sub_dependency = next(pending, None)
+                if sub_dependency is not None:
+                    if sub_dependency.lazy:
+                        lazy.append((sub_dependency.name, sub_dependency.interface))
+                    elif sub_dependency.factory:
+                        factories.append(
+                            (sub_dependency.name, sub_dependency.interface)
+                        )
+                    elif sub_dependency.interface in indexes:
+                        arguments.append(
+                            (sub_dependency.name, indexes[sub_dependency.interface])
+                        )
+                    else:
+                        stack.append(
+                            (
+                                self._providers[sub_dependency.interface],
+                                sub_dependency.name,
+                                iter(self._sub_dependencies[sub_dependency.interface]),
+                                [],
+                                [],
+                                [],
+                            )
+                        )
+                    continue
+                stack.pop()
+                steps.append(
+                    ResolutionStep(
+                        provider=provider,
+                        context=cast(Context, provider.context),
+                        arguments=tuple(arguments),
+                        slot=self._slots[provider.interface],
+                        lazy=tuple(lazy),
+                        factories=tuple(factories),
+                    )
+                )
+                index = len(steps) - 1
+                # Factory dependencies are never reused, each dependent gets its own step.
+                if provider.context is not Context.FACTORY:
+                    indexes[provider.interface] = index
+                if not stack:
+                    return index
+                stack[-1][3].append((name, index))
+
+        providers = [self._providers[interface] for interface in interfaces]
+        targets = tuple(_add(provider) for provider in providers)
+        # Group steps by depth so that each group only depends on previous ones.
+        depths: list[int] = []
+        levels: list[list[int]] = []
+        for i, step in enumerate(steps):
+            depth = max((depths[j] + 1 for _, j in step.arguments), default=0)
+            depths.append(depth)
+            if depth == len(levels):
+                levels.append([])
+            levels[depth].append(i)
+        return ResolutionPlan(
+            steps=tuple(steps),
+            targets=targets,
+            levels=tuple(tuple(level) for level in levels),
+            # Concurrent providers also resolve their sub dependencies concurrently when nested.
+            concurrent=self._concurrent or any(s.provider.concurrent for s in steps),
+        )
+
+    @property
+    def slots(self) -> int:
+        """Number of slots needed to store provided dependencies."""
+        return len(self._slots)
+
+    @property
+    def locations(self) -> dict[Interface, tuple[Context, int]]:
+        """Context and slot of each interface whose plan is compiled, to look up provided ones."""
+        return self._locations
+
+    @property
+    def hooks(self) -> list[Hook]:
+        """Hooks notified of provisioning events."""
+        return self._hooks
+
+    def add_hook(self, hook: Hook) -> None:
+        """Add a hook, notified of provisioning events in all contextualized containers."""
+        self._hooks.append(hook)
 
     def get_provider(self, interface: Interface) -> ContextualizedProvider:
         """Get the provider for an interface."""
         if interface not in self._providers:
             raise DependencyResolutionError(f"unknow interface {interface}")
+        self._ensure_resolved((interface,))
         return self._providers[interface]
 
+    def get_plan(self, interface: Interface) -> ResolutionPlan:
+        """Get the resolution plan for an interface, compiled on first use.
+        Plans of deep graphs share most of their steps,
+        compiling all of them upfront would make building the container quadratic.
+        """
+        plan = self._plans.get(interface)
+        if plan is None:
+            if interface not in self._providers:
+                raise DependencyResolutionError(f"unknow interface {interface}")
+            self._ensure_resolved((interface,))
+            plan = self._plans[interface] = self._compile(interface)
+            self._locations[interface] = (plan.target.context, plan.target.slot)
+        return plan
+
+    def get_batch_plan(self, interfaces: tuple[Interface, ...]) -> ResolutionPlan:
+        """Get a resolution plan providing all interfaces at once, compiled on first use."""
+        if interfaces not in self._batch_plans:
+            for interface in interfaces:
+                if interface not in self._providers:
+                    raise DependencyResolutionError(f"unknow interface {interface}")
+            self._ensure_resolved(interfaces)
+            self._batch_plans[interfaces] = self._compile(*interfaces)
+        return self._batch_plans[interfaces]
+
     def get_sub_dependencies(self, interface: Interface) -> Iterator[SubDependency]:
         """Get all sub dependencies for an interface."""
+        self._ensure_resolved((interface,))
         yield from self._sub_dependencies[interface]
 
     def get_eager_providers(self, context: Context) -> Iterator[ContextualizedProvider]:
         """Get all providers that should be eager inited for a context."""
+        if not self._eager_resolved:
+            # Their context is only known once resolved.
+            self._ensure_resolved(
+                p.interface for p in self._providers.values() if p.eager
+            )
+            self._eager_resolved = True
         return iter(self._by_context_eager_providers[context])
 
-    def application_context(self) -> ApplicationContainer:
-        """Spawns the first contextualized container on the application level."""
-        return ApplicationContainer(self, {})
+    def application_context(
+        self,
+        task_pool_size: int = 0,
+        ambient: bool = False,
+        concurrent_init: bool = False,
+        concurrent_teardown: bool = False,
+        teardown_timeout: float | None = None,
+        cache_size: int | None = None,
+        max_scopes: int | None = None,
+    ) -> ApplicationContainer:
+        """Spawns the first contextualized container on the application level.
+        Task containers are recycled if `task_pool_size` is set.
+        In `ambient` mode, entered task containers are bound to the current context.
+        With `concurrent_init`, independent eager dependencies are inited concurrently,
+        see `init_timings` for the time taken by each of them.
+        With `concurrent_teardown`, resources are cleaned up concurrently,
+        dependents before their dependencies, each within `teardown_timeout`,
+        see `teardown_report` for the time taken by each of them.
+        Up to `cache_size` cached dependencies are kept, the least recently used are evicted first.
+        Likewise, up to `max_scopes` scopes are kept.
+        """
+        return ApplicationContainer(
+            self,
+            {},
+            ContainerOptions(
+                task_pool_size=task_pool_size,
+                ambient=ambient,
+                concurrent_init=concurrent_init,
+                concurrent_teardown=concurrent_teardown,
+                teardown_timeout=teardown_timeout,
+                cache_size=cache_size,
+                max_scopes=max_scopes,
+            ),
+        )
 
-    def sync_application_context(self) -> SyncApplicationContainer:
-        """Spawns the first contextualized container on the application level."""
-        return SyncApplicationContainer(self, {})
+    def sync_application_context(
+        self,
+        task_pool_size: int = 0,
+        ambient: bool = False,
+        cache_size: int | None = None,
+        max_scopes: int | None = None,
+    ) -> SyncApplicationContainer:
+        """Spawns the first contextualized container on the application level.
+        Task containers are recycled if `task_pool_size` is set.
+        In `ambient` mode, entered task containers are bound to the current context.
+        Up to `cache_size` cached dependencies are kept, the least recently used are evicted first.
+        Likewise, up to `max_scopes` scopes are kept.
+        """
+        return SyncApplicationContainer(
+            self,
+            {},
+            ContainerOptions(
+                task_pool_size=task_pool_size,
+                ambient=ambient,
+                cache_size=cache_size,
+                max_scopes=max_scopes,
+            ),
+        )
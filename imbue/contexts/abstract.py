@@ -1,24 +1,68 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from contextlib import (
     AbstractAsyncContextManager,
     AbstractContextManager,
     AsyncExitStack,
     ExitStack,
 )
-from typing import Any, ClassVar, TypeVar, cast, overload
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast, overload
 
 from imbue.abstract import InternalContainer
 from imbue.contexts.base import Context, ContextualizedProvider
-from imbue.dependency import Interface
+from imbue.contexts.teardown import GraphTeardown, TeardownReport
+from imbue.dependency import MISSING, Interface
 from imbue.exceptions import DependencyError
-from imbue.providers.instance import DelegatedInstanceProvider
+from imbue.factory import Factory, SyncFactory
+from imbue.hooks import (
+    Event,
+    EventKind,
+    ObservedAsyncContextManager,
+    ObservedContextManager,
+    emit,
+    emit_quietly,
+)
+from imbue.lazy import Lazy, SyncLazy
+from imbue.plan import ResolutionPlan, ResolutionStep
+
+if TYPE_CHECKING:
+    from imbue.contexts.factory import FactoryContainer, SyncFactoryContainer
 
 V = TypeVar("V")
 
 
+async def _timed(
+    provided: Awaitable[Any],
+    interface: Interface,
+    timings: dict[Interface, float],
+) -> Any:
+    start = time.perf_counter()
+    try:
+        return await provided
+    finally:
+        timings[interface] = time.perf_counter() - start
+
+
+def _end_event(
+    provider: ContextualizedProvider,
+    context: Context,
+    start: float,
+    error: BaseException | None = None,
+) -> Event:
+    return Event(
+        EventKind.PROVIDE_END,
+        provider.interface,
+        context,
+        time.perf_counter() - start,
+        error,
+    )
+
+
 class ContextualizedContainer(AsyncExitStack, ABC):
     """Wraps the container to support context handling.
     This will be responsible for storing already provided dependencies for a particular context.
@@ -35,7 +79,15 @@ class ContextualizedContainer(AsyncExitStack, ABC):
         self._container = container
         self._contextualized = dict(contextualized)
         self._contextualized[self.CONTEXT] = self
-        self._provided: dict[Interface, Any] = {}
+        # Provided dependencies, indexed by their slot.
+        self._provided: list[Any] = [MISSING] * container.slots
+        # Shared with the container so that hooks added later are used.
+        self._hooks = container.hooks
+        # Shared with the container so that plans compiled later are found.
+        self._locations = container.locations
+        # Time taken to provide each eager dependency, in seconds, with concurrent init.
+        self.init_timings: dict[Interface, float] = {}
+        self._teardown: GraphTeardown | None = None
 
     @overload
     async def get(self, interface: type[V]) -> V:
@@ -46,51 +98,295 @@ class ContextualizedContainer(AsyncExitStack, ABC):
         """Specific type annotation for functions."""
 
     async def get(self, interface: Interface) -> Any:
-        """Find the proper container based on context and provide."""
-        provider = self._container.get_provider(interface)
-        return await self._contextualized[
-            cast(Context, provider.context)
-        ]._get_or_provide(provider)
+        """Run the resolution plan of the interface."""
+        # Fast path, without the plan nor locking, when already provided.
+        location = self._locations.get(interface)
+        if location is not None:
+            context, slot = location
+            try:
+                provided = self._contextualized[context]._provided[slot]
+            except (KeyError, IndexError):
+                # Not reachable or stored yet, the plan raises or provides it.
+                provided = MISSING
+            if provided is not MISSING:
+                if self._hooks:
+                    emit(self._hooks, Event(EventKind.CACHE_HIT, interface, context))
+                return provided
+        plan = self._container.get_plan(interface)
+        return (await self._run(plan))[-1]
+
+    async def get_many(self, *interfaces: Interface) -> list[Any]:
+        """Provide multiple interfaces at once, running a single resolution plan."""
+        plan = self._container.get_batch_plan(interfaces)
+        values = await self._run(plan)
+        return [values[i] for i in plan.targets]
+
+    async def _run(
+        self,
+        plan: ResolutionPlan,
+        timings: dict[Interface, float] | None = None,
+    ) -> list[Any]:
+        """Provide all steps of the plan that are not already provided, in order."""
+        values, needed = self._prepare(plan)
+        if plan.concurrent:
+            indexes = set(needed)
+            for level in plan.levels:
+                await self._run_concurrently(
+                    plan, [i for i in level if i in indexes], values, timings
+                )
+            return values
+        for i in needed:
+            step = plan.steps[i]
+            values[i] = await self._contextualized[step.context]._get_or_provide(
+                step, values
+            )
+        return values
+
+    async def _run_concurrently(
+        self,
+        plan: ResolutionPlan,
+        indexes: list[int],
+        values: list[Any],
+        timings: dict[Interface, float] | None = None,
+    ) -> None:
+        """Provide independent steps concurrently.
+        Each step enters its context managers in its own stack,
+        those are then pushed to their container in the plan order to keep teardown deterministic.
+        """
+        if len(indexes) < 2:
+            for i in indexes:
+                values[i] = await self._run_step(plan.steps[i], values, None, timings)
+            return
+        stacks = [AsyncExitStack() for _ in indexes]
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._run_step(plan.steps[i], values, stack, timings)
+                    for i, stack in zip(indexes, stacks, strict=True)
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            # Also kept if cancelled, so that resources already entered are cleaned up.
+            for i, stack in zip(indexes, stacks, strict=True):
+                self._contextualized[plan.steps[i].context]._keep(plan.steps[i], stack)
+        error: BaseException | None = None
+        for i, result in zip(indexes, results, strict=True):
+            if isinstance(result, BaseException):
+                error = error or result
+            else:
+                values[i] = result
+        if error is not None:
+            raise error
+
+    def _run_step(
+        self,
+        step: ResolutionStep,
+        values: list[Any],
+        stack: AsyncExitStack | None,
+        timings: dict[Interface, float] | None,
+    ) -> Awaitable[Any]:
+        """Provide a step from its container, timing it if needed."""
+        provided = self._contextualized[step.context]._get_or_provide(
+            step, values, stack
+        )
+        if timings is None:
+            return provided
+        return _timed(provided, step.interface, timings)
+
+    def _prepare(self, plan: ResolutionPlan) -> tuple[list[Any], list[int]]:
+        """Find the indexes of the steps that need to be provided, in plan order.
+        Only the targets and the arguments of steps not provided yet are visited,
+        sub dependencies of an already provided dependency are not needed.
+        """
+        steps = plan.steps
+        values: list[Any] = [None] * len(steps)
+        needed: list[int] = []
+        pending = list(plan.targets)
+        visited = set(pending)
+        while pending:
+            i = pending.pop()
+            step = steps[i]
+            provided = self._contextualized_for(step)._get_provided(step.slot)
+            if provided is not MISSING:
+                if self._hooks:
+                    emit(
+                        self._hooks,
+                        Event(EventKind.CACHE_HIT, step.interface, step.context),
+                    )
+                values[i] = provided
+                continue
+            needed.append(i)
+            for _, j in step.arguments:
+                if j not in visited:
+                    visited.add(j)
+                    pending.append(j)
+        needed.sort()
+        return values, needed
+
+    def _contextualized_for(self, step: ResolutionStep) -> ContextualizedContainer:
+        """Get the container of the context of a step, raise if not reachable from this one.
+        Other lookups of the steps of a plan are done after `_prepare`, which checked them.
+        """
+        try:
+            return self._contextualized[step.context]
+        except KeyError:
+            raise DependencyError(
+                f"{step.interface} needs a {step.context.name.lower()} container, "
+                f"not reachable from this {self.CONTEXT.name.lower()} one"
+            ) from None
+
+    def _get_provided(self, slot: int) -> Any:
+        """Get an already provided dependency, or `MISSING`."""
+        provided = self._provided
+        return provided[slot] if slot < len(provided) else MISSING
+
+    def _store(self, slot: int, provided: Any) -> None:
+        """Store a provided dependency, the container may have grown since creation."""
+        if slot >= len(self._provided):
+            self._provided.extend([MISSING] * (slot + 1 - len(self._provided)))
+        self._provided[slot] = provided
 
-    async def _get_or_provide(self, provider: ContextualizedProvider) -> Any:
+    def _arguments(self, step: ResolutionStep, values: list[Any]) -> dict[str, Any]:
+        """Arguments of a step, lazy ones are provided from this container on first use,
+        factory handles create instances in the factory container of the task.
+        """
+        arguments = {name: values[i] for name, i in step.arguments}
+        for name, interface in step.lazy:
+            arguments[name] = Lazy(self, interface)
+        for name, interface in step.factories:
+            factory = cast("FactoryContainer", self._contextualized[Context.FACTORY])
+            arguments[name] = Factory(factory, interface)
+        return arguments
+
+    async def _get_or_provide(
+        self,
+        step: ResolutionStep,
+        values: list[Any],
+        stack: AsyncExitStack | None = None,
+    ) -> Any:
         """Get from already provided or provide the dependency."""
-        if provided := self._provided.get(provider.interface):
+        provided = self._get_provided(step.slot)
+        if provided is not MISSING:
             return provided
-        provided = await self._provide(provider)
-        self._provided[provider.interface] = provided
+        if stack is None and self._teardown is not None:
+            stack = AsyncExitStack()
+            self._teardown.add(step, stack)
+        provided = await self._provide(
+            step.provider, self._arguments(step, values), stack
+        )
+        self._store(step.slot, provided)
         return provided
 
-    async def _provide(self, provider: ContextualizedProvider) -> Any:
-        """Actually provide the dependency."""
-        result = provider.get(
-            **{
-                s.name: await self.get(s.interface)
-                for s in self._container.get_sub_dependencies(provider.interface)
-            },
-        )
-        if result.awaitable:
-            provided = await result.provided
+    def _keep(self, step: ResolutionStep, stack: AsyncExitStack) -> None:
+        """Keep resources entered while providing a step, to clean them up with the container."""
+        if self._teardown is None:
+            self.push_async_exit(stack)
         else:
-            provided = result.provided
-        if (
-            isinstance(provider.provider, DelegatedInstanceProvider)
-            and provider.provider.is_context_manager
-        ):
+            self._teardown.add(step, stack)
+
+    def _use_graph_teardown(self, timeout: float | None) -> None:
+        """Clean up resources concurrently following the graph, rather than in reverse order.
+        Resources are cleaned up after anything else entered in the container.
+        """
+        self._teardown = GraphTeardown(self._container, timeout)
+        self.push_async_callback(self._teardown.close)
+
+    @property
+    def teardown_report(self) -> TeardownReport | None:
+        """Report of the last concurrent teardown, if enabled."""
+        return None if self._teardown is None else self._teardown.report
+
+    async def _provide(
+        self,
+        provider: ContextualizedProvider,
+        dependencies: dict[str, Any],
+        stack: AsyncExitStack | None = None,
+    ) -> Any:
+        """Provide the dependency, notifying hooks if any."""
+        hooks = self._hooks
+        if not hooks:
+            return await self._create(provider, dependencies, stack)
+        emit(hooks, Event(EventKind.PROVIDE_START, provider.interface, self.CONTEXT))
+        start = time.perf_counter()
+        try:
+            provided = await self._create(provider, dependencies, stack)
+        except BaseException as e:
+            emit_quietly(hooks, _end_event(provider, self.CONTEXT, start, e))
+            raise
+        emit(hooks, _end_event(provider, self.CONTEXT, start))
+        return provided
+
+    async def _create(
+        self,
+        provider: ContextualizedProvider,
+        dependencies: dict[str, Any],
+        stack: AsyncExitStack | None = None,
+    ) -> Any:
+        """Actually provide the dependency.
+        Context managers are entered in the given stack, or the container itself.
+        """
+        inner = provider.provider
+        provided = inner.provide(**dependencies)
+        if inner.awaitable:
+            provided = await provided  # ty: ignore[invalid-await]
+        if inner.is_context_manager:
+            if stack is None:
+                stack = self
             if isinstance(provided, AbstractAsyncContextManager):
-                return await self.enter_async_context(provided)
+                if self._hooks:
+                    provided = ObservedAsyncContextManager(
+                        provided, self._hooks, provider.interface, self.CONTEXT
+                    )
+                return await stack.enter_async_context(provided)
             if isinstance(provided, AbstractContextManager):
-                return self.enter_context(provided)
+                if self._hooks:
+                    provided = ObservedContextManager(
+                        provided, self._hooks, provider.interface, self.CONTEXT
+                    )
+                return stack.enter_context(provided)
         return provided
 
     async def init(self) -> None:
         """Init eager dependencies."""
         for provider in self._container.get_eager_providers(self.CONTEXT):
-            await self._get_or_provide(provider)
+            await self._run(self._container.get_plan(provider.interface))
+
+    async def _init_concurrently(self) -> None:
+        """Init independent eager dependencies concurrently, following the levels of the graph.
+        The time taken by each provider is kept in `init_timings`.
+        """
+        interfaces = tuple(
+            p.interface for p in self._container.get_eager_providers(self.CONTEXT)
+        )
+        if interfaces:
+            plan = self._container.get_batch_plan(interfaces)
+            await self._run(replace(plan, concurrent=True), self.init_timings)
 
     async def __aenter__(self):
         await self.init()
         return self
 
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if not self._hooks:
+            return await super().__aexit__(exc_type, exc_val, exc_tb)
+        start = time.perf_counter()
+        try:
+            suppress = await super().__aexit__(exc_type, exc_val, exc_tb)
+        except BaseException:
+            emit_quietly(self._hooks, self._teardown_event(start))
+            raise
+        # Errors of hooks must not replace the one being raised.
+        (emit_quietly if exc_val and not suppress else emit)(
+            self._hooks, self._teardown_event(start)
+        )
+        return suppress
+
+    def _teardown_event(self, start: float) -> Event:
+        return Event(
+            EventKind.TEARDOWN, None, self.CONTEXT, time.perf_counter() - start
+        )
+
     async def close(self) -> None:
         # No exception here.
         await self.__aexit__(None, None, None)
@@ -110,7 +406,12 @@ class SyncContextualizedContainer(ExitStack, ABC):
         self._container = container
         self._contextualized = dict(contextualized)
         self._contextualized[self.CONTEXT] = self
-        self._provided: dict[Interface, Any] = {}
+        # Provided dependencies, indexed by their slot.
+        self._provided: list[Any] = [MISSING] * container.slots
+        # Shared with the container so that hooks added later are used.
+        self._hooks = container.hooks
+        # Shared with the container so that plans compiled later are found.
+        self._locations = container.locations
 
     @overload
     def get(self, interface: type[V]) -> V:
@@ -121,54 +422,190 @@ class SyncContextualizedContainer(ExitStack, ABC):
         """Specific type annotation for functions."""
 
     def get(self, interface: Interface) -> Any:
-        """Find the proper container based on context and provide."""
-        provider = self._container.get_provider(interface)
-        return self._contextualized[cast(Context, provider.context)]._get_or_provide(
-            provider
-        )
+        """Run the resolution plan of the interface."""
+        # Fast path, without the plan nor locking, when already provided.
+        location = self._locations.get(interface)
+        if location is not None:
+            context, slot = location
+            try:
+                provided = self._contextualized[context]._provided[slot]
+            except (KeyError, IndexError):
+                # Not reachable or stored yet, the plan raises or provides it.
+                provided = MISSING
+            if provided is not MISSING:
+                if self._hooks:
+                    emit(self._hooks, Event(EventKind.CACHE_HIT, interface, context))
+                return provided
+        plan = self._container.get_plan(interface)
+        return self._run(plan)[-1]
+
+    def get_many(self, *interfaces: Interface) -> list[Any]:
+        """Provide multiple interfaces at once, running a single resolution plan."""
+        plan = self._container.get_batch_plan(interfaces)
+        values = self._run(plan)
+        return [values[i] for i in plan.targets]
 
-    def _get_or_provide(self, provider: ContextualizedProvider) -> Any:
+    def _run(self, plan: ResolutionPlan) -> list[Any]:
+        """Provide all steps of the plan that are not already provided, in order."""
+        values, needed = self._prepare(plan)
+        for i in needed:
+            step = plan.steps[i]
+            values[i] = self._contextualized[step.context]._get_or_provide(step, values)
+        return values
+
+    def _prepare(self, plan: ResolutionPlan) -> tuple[list[Any], list[int]]:
+        """Find the indexes of the steps that need to be provided, in plan order.
+        Only the targets and the arguments of steps not provided yet are visited,
+        sub dependencies of an already provided dependency are not needed.
+        """
+        steps = plan.steps
+        values: list[Any] = [None] * len(steps)
+        needed: list[int] = []
+        pending = list(plan.targets)
+        visited = set(pending)
+        while pending:
+            i = pending.pop()
+            step = steps[i]
+            provided = self._contextualized_for(step)._get_provided(step.slot)
+            if provided is not MISSING:
+                if self._hooks:
+                    emit(
+                        self._hooks,
+                        Event(EventKind.CACHE_HIT, step.interface, step.context),
+                    )
+                values[i] = provided
+                continue
+            needed.append(i)
+            for _, j in step.arguments:
+                if j not in visited:
+                    visited.add(j)
+                    pending.append(j)
+        needed.sort()
+        return values, needed
+
+    def _contextualized_for(self, step: ResolutionStep) -> SyncContextualizedContainer:
+        """Get the container of the context of a step, raise if not reachable from this one.
+        Other lookups of the steps of a plan are done after `_prepare`, which checked them.
+        """
+        try:
+            return self._contextualized[step.context]
+        except KeyError:
+            raise DependencyError(
+                f"{step.interface} needs a {step.context.name.lower()} container, "
+                f"not reachable from this {self.CONTEXT.name.lower()} one"
+            ) from None
+
+    def _get_provided(self, slot: int) -> Any:
+        """Get an already provided dependency, or `MISSING`."""
+        provided = self._provided
+        return provided[slot] if slot < len(provided) else MISSING
+
+    def _store(self, slot: int, provided: Any) -> None:
+        """Store a provided dependency, the container may have grown since creation."""
+        if slot >= len(self._provided):
+            self._provided.extend([MISSING] * (slot + 1 - len(self._provided)))
+        self._provided[slot] = provided
+
+    def _arguments(self, step: ResolutionStep, values: list[Any]) -> dict[str, Any]:
+        """Arguments of a step, lazy ones are provided from this container on first use,
+        factory handles create instances in the factory container of the task.
+        """
+        arguments = {name: values[i] for name, i in step.arguments}
+        for name, interface in step.lazy:
+            arguments[name] = SyncLazy(self, interface)
+        for name, interface in step.factories:
+            factory = cast(
+                "SyncFactoryContainer", self._contextualized[Context.FACTORY]
+            )
+            arguments[name] = SyncFactory(factory, interface)
+        return arguments
+
+    def _get_or_provide(self, step: ResolutionStep, values: list[Any]) -> Any:
         """Get from already provided or provide the dependency."""
-        if provided := self._provided.get(provider.interface):
+        provided = self._get_provided(step.slot)
+        if provided is not MISSING:
             return provided
-        provided = self._provide(provider)
-        self._provided[provider.interface] = provided
+        provided = self._provide(step.provider, self._arguments(step, values))
+        self._store(step.slot, provided)
         return provided
 
-    def _provide(self, provider: ContextualizedProvider) -> Any:
-        """Actually provide the dependency."""
-        result = provider.get(
-            **{
-                s.name: self.get(s.interface)
-                for s in self._container.get_sub_dependencies(provider.interface)
-            },
-        )
-        if result.awaitable:
+    def _provide(
+        self,
+        provider: ContextualizedProvider,
+        dependencies: dict[str, Any],
+        stack: ExitStack | None = None,
+    ) -> Any:
+        """Provide the dependency, notifying hooks if any."""
+        hooks = self._hooks
+        if not hooks:
+            return self._create(provider, dependencies, stack)
+        emit(hooks, Event(EventKind.PROVIDE_START, provider.interface, self.CONTEXT))
+        start = time.perf_counter()
+        try:
+            provided = self._create(provider, dependencies, stack)
+        except BaseException as e:
+            emit_quietly(hooks, _end_event(provider, self.CONTEXT, start, e))
+            raise
+        emit(hooks, _end_event(provider, self.CONTEXT, start))
+        return provided
+
+    def _create(
+        self,
+        provider: ContextualizedProvider,
+        dependencies: dict[str, Any],
+        stack: ExitStack | None = None,
+    ) -> Any:
+        """Actually provide the dependency.
+        Context managers are entered in the given stack, or the container itself.
+        """
+        inner = provider.provider
+        if inner.awaitable:
             raise DependencyError(
-                f"async dependency requested in sync context: {provider.provider!r}"
+                f"async dependency requested in sync context: {inner!r}"
             )
-        provided = result.provided
-        if (
-            isinstance(provider.provider, DelegatedInstanceProvider)
-            and provider.provider.is_context_manager
-        ):
+        provided = inner.provide(**dependencies)
+        if inner.is_context_manager:
             if isinstance(provided, AbstractAsyncContextManager):
                 raise DependencyError(
-                    f"async dependency requested in sync context: {provider.provider!r}"
+                    f"async dependency requested in sync context: {inner!r}"
                 )
             if isinstance(provided, AbstractContextManager):
-                return self.enter_context(provided)
+                if self._hooks:
+                    provided = ObservedContextManager(
+                        provided, self._hooks, provider.interface, self.CONTEXT
+                    )
+                return (stack or self).enter_context(provided)
         return provided
 
     def init(self) -> None:
         """Init eager dependencies."""
         for provider in self._container.get_eager_providers(self.CONTEXT):
-            self._get_or_provide(provider)
+            self._run(self._container.get_plan(provider.interface))
 
     def __enter__(self):
         self.init()
         return self
 
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if not self._hooks:
+            return super().__exit__(exc_type, exc_val, exc_tb)
+        start = time.perf_counter()
+        try:
+            suppress = super().__exit__(exc_type, exc_val, exc_tb)
+        except BaseException:
+            emit_quietly(self._hooks, self._teardown_event(start))
+            raise
+        # Errors of hooks must not replace the one being raised.
+        (emit_quietly if exc_val and not suppress else emit)(
+            self._hooks, self._teardown_event(start)
+        )
+        return suppress
+
+    def _teardown_event(self, start: float) -> Event:
+        return Event(
+            EventKind.TEARDOWN, None, self.CONTEXT, time.perf_counter() - start
+        )
+
     def close(self) -> None:
         # No exception here.
         self.__exit__(None, None, None)
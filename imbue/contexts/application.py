@@ -1,18 +1,34 @@
+import asyncio
 import threading
-from collections.abc import Callable
-from contextlib import AbstractContextManager
-from typing import Any, overload
+from collections.abc import Hashable
+from contextlib import AbstractContextManager, AsyncExitStack
+from typing import Any
 
 from imbue.abstract import InternalContainer
 from imbue.contexts.abstract import (
+    MISSING,
     ContextualizedContainer,
     SyncContextualizedContainer,
-    V,
 )
-from imbue.contexts.base import Context, make_context_decorator
-from imbue.contexts.task import SyncTaskContainer, TaskContainer
+from imbue.contexts.base import (
+    ContainerOptions,
+    Context,
+    ContextualizedProvider,
+    PoolOptions,
+    make_context_decorator,
+)
+from imbue.contexts.cached import DependencyCache, aclose_entries, close_entries
+from imbue.contexts.locks import HybridLock
+from imbue.contexts.pooled import InstancePool, aclose_pooled, close_pooled
+from imbue.contexts.scope import ScopeContainer, ScopeRegistry, SyncScopeContainer
+from imbue.contexts.task import (
+    SyncTaskContainer,
+    TaskContainer,
+    TaskContainerPool,
+)
 from imbue.contexts.thread import SyncThreadContainer, ThreadContainer
 from imbue.dependency import Interface
+from imbue.plan import ResolutionStep
 
 application_context = make_context_decorator(Context.APPLICATION)
 
@@ -24,42 +40,126 @@ class ApplicationContainer(ContextualizedContainer):
         self,
         container: InternalContainer,
         contextualized: dict[Context, "ContextualizedContainer"],
+        options: ContainerOptions | None = None,
     ):
         super().__init__(container, contextualized)
-        self._lock = threading.RLock()
-        self._locks: dict[Interface, AbstractContextManager] = {}
+        self._options = options or ContainerOptions()
+        self._lock = threading.Lock()
+        self.task_pool: TaskContainerPool[TaskContainer] = TaskContainerPool(
+            lambda pool: TaskContainer(
+                self._container, self._contextualized, pool, self._options.ambient
+            ),
+            self._options.task_pool_size,
+        )
+        self._locks: dict[int, HybridLock] = {}
+        # Pools of pooled dependencies, shared by all tasks.
+        self.pools: dict[Interface, InstancePool] = {}
+        # Values of cached dependencies, shared by all tasks.
+        self.cache = DependencyCache(self._options.cache_size)
+        self.scopes: ScopeRegistry[ScopeContainer] = ScopeRegistry(
+            self._options.max_scopes
+        )
+        # Evicted scopes being cleaned up.
+        self._closing: set[asyncio.Task] = set()
+        # Errors cleaning up evicted scopes, raised when the application exits.
+        self._closing_errors: list[BaseException] = []
+        if self._options.concurrent_teardown:
+            self._use_graph_teardown(self._options.teardown_timeout)
 
     async def init(self) -> None:
-        await super().init()
+        if self._options.concurrent_init:
+            await self._init_concurrently()
+        else:
+            await super().init()
         # Init the main thread's container.
-        container = ThreadContainer(self._container, self._contextualized)
+        container = ThreadContainer(
+            self._container, self._contextualized, self._options
+        )
         self._contextualized[container.CONTEXT] = container
         await self.enter_async_context(container)
+        self.init_timings.update(container.init_timings)
 
-    @overload
-    async def get(self, interface: type[V]) -> V:
-        """Specific type annotation for classes."""
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # Scoped, cached and pooled dependencies can depend on any application one, clean them up first.
+        try:
+            for scope in self.scopes.clear():
+                await scope.close()
+            # Their errors are kept by `_closed`.
+            await asyncio.gather(*self._closing, return_exceptions=True)
+            await aclose_entries(self.cache.clear())
+            for pool in self.pools.values():
+                await aclose_pooled(pool.clear())
+            if self._closing_errors:
+                raise self._closing_errors[0]
+        except BaseException as e:
+            await super().__aexit__(type(e), e, e.__traceback__)
+            raise
+        return await super().__aexit__(exc_type, exc_val, exc_tb)
 
-    @overload
-    async def get(self, interface: Callable) -> Callable:
-        """Specific type annotation for functions."""
+    def _get_lock(self, slot: int) -> HybridLock:
+        with self._lock:
+            if slot not in self._locks:
+                self._locks[slot] = HybridLock()
+            return self._locks[slot]
 
-    async def get(self, interface: Interface) -> Any:
-        if provided := self._provided.get(interface):
+    async def _get_or_provide(
+        self,
+        step: ResolutionStep,
+        values: list[Any],
+        stack: AsyncExitStack | None = None,
+    ) -> Any:
+        """Lock each interface so that concurrent threads and tasks do not provide it twice.
+        Waiting does not block the event loop.
+        """
+        provided = self._get_provided(step.slot)
+        if provided is not MISSING:
             return provided
-        with self._lock:
-            if interface not in self._locks:
-                self._locks[interface] = threading.Lock()
-        with self._locks[interface]:
-            return await super().get(interface)
+        async with self._get_lock(step.slot):
+            return await super()._get_or_provide(step, values, stack)
+
+    def get_pool(self, provider: ContextualizedProvider) -> InstancePool:
+        """Get the pool of a pooled dependency, created on first use."""
+        pool = self.pools.get(provider.interface)
+        if pool is None:
+            with self._lock:
+                pool = self.pools.get(provider.interface)
+                if pool is None:
+                    pool = self.pools[provider.interface] = InstancePool(
+                        provider.interface, provider.pool or PoolOptions()
+                    )
+        return pool
+
+    def scope(self, key: Hashable) -> ScopeContainer:
+        """Get the container of a scope, created on first use.
+        Evicted scopes are cleaned up in the background once their tasks exit,
+        their errors are raised when the application exits.
+        """
+        scope, removed = self.scopes.get(
+            key,
+            lambda: ScopeContainer(
+                self._container, self._contextualized, key, self.scopes, self._options
+            ),
+        )
+        for evicted in removed:
+            task = asyncio.get_running_loop().create_task(evicted.close())
+            self._closing.add(task)
+            task.add_done_callback(self._closed)
+        return scope
+
+    def _closed(self, task: asyncio.Task) -> None:
+        """Keep the error of an evicted scope, so that it is not lost."""
+        self._closing.discard(task)
+        error = None if task.cancelled() else task.exception()
+        if error is not None:
+            self._closing_errors.append(error)
 
     def thread_context(self) -> "ThreadContainer":
         """Spawn registries for other thread."""
-        return ThreadContainer(self._container, self._contextualized)
+        return ThreadContainer(self._container, self._contextualized, self._options)
 
     def task_context(self) -> "TaskContainer":
         """Spawn registries for each task."""
-        return TaskContainer(self._container, self._contextualized)
+        return self.task_pool.acquire()
 
 
 class SyncApplicationContainer(SyncContextualizedContainer):
@@ -69,39 +169,89 @@ class SyncApplicationContainer(SyncContextualizedContainer):
         self,
         container: InternalContainer,
         contextualized: dict[Context, "SyncContextualizedContainer"],
+        options: ContainerOptions | None = None,
     ):
         super().__init__(container, contextualized)
-        self._lock = threading.RLock()
-        self._locks: dict[Interface, AbstractContextManager] = {}
+        self._options = options or ContainerOptions()
+        self._lock = threading.Lock()
+        self.task_pool: TaskContainerPool[SyncTaskContainer] = TaskContainerPool(
+            lambda pool: SyncTaskContainer(
+                self._container, self._contextualized, pool, self._options.ambient
+            ),
+            self._options.task_pool_size,
+        )
+        self._locks: dict[int, AbstractContextManager] = {}
+        # Pools of pooled dependencies, shared by all tasks.
+        self.pools: dict[Interface, InstancePool] = {}
+        # Values of cached dependencies, shared by all tasks.
+        self.cache = DependencyCache(self._options.cache_size)
+        self.scopes: ScopeRegistry[SyncScopeContainer] = ScopeRegistry(
+            self._options.max_scopes
+        )
 
     def init(self) -> None:
         super().init()
         # Init the main thread's container.
-        container = SyncThreadContainer(self._container, self._contextualized)
+        container = SyncThreadContainer(
+            self._container, self._contextualized, self._options
+        )
         self._contextualized[container.CONTEXT] = container
         self.enter_context(container)
 
-    @overload
-    def get(self, interface: type[V]) -> V:
-        """Specific type annotation for classes."""
-
-    @overload
-    def get(self, interface: Callable) -> Callable:
-        """Specific type annotation for functions."""
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Scoped, cached and pooled dependencies can depend on any application one, clean them up first.
+        try:
+            for scope in self.scopes.clear():
+                scope.close()
+            close_entries(self.cache.clear())
+            for pool in self.pools.values():
+                close_pooled(pool.clear())
+        except BaseException as e:
+            super().__exit__(type(e), e, e.__traceback__)
+            raise
+        return super().__exit__(exc_type, exc_val, exc_tb)
 
-    def get(self, interface: Interface) -> Any:
-        if provided := self._provided.get(interface):
+    def _get_or_provide(self, step: ResolutionStep, values: list[Any]) -> Any:
+        """Lock each interface so that concurrent threads do not provide it twice."""
+        provided = self._get_provided(step.slot)
+        if provided is not MISSING:
             return provided
         with self._lock:
-            if interface not in self._locks:
-                self._locks[interface] = threading.Lock()
-        with self._locks[interface]:
-            return super().get(interface)
+            if step.slot not in self._locks:
+                self._locks[step.slot] = threading.Lock()
+        with self._locks[step.slot]:
+            return super()._get_or_provide(step, values)
+
+    def get_pool(self, provider: ContextualizedProvider) -> InstancePool:
+        """Get the pool of a pooled dependency, created on first use."""
+        pool = self.pools.get(provider.interface)
+        if pool is None:
+            with self._lock:
+                pool = self.pools.get(provider.interface)
+                if pool is None:
+                    pool = self.pools[provider.interface] = InstancePool(
+                        provider.interface, provider.pool or PoolOptions()
+                    )
+        return pool
+
+    def scope(self, key: Hashable) -> SyncScopeContainer:
+        """Get the container of a scope, created on first use.
+        Evicted scopes are cleaned up once their tasks exit.
+        """
+        scope, removed = self.scopes.get(
+            key,
+            lambda: SyncScopeContainer(
+                self._container, self._contextualized, key, self.scopes, self._options
+            ),
+        )
+        for evicted in removed:
+            evicted.close()
+        return scope
 
     def thread_context(self) -> "SyncThreadContainer":
         """Spawn registries for other thread."""
-        return SyncThreadContainer(self._container, self._contextualized)
+        return SyncThreadContainer(self._container, self._contextualized, self._options)
 
     def task_context(self) -> "SyncTaskContainer":
         """Spawn registries for each task."""
-        return SyncTaskContainer(self._container, self._contextualized)
+        return self.task_pool.acquire()
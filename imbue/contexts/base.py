@@ -8,7 +8,7 @@ from contextlib import (
     asynccontextmanager,
     contextmanager,
 )
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import (
     Any,
@@ -21,43 +21,108 @@ from imbue.dependency import Dependency, SubDependency
 from imbue.providers.abstract import AnyProviderResult, Provided, Provider
 from imbue.providers.common import get_providers
 from imbue.providers.instance import DelegatedInstanceProvider
-from imbue.utils import partial
+from imbue.utils import PartialTemplate
 
 
 class Context(IntEnum):
     """Supported contexts, lower have longer lifetime."""
 
     APPLICATION = 10  # Equivalent to singletons.
+    # Reused until expired or evicted from a cache kept by the application.
+    CACHED = 12
+    # Borrowed from a pool kept by the application for the duration of a task.
+    POOLED = 15
+    # Singletons for a key, kept by the application, cannot be used by thread dependencies.
+    SCOPE = 17
     THREAD = 20
     TASK = 30
     FACTORY = 40  # Never reused.
 
+    @property
+    def borrowed(self) -> bool:
+        """Borrowed by tasks, only task and factory dependencies can use them."""
+        return self is Context.CACHED or self is Context.POOLED
+
 
 T = TypeVar("T")
 V = TypeVar("V")
 
 
+@dataclass(frozen=True)
+class ContainerOptions:
+    """Options of contextualized containers, set when spawning the application container."""
+
+    # Recycle exited task containers, keeping up to this number per thread.
+    task_pool_size: int = 0
+    # Bind task containers to the current context while entered, see `imbue.get`.
+    ambient: bool = False
+    # Init independent eager dependencies concurrently, for async containers.
+    concurrent_init: bool = False
+    # Clean up resources concurrently, dependents before their dependencies, for async containers.
+    concurrent_teardown: bool = False
+    # Maximum time to clean up the resources of each dependency, with concurrent teardown.
+    teardown_timeout: float | None = None
+    # Maximum number of cached dependencies, least recently used ones are evicted first.
+    cache_size: int | None = None
+    # Maximum number of scopes, least recently used ones are evicted first.
+    max_scopes: int | None = None
+
+
+@dataclass(frozen=True)
+class PoolOptions:
+    """Options of the pool of a pooled dependency."""
+
+    # Maximum number of instances, tasks wait for one to be returned when all are borrowed.
+    size: int = 8
+    # Called with each instance returned to the pool, to reset its state.
+    reset: Callable[[Any], None] | None = None
+    # Maximum time to wait for an instance, in seconds, a `DependencyError` is raised after it.
+    timeout: float | None = None
+
+
+@dataclass(frozen=True)
+class CacheOptions:
+    """Options of a cached dependency."""
+
+    # Time after which the dependency is provided again, in seconds.
+    ttl: float | None = None
+
+
 @dataclass
 class ContextualizedDependency:
     dependency: Dependency
     context: Context | None = None
     eager: bool = False
+    concurrent: bool = False
+    # For the pooled context.
+    pool: PoolOptions | None = None
+    # For the cached context.
+    cache: CacheOptions | None = None
 
     def get_providers(self) -> Iterator[ContextualizedProvider]:
         yield from ContextualizedProvider.from_dependency(
             self.dependency,
             self.context,
             self.eager,
+            self.concurrent,
+            self.pool,
+            self.cache,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextualizedProvider(Generic[T, V]):
     """Wrap a provider to handle context and lifetime."""
 
     provider: Provider[T, V]
     context: Context | None
     eager: bool
+    # Resolve independent sub dependencies concurrently.
+    concurrent: bool = False
+    # For the pooled context.
+    pool: PoolOptions | None = None
+    # For the cached context.
+    cache: CacheOptions | None = None
 
     @classmethod
     def from_dependency(
@@ -65,6 +130,9 @@ class ContextualizedProvider(Generic[T, V]):
         dependency: Dependency,
         context: Context | None = None,
         eager: bool = False,
+        concurrent: bool = False,
+        pool: PoolOptions | None = None,
+        cache: CacheOptions | None = None,
     ) -> Iterator[ContextualizedProvider]:
         """In some cases, an interface yields multiple providers.
         Ex: a method yields a provider for a class and one for the method.
@@ -74,6 +142,9 @@ class ContextualizedProvider(Generic[T, V]):
                 provider=provider,
                 context=context,
                 eager=eager,
+                concurrent=concurrent,
+                pool=pool,
+                cache=cache,
             )
 
     @property
@@ -97,20 +168,33 @@ class DelegatedProviderWrapper(Generic[V]):
     func: Callable[..., V | Iterator[V] | AsyncIterator[V]]
     context: Context | None
     eager: bool
+    concurrent: bool = False
+    pool: PoolOptions | None = None
+    cache: CacheOptions | None = None
+    # The function and the template binding it to instances, introspected once for all instances.
+    _bound: tuple[Callable, bool, PartialTemplate] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_contextualized_provider(
         self,
         instance: Any,
     ) -> ContextualizedProvider[type[V], V]:
         """Get the provider from this wrapper."""
-        func, is_context_manager = self._get_func()
+        if self._bound is None:
+            func, is_context_manager = self._get_func()
+            self._bound = (func, is_context_manager, PartialTemplate(func, ("self",)))
+        func, is_context_manager, template = self._bound
         return ContextualizedProvider(
             provider=DelegatedInstanceProvider(
-                provider_func=partial(func, self=instance),
+                provider_func=template.bind(func, {"self": instance}),
                 is_context_manager=is_context_manager,
             ),
             context=self.context,
             eager=self.eager,
+            concurrent=self.concurrent,
+            pool=self.pool,
+            cache=self.cache,
         )
 
     def _get_func(
@@ -131,11 +215,23 @@ class DelegatedProviderWrapper(Generic[V]):
 
 
 def make_context_decorator(context: Context | None):
-    """Wrap a delegated function providing an interface to assign a context and handle eagerness."""
+    """Wrap a delegated function providing an interface to assign a context and handle eagerness.
+    Sub dependencies of concurrent providers are resolved concurrently in async containers.
+    """
 
-    def _wrapper(func: Callable | None = None, *, eager: bool = False):
+    def _wrapper(
+        func: Callable | None = None,
+        *,
+        eager: bool = False,
+        concurrent: bool = False,
+    ):
         def wrap(fn: Callable) -> DelegatedProviderWrapper:
-            return DelegatedProviderWrapper(func=fn, context=context, eager=eager)
+            return DelegatedProviderWrapper(
+                func=fn,
+                context=context,
+                eager=eager,
+                concurrent=concurrent,
+            )
 
         # Check if called like `@context` or `@context()`.
         if func is None:
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import AsyncExitStack, ExitStack
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from imbue.contexts.abstract import (
+    MISSING,
+    ContextualizedContainer,
+    SyncContextualizedContainer,
+)
+from imbue.contexts.base import CacheOptions, Context, DelegatedProviderWrapper
+from imbue.contexts.locks import HybridLock
+from imbue.plan import ResolutionStep
+
+if TYPE_CHECKING:
+    from imbue.contexts.application import (
+        ApplicationContainer,
+        SyncApplicationContainer,
+    )
+
+
+def cached_context(
+    func: Callable | None = None,
+    *,
+    ttl: float | None = None,
+    concurrent: bool = False,
+):
+    """Wrap a delegated function providing an interface, cached by the application.
+    It is provided again after `ttl` seconds, or once evicted if the cache is full.
+    """
+
+    def wrap(fn: Callable) -> DelegatedProviderWrapper:
+        return DelegatedProviderWrapper(
+            func=fn,
+            context=Context.CACHED,
+            eager=False,
+            concurrent=concurrent,
+            cache=CacheOptions(ttl=ttl),
+        )
+
+    # Check if called like `@context` or `@context()`.
+    if func is None:
+        # Called with parentheses.
+        return wrap
+    # Called without parentheses.
+    return wrap(func)
+
+
+@dataclass
+class CacheStats:
+    # Cached dependencies reused.
+    hits: int = 0
+    # Dependencies provided because they were not cached.
+    misses: int = 0
+    # Dependencies removed because their time to live was reached.
+    expired: int = 0
+    # Dependencies removed because the cache was full.
+    evicted: int = 0
+
+
+@dataclass(eq=False)
+class CacheEntry:
+    value: Any
+    # Resources entered while providing the value.
+    stack: AsyncExitStack | ExitStack
+    # Monotonic time after which the value is provided again.
+    expires: float | None
+    # Number of tasks using the value, the first one provided it.
+    leases: int = 1
+    # Resources are cleaned up once removed and not used anymore.
+    removed: bool = False
+
+
+class DependencyCache:
+    """Values of cached dependencies, by slot, shared by all threads.
+    Tasks lease entries so that resources of removed ones are only cleaned up once unused.
+    Methods return the entries whose resources should be cleaned up.
+    """
+
+    def __init__(self, max_size: int | None = None):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, CacheEntry] = OrderedDict()
+        self._locks: dict[int, HybridLock] = {}
+        self.stats = CacheStats()
+
+    def lock(self, slot: int) -> HybridLock:
+        """Lock a slot so that concurrent threads and tasks do not provide it twice."""
+        with self._lock:
+            if slot not in self._locks:
+                self._locks[slot] = HybridLock()
+            return self._locks[slot]
+
+    def lease(self, slot: int) -> tuple[CacheEntry | None, list[CacheEntry]]:
+        """Get a valid entry, to release when done with it."""
+        with self._lock:
+            entry = self._entries.get(slot)
+            if entry is None:
+                return None, []
+            if entry.expires is not None and entry.expires <= time.monotonic():
+                del self._entries[slot]
+                self.stats.expired += 1
+                return None, self._remove(entry)
+            self._entries.move_to_end(slot)
+            entry.leases += 1
+            self.stats.hits += 1
+            return entry, []
+
+    def add(self, slot: int, entry: CacheEntry) -> list[CacheEntry]:
+        """Add a leased entry, evicting the least recently used ones if full."""
+        with self._lock:
+            self.stats.misses += 1
+            self._entries[slot] = entry
+            removed: list[CacheEntry] = []
+            while self.max_size is not None and len(self._entries) > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self.stats.evicted += 1
+                removed.extend(self._remove(evicted))
+            return removed
+
+    def release(self, entry: CacheEntry) -> list[CacheEntry]:
+        with self._lock:
+            entry.leases -= 1
+            return [entry] if entry.removed and not entry.leases else []
+
+    def clear(self) -> list[CacheEntry]:
+        """Remove all entries."""
+        with self._lock:
+            entries, self._entries = self._entries, OrderedDict()
+            removed: list[CacheEntry] = []
+            for entry in entries.values():
+                removed.extend(self._remove(entry))
+            return removed
+
+    @staticmethod
+    def _remove(entry: CacheEntry) -> list[CacheEntry]:
+        entry.removed = True
+        return [] if entry.leases else [entry]
+
+
+def _expires(options: CacheOptions | None) -> float | None:
+    if options is None or options.ttl is None:
+        return None
+    return time.monotonic() + options.ttl
+
+
+async def aclose_entries(entries: list[CacheEntry]) -> None:
+    for entry in entries:
+        await cast(AsyncExitStack, entry.stack).aclose()
+
+
+def close_entries(entries: list[CacheEntry]) -> None:
+    for entry in entries:
+        cast(ExitStack, entry.stack).close()
+
+
+class CachedContainer(ContextualizedContainer):
+    """Hold cached values used by a task, they are released when the task exits.
+    The cache is kept in the application container.
+    """
+
+    CONTEXT = Context.CACHED
+
+    async def _get_or_provide(
+        self,
+        step: ResolutionStep,
+        values: list[Any],
+        stack: AsyncExitStack | None = None,
+    ) -> Any:
+        provided = self._get_provided(step.slot)
+        if provided is not MISSING:
+            return provided
+        cache = cast(
+            "ApplicationContainer", self._contextualized[Context.APPLICATION]
+        ).cache
+        entry, removed = cache.lease(step.slot)
+        await aclose_entries(removed)
+        if entry is None:
+            async with cache.lock(step.slot):
+                entry, removed = cache.lease(step.slot)
+                await aclose_entries(removed)
+                if entry is None:
+                    resources = AsyncExitStack()
+                    try:
+                        value = await self._provide(
+                            step.provider,
+                            self._arguments(step, values),
+                            resources,
+                        )
+                    except BaseException:
+                        await resources.aclose()
+                        raise
+                    entry = CacheEntry(value, resources, _expires(step.provider.cache))
+                    await aclose_entries(cache.add(step.slot, entry))
+        self._store(step.slot, entry.value)
+        self.push_async_callback(self._release, step.slot, cache, entry)
+        return entry.value
+
+    async def _release(
+        self, slot: int, cache: DependencyCache, entry: CacheEntry
+    ) -> None:
+        self._provided[slot] = MISSING
+        await aclose_entries(cache.release(entry))
+
+
+class SyncCachedContainer(SyncContextualizedContainer):
+    """Sync version of CachedContainer."""
+
+    CONTEXT = Context.CACHED
+
+    def _get_or_provide(self, step: ResolutionStep, values: list[Any]) -> Any:
+        provided = self._get_provided(step.slot)
+        if provided is not MISSING:
+            return provided
+        cache = cast(
+            "SyncApplicationContainer", self._contextualized[Context.APPLICATION]
+        ).cache
+        entry, removed = cache.lease(step.slot)
+        close_entries(removed)
+        if entry is None:
+            with cache.lock(step.slot):
+                entry, removed = cache.lease(step.slot)
+                close_entries(removed)
+                if entry is None:
+                    resources = ExitStack()
+                    try:
+                        value = self._provide(
+                            step.provider,
+                            self._arguments(step, values),
+                            resources,
+                        )
+                    except BaseException:
+                        resources.close()
+                        raise
+                    entry = CacheEntry(value, resources, _expires(step.provider.cache))
+                    close_entries(cache.add(step.slot, entry))
+        self._store(step.slot, entry.value)
+        self.callback(self._release, step.slot, cache, entry)
+        return entry.value
+
+    def _release(self, slot: int, cache: DependencyCache, entry: CacheEntry) -> None:
+        self._provided[slot] = MISSING
+        close_entries(cache.release(entry))
@@ -1,22 +1,80 @@
+import functools
+from collections.abc import Callable
+from contextlib import AsyncExitStack
 from typing import Any
 
 from imbue.contexts.abstract import ContextualizedContainer, SyncContextualizedContainer
-from imbue.contexts.base import Context, ContextualizedProvider, make_context_decorator
+from imbue.contexts.base import Context, make_context_decorator
+from imbue.dependency import Interface
+from imbue.plan import ResolutionPlan, ResolutionStep
 
 factory_context = make_context_decorator(Context.FACTORY)
 
 
+def _reusable(plan: ResolutionPlan) -> bool:
+    """Check if the arguments of the target can be reused for each instance."""
+    step = plan.target
+    return not (
+        step.lazy
+        or step.factories
+        or any(plan.steps[i].context is Context.FACTORY for _, i in step.arguments)
+    )
+
+
 class FactoryContainer(ContextualizedContainer):
     CONTEXT = Context.FACTORY
 
-    async def _get_or_provide(self, provider: ContextualizedProvider) -> Any:
+    async def _get_or_provide(
+        self,
+        step: ResolutionStep,
+        values: list[Any],
+        stack: AsyncExitStack | None = None,
+    ) -> Any:
         """Always provide."""
-        return await self._provide(provider)
+        return await self._provide(step.provider, self._arguments(step, values), stack)
+
+    async def prepare(self, interface: Interface) -> tuple[Callable[[], Any], bool]:
+        """Prepare a callable creating new instances of the interface, and if it must be awaited.
+        Sub dependencies are provided once, unless they cannot be reused.
+        """
+        plan = self._container.get_plan(interface)
+        if not _reusable(plan):
+            return functools.partial(self.get, interface), True
+        step = plan.target
+        values = await self.get_many(
+            *(plan.steps[i].interface for _, i in step.arguments)
+        )
+        arguments = {
+            name: v for (name, _), v in zip(step.arguments, values, strict=True)
+        }
+        inner = step.provider.provider
+        if self._hooks or inner.awaitable or inner.is_context_manager:
+            return functools.partial(self._provide, step.provider, arguments), True
+        # Fast path, only call the provider.
+        return functools.partial(inner.provide, **arguments), False
 
 
 class SyncFactoryContainer(SyncContextualizedContainer):
     CONTEXT = Context.FACTORY
 
-    def _get_or_provide(self, provider: ContextualizedProvider) -> Any:
+    def _get_or_provide(self, step: ResolutionStep, values: list[Any]) -> Any:
         """Always provide."""
-        return self._provide(provider)
+        return self._provide(step.provider, self._arguments(step, values))
+
+    def prepare(self, interface: Interface) -> Callable[[], Any]:
+        """Prepare a callable creating new instances of the interface.
+        Sub dependencies are provided once, unless they cannot be reused.
+        """
+        plan = self._container.get_plan(interface)
+        if not _reusable(plan):
+            return functools.partial(self.get, interface)
+        step = plan.target
+        values = self.get_many(*(plan.steps[i].interface for _, i in step.arguments))
+        arguments = {
+            name: v for (name, _), v in zip(step.arguments, values, strict=True)
+        }
+        inner = step.provider.provider
+        if self._hooks or inner.awaitable or inner.is_context_manager:
+            return functools.partial(self._provide, step.provider, arguments)
+        # Fast path, only call the provider.
+        return functools.partial(inner.provide, **arguments)
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+import weakref
+
+# Backoff when waiting for another thread to release the lock.
+_MIN_DELAY = 0.0001
+_MAX_DELAY = 0.01
+
+
+class HybridLock:
+    """Lock that is safe across threads and does not block the event loop.
+    Threads block on the underlying lock,
+    coroutines wait on a lock specific to their event loop then poll the underlying lock,
+    yielding to the event loop while another thread holds it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._guard = threading.Lock()
+        self._async_locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Lock
+        ] = weakref.WeakKeyDictionary()
+
+    def __enter__(self) -> None:
+        self._lock.acquire()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._lock.release()
+
+    def _get_async_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        with self._guard:
+            if loop not in self._async_locks:
+                self._async_locks[loop] = asyncio.Lock()
+            return self._async_locks[loop]
+
+    async def __aenter__(self) -> None:
+        # Coroutines of the same event loop wait without polling.
+        async_lock = self._get_async_lock()
+        await async_lock.acquire()
+        try:
+            delay = _MIN_DELAY
+            while not self._lock.acquire(blocking=False):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _MAX_DELAY)
+        except BaseException:
+            async_lock.release()
+            raise
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._lock.release()
+        self._get_async_lock().release()
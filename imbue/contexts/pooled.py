@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from contextlib import AsyncExitStack, ExitStack
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from imbue.contexts.abstract import (
+    MISSING,
+    ContextualizedContainer,
+    SyncContextualizedContainer,
+)
+from imbue.contexts.base import Context, DelegatedProviderWrapper, PoolOptions
+from imbue.dependency import Interface
+from imbue.exceptions import DependencyError
+from imbue.plan import ResolutionStep
+
+# Returned when the task has to wait for an instance.
+_WAIT: Any = object()
+
+if TYPE_CHECKING:
+    from imbue.contexts.application import (
+        ApplicationContainer,
+        SyncApplicationContainer,
+    )
+
+
+def pooled_context(
+    func: Callable | None = None,
+    *,
+    size: int = PoolOptions.size,
+    reset: Callable[[Any], None] | None = None,
+    timeout: float | None = None,
+    concurrent: bool = False,
+):
+    """Wrap a delegated function providing an interface, borrowed from a pool for each task.
+    At most `size` instances are created, `reset` is called with each instance returned to the pool.
+    Tasks wait at most `timeout` seconds for an instance when all are borrowed.
+    """
+
+    def wrap(fn: Callable) -> DelegatedProviderWrapper:
+        return DelegatedProviderWrapper(
+            func=fn,
+            context=Context.POOLED,
+            eager=False,
+            concurrent=concurrent,
+            pool=PoolOptions(size=size, reset=reset, timeout=timeout),
+        )
+
+    # Check if called like `@context` or `@context()`.
+    if func is None:
+        # Called with parentheses.
+        return wrap
+    # Called without parentheses.
+    return wrap(func)
+
+
+@dataclass
+class PoolStats:
+    # Instances created because none were idle.
+    created: int = 0
+    # Instances reused from the pool.
+    reused: int = 0
+    # Times all instances were borrowed, the task had to wait for one.
+    exhausted: int = 0
+    # Total time spent waiting, in seconds.
+    waited: float = 0.0
+    # Instances dropped because they could not be created or reset.
+    discarded: int = 0
+
+
+@dataclass(eq=False)
+class PoolEntry:
+    value: Any
+    # Resources entered while providing the value.
+    stack: AsyncExitStack | ExitStack
+
+
+class InstancePool:
+    """Bounded pool of entries, shared by all threads.
+    `MISSING` is handed out instead of an entry when a new one can be created.
+    """
+
+    def __init__(self, interface: Interface, options: PoolOptions):
+        self.interface = interface
+        self.options = options
+        self._lock = threading.Lock()
+        self._idle: deque[PoolEntry] = deque()
+        # Entries created and not discarded, idle or borrowed.
+        self._entries: set[PoolEntry] = set()
+        # Entries created or being created.
+        self._size = 0
+        # Called with the instance, or `MISSING`, for each waiting task.
+        self._waiters: deque[Callable[[Any], None]] = deque()
+        self.stats = PoolStats()
+
+    def _try_acquire(self, waiter: Callable[[Any], None]) -> Any:
+        """Get an idle instance, `MISSING` to create one or register the waiter and return `_WAIT`."""
+        with self._lock:
+            if self._idle:
+                self.stats.reused += 1
+                return self._idle.pop()
+            if self._size < self.options.size:
+                self._size += 1
+                self.stats.created += 1
+                return MISSING
+            self.stats.exhausted += 1
+            self._waiters.append(waiter)
+            return _WAIT
+
+    async def acquire(self) -> Any:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+
+        def _deliver(instance: Any) -> None:
+            loop.call_soon_threadsafe(self._hand_over, future, instance)
+
+        instance = self._try_acquire(_deliver)
+        if instance is not _WAIT:
+            return instance
+        start = time.perf_counter()
+        try:
+            # An instance handed over once timed out goes back to the pool.
+            return await asyncio.wait_for(future, self.options.timeout)
+        except asyncio.TimeoutError:
+            self._forget(_deliver)
+            raise self._timed_out() from None
+        finally:
+            self._waited(start)
+
+    def sync_acquire(self) -> Any:
+        received: queue.SimpleQueue = queue.SimpleQueue()
+        instance = self._try_acquire(received.put)
+        if instance is not _WAIT:
+            return instance
+        start = time.perf_counter()
+        try:
+            return received.get(timeout=self.options.timeout)
+        except queue.Empty:
+            if not self._forget(received.put):
+                # Handed over while timing out.
+                return received.get()
+            raise self._timed_out() from None
+        finally:
+            self._waited(start)
+
+    def _forget(self, waiter: Callable[[Any], None]) -> bool:
+        """Stop waiting, return False if the waiter was already called."""
+        with self._lock:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                return False
+            return True
+
+    def _timed_out(self) -> DependencyError:
+        return DependencyError(
+            f"no pooled {self.interface} returned within {self.options.timeout}s"
+        )
+
+    def _waited(self, start: float) -> None:
+        with self._lock:
+            self.stats.waited += time.perf_counter() - start
+
+    def _hand_over(self, future: asyncio.Future, instance: Any) -> None:
+        """Give the instance to a waiting task, or back to the pool if it stopped waiting."""
+        if future.done():
+            self._put(instance)
+        else:
+            future.set_result(instance)
+
+    def _put(self, instance: Any) -> None:
+        with self._lock:
+            if self._waiters:
+                waiter = self._waiters.popleft()
+            else:
+                if instance is MISSING:
+                    self._size -= 1
+                else:
+                    self._idle.append(instance)
+                return
+        waiter(instance)
+
+    def add(self, entry: PoolEntry) -> None:
+        """Keep track of a created entry, borrowed by the task which created it."""
+        with self._lock:
+            self._entries.add(entry)
+
+    def release(self, entry: PoolEntry) -> None:
+        """Return a borrowed entry, resetting its value first.
+        If the reset fails the entry is discarded, its resources must be cleaned up by the caller.
+        """
+        if self.options.reset is not None:
+            try:
+                self.options.reset(entry.value)
+            except Exception:
+                self.discard(entry)
+                raise
+        self._put(entry)
+
+    def discard(self, entry: PoolEntry | None = None) -> None:
+        """Forget a borrowed entry, or one that could not be created."""
+        with self._lock:
+            self.stats.discarded += 1
+            if entry is not None:
+                self._entries.discard(entry)
+        # A waiting task can create a new one instead.
+        self._put(MISSING)
+
+    def clear(self) -> list[PoolEntry]:
+        """Remove all entries, idle or borrowed, to clean up their resources."""
+        with self._lock:
+            entries, self._entries = list(self._entries), set()
+            self._idle.clear()
+            return entries
+
+
+async def aclose_pooled(entries: list[PoolEntry]) -> None:
+    for entry in entries:
+        await cast(AsyncExitStack, entry.stack).aclose()
+
+
+def close_pooled(entries: list[PoolEntry]) -> None:
+    for entry in entries:
+        cast(ExitStack, entry.stack).close()
+
+
+class PooledContainer(ContextualizedContainer):
+    """Hold instances borrowed by a task, they are returned when the task exits.
+    Pools are kept in the application container, which cleans up the resources of their instances.
+    """
+
+    CONTEXT = Context.POOLED
+
+    async def _get_or_provide(
+        self,
+        step: ResolutionStep,
+        values: list[Any],
+        stack: AsyncExitStack | None = None,
+    ) -> Any:
+        provided = self._get_provided(step.slot)
+        if provided is not MISSING:
+            return provided
+        application = cast(
+            "ApplicationContainer", self._contextualized[Context.APPLICATION]
+        )
+        pool = application.get_pool(step.provider)
+        entry = await pool.acquire()
+        if entry is MISSING:
+            resources = AsyncExitStack()
+            try:
+                value = await self._provide(
+                    step.provider,
+                    self._arguments(step, values),
+                    resources,
+                )
+            except BaseException:
+                pool.discard()
+                await resources.aclose()
+                raise
+            entry = PoolEntry(value, resources)
+            pool.add(entry)
+        self._store(step.slot, entry.value)
+        self.push_async_callback(self._return, step.slot, pool, entry)
+        return entry.value
+
+    async def _return(self, slot: int, pool: InstancePool, entry: PoolEntry) -> None:
+        self._provided[slot] = MISSING
+        try:
+            pool.release(entry)
+        except BaseException:
+            # Discarded, do not keep its resources until the application exits.
+            await aclose_pooled([entry])
+            raise
+
+
+class SyncPooledContainer(SyncContextualizedContainer):
+    """Sync version of PooledContainer."""
+
+    CONTEXT = Context.POOLED
+
+    def _get_or_provide(self, step: ResolutionStep, values: list[Any]) -> Any:
+        provided = self._get_provided(step.slot)
+        if provided is not MISSING:
+            return provided
+        application = cast(
+            "SyncApplicationContainer", self._contextualized[Context.APPLICATION]
+        )
+        pool = application.get_pool(step.provider)
+        entry = pool.sync_acquire()
+        if entry is MISSING:
+            resources = ExitStack()
+            try:
+                value = self._provide(
+                    step.provider,
+                    self._arguments(step, values),
+                    resources,
+                )
+            except BaseException:
+                pool.discard()
+                resources.close()
+                raise
+            entry = PoolEntry(value, resources)
+            pool.add(entry)
+        self._store(step.slot, entry.value)
+        self.callback(self._return, step.slot, pool, entry)
+        return entry.value
+
+    def _return(self, slot: int, pool: InstancePool, entry: PoolEntry) -> None:
+        self._provided[slot] = MISSING
+        try:
+            pool.release(entry)
+        except BaseException:
+            # Discarded, do not keep its resources until the application exits.
+            close_pooled([entry])
+            raise
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from contextlib import AsyncExitStack
+from typing import Any, Generic, TypeVar
+
+from imbue.abstract import InternalContainer
+from imbue.contexts.abstract import (
+    MISSING,
+    ContextualizedContainer,
+    SyncContextualizedContainer,
+)
+from imbue.contexts.base import ContainerOptions, Context, make_context_decorator
+from imbue.contexts.locks import HybridLock
+from imbue.contexts.task import SyncTaskContainer, TaskContainer
+from imbue.contexts.thread import SyncThreadContainer, ThreadContainer
+from imbue.plan import ResolutionStep
+
+scope_context = make_context_decorator(Context.SCOPE)
+
+S = TypeVar("S", "ScopeContainer", "SyncScopeContainer")
+
+
+class ScopeRegistry(Generic[S]):
+    """Scope containers by key, the least recently used are evicted when full.
+    Tasks lease their scope so that evicted ones are only cleaned up once unused.
+    Methods return the scopes that should be cleaned up.
+    """
+
+    def __init__(self, max_size: int | None = None):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._scopes: OrderedDict[Hashable, S] = OrderedDict()
+        # Number of tasks using each scope.
+        self._leases: dict[S, int] = {}
+        # Scopes removed but still used.
+        self._removed: set[S] = set()
+
+    def __len__(self) -> int:
+        return len(self._scopes)
+
+    def get(self, key: Hashable, create: Callable[[], S]) -> tuple[S, list[S]]:
+        with self._lock:
+            scope = self._scopes.get(key)
+            if scope is not None:
+                self._scopes.move_to_end(key)
+                return scope, []
+            scope = self._scopes[key] = create()
+            removed: list[S] = []
+            while self.max_size is not None and len(self._scopes) > self.max_size:
+                _, evicted = self._scopes.popitem(last=False)
+                removed.extend(self._remove(evicted))
+            return scope, removed
+
+    def lease(self, scope: S) -> None:
+        with self._lock:
+            self._leases[scope] = self._leases.get(scope, 0) + 1
+
+    def release(self, scope: S) -> list[S]:
+        with self._lock:
+            self._leases[scope] -= 1
+            if self._leases[scope]:
+                return []
+            del self._leases[scope]
+            if scope in self._removed:
+                self._removed.discard(scope)
+                return [scope]
+            return []
+
+    def clear(self) -> list[S]:
+        """Remove all scopes, including the ones still used."""
+        with self._lock:
+            scopes = [*self._scopes.values(), *self._removed]
+            self._scopes.clear()
+            self._removed.clear()
+            self._leases.clear()
+            return scopes
+
+    def _remove(self, scope: S) -> list[S]:
+        if scope in self._leases:
+            self._removed.add(scope)
+            return []
+        return [scope]
+
+
+class ScopeContainer(ContextualizedContainer):
+    """Singletons for a key, a tenant for instance, shared by all threads."""
+
+    CONTEXT = Context.SCOPE
+
+    def __init__(
+        self,
+        container: InternalContainer,
+        contextualized: dict[Context, ContextualizedContainer],
+        key: Hashable,
+        registry: ScopeRegistry[ScopeContainer],
+        options: ContainerOptions | None = None,
+    ):
+        super().__init__(container, contextualized)
+        self.key = key
+        self._registry = registry
+        self._options = options or ContainerOptions()
+        self._lock = threading.Lock()
+        self._locks: dict[int, HybridLock] = {}
+
+    async def _get_or_provide(
+        self,
+        step: ResolutionStep,
+        values: list[Any],
+        stack: AsyncExitStack | None = None,
+    ) -> Any:
+        """Lock each interface so that concurrent threads and tasks do not provide it twice."""
+        provided = self._get_provided(step.slot)
+        if provided is not MISSING:
+            return provided
+        with self._lock:
+            if step.slot not in self._locks:
+                self._locks[step.slot] = HybridLock()
+        async with self._locks[step.slot]:
+            return await super()._get_or_provide(step, values, stack)
+
+    def task_context(self, thread: ThreadContainer | None = None) -> TaskContainer:
+        """Spawn registries for a task of this scope.
+        Pass the container of the current thread if not the main one.
+        """
+        contextualized = dict((thread or self)._contextualized)
+        contextualized[self.CONTEXT] = self
+        self._registry.lease(self)
+        container = TaskContainer(
+            self._container, contextualized, ambient=self._options.ambient
+        )
+        # Released after everything else of the task is cleaned up.
+        container.push_async_callback(self._release)
+        return container
+
+    async def _release(self) -> None:
+        for scope in self._registry.release(self):
+            await scope.close()
+
+
+class SyncScopeContainer(SyncContextualizedContainer):
+    """Sync version of ScopeContainer."""
+
+    CONTEXT = Context.SCOPE
+
+    def __init__(
+        self,
+        container: InternalContainer,
+        contextualized: dict[Context, SyncContextualizedContainer],
+        key: Hashable,
+        registry: ScopeRegistry[SyncScopeContainer],
+        options: ContainerOptions | None = None,
+    ):
+        super().__init__(container, contextualized)
+        self.key = key
+        self._registry = registry
+        self._options = options or ContainerOptions()
+        self._lock = threading.Lock()
+        self._locks: dict[int, threading.Lock] = {}
+
+    def _get_or_provide(self, step: ResolutionStep, values: list[Any]) -> Any:
+        """Lock each interface so that concurrent threads do not provide it twice."""
+        provided = self._get_provided(step.slot)
+        if provided is not MISSING:
+            return provided
+        with self._lock:
+            if step.slot not in self._locks:
+                self._locks[step.slot] = threading.Lock()
+        with self._locks[step.slot]:
+            return super()._get_or_provide(step, values)
+
+    def task_context(
+        self, thread: SyncThreadContainer | None = None
+    ) -> SyncTaskContainer:
+        """Spawn registries for a task of this scope.
+        Pass the container of the current thread if not the main one.
+        """
+        contextualized = dict((thread or self)._contextualized)
+        contextualized[self.CONTEXT] = self
+        self._registry.lease(self)
+        container = SyncTaskContainer(
+            self._container, contextualized, ambient=self._options.ambient
+        )
+        # Released after everything else of the task is cleaned up.
+        container.callback(self._release)
+        return container
+
+    def _release(self) -> None:
+        for scope in self._registry.release(self):
+            scope.close()
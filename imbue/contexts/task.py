@@ -1,27 +1,180 @@
-from imbue.contexts.abstract import ContextualizedContainer, SyncContextualizedContainer
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Generic, Protocol, TypeVar
+
+from imbue.abstract import InternalContainer
+from imbue.contexts.abstract import (
+    MISSING,
+    ContextualizedContainer,
+    SyncContextualizedContainer,
+)
 from imbue.contexts.base import Context, make_context_decorator
+from imbue.contexts.cached import CachedContainer, SyncCachedContainer
 from imbue.contexts.factory import FactoryContainer, SyncFactoryContainer
+from imbue.contexts.pooled import PooledContainer, SyncPooledContainer
 
 task_context = make_context_decorator(Context.TASK)
 
 
+class _Recyclable(Protocol):
+    def reset(self) -> None: ...
+
+
+C = TypeVar("C", bound=_Recyclable)
+
+
+@dataclass
+class TaskPoolStats:
+    # Containers reused from the pool.
+    hits: int = 0
+    # Containers created because the pool was empty.
+    misses: int = 0
+    # Containers dropped because the pool was full.
+    discarded: int = 0
+
+
+class TaskContainerPool(Generic[C]):
+    """Recycle task containers once they are exited to avoid allocating new ones for each task.
+    With a size of 0, new containers are always created.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[TaskContainerPool[C] | None], C],
+        max_size: int,
+    ):
+        self._create = create
+        self.max_size = max_size
+        self._idle: deque[C] = deque()
+        self.stats = TaskPoolStats()
+
+    def acquire(self) -> C:
+        try:
+            container = self._idle.pop()
+        except IndexError:
+            self.stats.misses += 1
+            return self._create(self if self.max_size else None)
+        self.stats.hits += 1
+        return container
+
+    def release(self, container: C) -> None:
+        if len(self._idle) >= self.max_size:
+            self.stats.discarded += 1
+            return
+        container.reset()
+        self._idle.append(container)
+
+
+# Task containers bound to the current context, in ambient mode.
+current_task: ContextVar[TaskContainer | None] = ContextVar(
+    "current_task", default=None
+)
+current_sync_task: ContextVar[SyncTaskContainer | None] = ContextVar(
+    "current_sync_task", default=None
+)
+
+
 class TaskContainer(ContextualizedContainer):
     CONTEXT = Context.TASK
 
+    def __init__(
+        self,
+        container: InternalContainer,
+        contextualized: dict[Context, ContextualizedContainer],
+        pool: TaskContainerPool[TaskContainer] | None = None,
+        ambient: bool = False,
+    ):
+        super().__init__(container, contextualized)
+        self._pool = pool
+        self._ambient = ambient
+        self._token: Token | None = None
+
     async def init(self) -> None:
         await super().init()
-        # Init the factory container.
-        container = FactoryContainer(self._container, self._contextualized)
-        self._contextualized[container.CONTEXT] = container
-        await self.enter_async_context(container)
+        # Init the cached, pooled and factory containers, they are kept when recycled.
+        # Borrowed dependencies are released after factory resources are cleaned up.
+        for context, cls in (
+            (Context.CACHED, CachedContainer),
+            (Context.POOLED, PooledContainer),
+            (Context.FACTORY, FactoryContainer),
+        ):
+            container = self._contextualized.get(context)
+            if container is None:
+                container = cls(self._container, self._contextualized)
+                self._contextualized[context] = container
+            await self.enter_async_context(container)
+
+    async def __aenter__(self):
+        await super().__aenter__()
+        if self._ambient:
+            self._token = current_task.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            return await super().__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            if self._token is not None:
+                current_task.reset(self._token)
+                self._token = None
+            if self._pool is not None:
+                self._pool.release(self)
+
+    def reset(self) -> None:
+        """Forget provided dependencies so that the container can be reused."""
+        self._provided = [MISSING] * len(self._provided)
 
 
 class SyncTaskContainer(SyncContextualizedContainer):
     CONTEXT = Context.TASK
 
+    def __init__(
+        self,
+        container: InternalContainer,
+        contextualized: dict[Context, SyncContextualizedContainer],
+        pool: TaskContainerPool[SyncTaskContainer] | None = None,
+        ambient: bool = False,
+    ):
+        super().__init__(container, contextualized)
+        self._pool = pool
+        self._ambient = ambient
+        self._token: Token | None = None
+
     def init(self) -> None:
         super().init()
-        # Init the factory container.
-        container = SyncFactoryContainer(self._container, self._contextualized)
-        self._contextualized[container.CONTEXT] = container
-        self.enter_context(container)
+        # Init the cached, pooled and factory containers, they are kept when recycled.
+        # Borrowed dependencies are released after factory resources are cleaned up.
+        for context, cls in (
+            (Context.CACHED, SyncCachedContainer),
+            (Context.POOLED, SyncPooledContainer),
+            (Context.FACTORY, SyncFactoryContainer),
+        ):
+            container = self._contextualized.get(context)
+            if container is None:
+                container = cls(self._container, self._contextualized)
+                self._contextualized[context] = container
+            self.enter_context(container)
+
+    def __enter__(self):
+        super().__enter__()
+        if self._ambient:
+            self._token = current_sync_task.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            return super().__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            if self._token is not None:
+                current_sync_task.reset(self._token)
+                self._token = None
+            if self._pool is not None:
+                self._pool.release(self)
+
+    def reset(self) -> None:
+        """Forget provided dependencies so that the container can be reused."""
+        self._provided = [MISSING] * len(self._provided)
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from collections.abc import Iterator
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+
+from imbue.abstract import InternalContainer
+from imbue.dependency import Interface
+from imbue.plan import ResolutionStep
+
+
+@dataclass
+class TeardownReport:
+    # Time taken to clean up the resources of each dependency, in seconds.
+    timings: dict[Interface, float] = field(default_factory=dict)
+    # Dependencies whose resources were not cleaned up within the timeout.
+    timed_out: list[Interface] = field(default_factory=list)
+
+    def slowest(self, count: int = 5) -> list[tuple[Interface, float]]:
+        """Get the dependencies that took the longest to clean up."""
+        return sorted(self.timings.items(), key=lambda item: item[1], reverse=True)[
+            :count
+        ]
+
+
+class GraphTeardown:
+    """Clean up the resources of a container concurrently,
+    dependents are always cleaned up before their dependencies.
+    """
+
+    def __init__(self, container: InternalContainer, timeout: float | None = None):
+        self._container = container
+        self._timeout = timeout
+        # Resources entered while providing each dependency, indexed by their slot.
+        self._stacks: dict[int, tuple[Interface, list[AsyncExitStack]]] = {}
+        self.report = TeardownReport()
+
+    def add(self, step: ResolutionStep, stack: AsyncExitStack) -> None:
+        """Keep resources entered while providing a step."""
+        if step.slot in self._stacks:
+            self._stacks[step.slot][1].append(stack)
+        else:
+            self._stacks[step.slot] = (step.interface, [stack])
+
+    async def close(self) -> None:
+        """Clean up each dependency's resources as soon as all its dependents are cleaned up."""
+        stacks, self._stacks = self._stacks, {}
+        # Only dependencies with resources in this container need to be ordered.
+        dependents: dict[int, list[int]] = {slot: [] for slot in stacks}
+        for slot, (interface, _) in stacks.items():
+            for step in self._dependencies(interface):
+                if step.slot != slot and step.slot in stacks:
+                    dependents[step.slot].append(slot)
+        closed = {slot: asyncio.Event() for slot in stacks}
+
+        async def _close_after_dependents(slot: int) -> None:
+            for dependent in dependents[slot]:
+                await closed[dependent].wait()
+            try:
+                await self._close(*stacks[slot])
+            finally:
+                closed[slot].set()
+
+        results = await asyncio.gather(
+            *(_close_after_dependents(slot) for slot in stacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _dependencies(self, interface: Interface) -> Iterator[ResolutionStep]:
+        """Steps providing the dependencies of an interface, including lazy ones."""
+        pending = [interface]
+        seen = {interface}
+        while pending:
+            for step in self._container.get_plan(pending.pop()).steps:
+                yield step
+                for _, lazy in step.lazy:
+                    if lazy not in seen:
+                        seen.add(lazy)
+                        pending.append(lazy)
+
+    async def _close(self, interface: Interface, stacks: list[AsyncExitStack]) -> None:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(_close_all(stacks), self._timeout)
+        except asyncio.TimeoutError:
+            self.report.timed_out.append(interface)
+        finally:
+            self.report.timings[interface] = time.perf_counter() - start
+
+
+async def _close_all(stacks: list[AsyncExitStack]) -> None:
+    for stack in reversed(stacks):
+        await stack.aclose()
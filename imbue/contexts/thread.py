@@ -1,17 +1,20 @@
 import asyncio
-from collections.abc import Callable
-from contextlib import AbstractAsyncContextManager
-from typing import Any, overload
+from contextlib import AbstractAsyncContextManager, AsyncExitStack
+from typing import Any
 
 from imbue.abstract import InternalContainer
 from imbue.contexts.abstract import (
+    MISSING,
     ContextualizedContainer,
     SyncContextualizedContainer,
-    V,
 )
-from imbue.contexts.base import Context, make_context_decorator
-from imbue.contexts.task import SyncTaskContainer, TaskContainer
-from imbue.dependency import Interface
+from imbue.contexts.base import ContainerOptions, Context, make_context_decorator
+from imbue.contexts.task import (
+    SyncTaskContainer,
+    TaskContainer,
+    TaskContainerPool,
+)
+from imbue.plan import ResolutionStep
 
 thread_context = make_context_decorator(Context.THREAD)
 
@@ -23,34 +26,64 @@ class ThreadContainer(ContextualizedContainer):
         self,
         container: InternalContainer,
         contextualized: dict[Context, "ContextualizedContainer"],
+        options: ContainerOptions | None = None,
     ):
         super().__init__(container, contextualized)
-        self._locks: dict[Interface, AbstractAsyncContextManager] = {}
-
-    @overload
-    async def get(self, interface: type[V]) -> V:
-        """Specific type annotation for classes."""
+        self._options = options or ContainerOptions()
+        self._locks: dict[int, AbstractAsyncContextManager] = {}
+        self.task_pool: TaskContainerPool[TaskContainer] = TaskContainerPool(
+            lambda pool: TaskContainer(
+                self._container, self._contextualized, pool, self._options.ambient
+            ),
+            self._options.task_pool_size,
+        )
+        if self._options.concurrent_teardown:
+            self._use_graph_teardown(self._options.teardown_timeout)
 
-    @overload
-    async def get(self, interface: Callable) -> Callable:
-        """Specific type annotation for functions."""
+    async def init(self) -> None:
+        if self._options.concurrent_init:
+            await self._init_concurrently()
+        else:
+            await super().init()
 
-    async def get(self, interface: Interface) -> Any:
-        if provided := self._provided.get(interface):
+    async def _get_or_provide(
+        self,
+        step: ResolutionStep,
+        values: list[Any],
+        stack: AsyncExitStack | None = None,
+    ) -> Any:
+        """Lock each interface so that concurrent tasks do not provide it twice."""
+        provided = self._get_provided(step.slot)
+        if provided is not MISSING:
             return provided
-        if interface not in self._locks:
-            self._locks[interface] = asyncio.Lock()
-        async with self._locks[interface]:
-            return await super().get(interface)
+        if step.slot not in self._locks:
+            self._locks[step.slot] = asyncio.Lock()
+        async with self._locks[step.slot]:
+            return await super()._get_or_provide(step, values, stack)
 
     def task_context(self) -> "TaskContainer":
         """Spawn registries for each task."""
-        return TaskContainer(self._container, self._contextualized)
+        return self.task_pool.acquire()
 
 
 class SyncThreadContainer(SyncContextualizedContainer):
     CONTEXT = Context.THREAD
 
+    def __init__(
+        self,
+        container: InternalContainer,
+        contextualized: dict[Context, "SyncContextualizedContainer"],
+        options: ContainerOptions | None = None,
+    ):
+        super().__init__(container, contextualized)
+        self._options = options or ContainerOptions()
+        self.task_pool: TaskContainerPool[SyncTaskContainer] = TaskContainerPool(
+            lambda pool: SyncTaskContainer(
+                self._container, self._contextualized, pool, self._options.ambient
+            ),
+            self._options.task_pool_size,
+        )
+
     def task_context(self) -> SyncTaskContainer:
         """Spawn registries for each task."""
-        return SyncTaskContainer(self._container, self._contextualized)
+        return self.task_pool.acquire()
@@ -1,11 +1,14 @@
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 Interface = type | Callable
 
+# Marks a dependency that has not been provided yet, provided values can be falsy.
+MISSING: Any = object()
 
-@dataclass
+
+@dataclass(slots=True)
 class SubDependency:
     """Internally specify sub dependencies."""
 
@@ -20,6 +23,10 @@ class SubDependency:
     # This is explicitly not named `optional` to avoid confusion with
     # `Optional` type annotation that means nullable.
     mandatory: bool = True
+    # Annotated with `Lazy[T]`, a handle providing the dependency on first use is injected.
+    lazy: bool = False
+    # Annotated with `Factory[T]`, a handle creating new instances is injected.
+    factory: bool = False
 
 
 T = TypeVar("T", bound=Interface)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from imbue.contexts.factory import FactoryContainer, SyncFactoryContainer
+    from imbue.dependency import Interface
+
+T = TypeVar("T")
+
+
+class Factory(Generic[T]):
+    """Annotate a dependency with `Factory[T]` to create new instances of `T` by calling it.
+    `T` must be a factory dependency, its sub dependencies are provided on the first call
+    and reused by the next ones, so that each call only creates the instance.
+    """
+
+    __slots__ = ("_awaitable", "_call", "_container", "_interface")
+
+    def __init__(self, container: FactoryContainer, interface: Interface):
+        self._container = container
+        self._interface = interface
+        self._call: Callable[[], Any] | None = None
+        self._awaitable = False
+
+    async def __call__(self) -> T:
+        if self._call is None:
+            self._call, self._awaitable = await self._container.prepare(self._interface)
+        if self._awaitable:
+            return await self._call()
+        return self._call()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._interface})"
+
+
+class SyncFactory(Generic[T]):
+    """Sync version of Factory."""
+
+    __slots__ = ("_call", "_container", "_interface")
+
+    def __init__(self, container: SyncFactoryContainer, interface: Interface):
+        self._container = container
+        self._interface = interface
+        self._call: Callable[[], Any] | None = None
+
+    def __call__(self) -> T:
+        if self._call is None:
+            self._call = self._container.prepare(self._interface)
+        return self._call()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._interface})"
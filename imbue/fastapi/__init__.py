@@ -1,2 +1,2 @@
 from imbue.fastapi.app import app_lifespan
-from imbue.fastapi.request import Dependency, request_lifespan
+from imbue.fastapi.request import Dependency, inject, request_lifespan
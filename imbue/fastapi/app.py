@@ -12,6 +12,13 @@ class State(TypedDict):
 
 def app_lifespan(
     container: Container,
+    task_pool_size: int = 0,
+    ambient: bool = False,
+    concurrent_init: bool = False,
+    concurrent_teardown: bool = False,
+    teardown_timeout: float | None = None,
+    cache_size: int | None = None,
+    max_scopes: int | None = None,
 ) -> Callable[[Any], AbstractAsyncContextManager[State]]:
     @asynccontextmanager
     async def _lifespan(_) -> AsyncIterator[State]:
@@ -20,8 +27,22 @@ def app_lifespan(
         For more details, see
             - https://fastapi.tiangolo.com/advanced/events
             - https://www.starlette.io/lifespan/.
+        Request containers are recycled if `task_pool_size` is set.
+        In `ambient` mode, dependencies can be fetched with `imbue.get` while handling requests.
+        With `concurrent_init`, independent eager dependencies are inited concurrently.
+        With `concurrent_teardown`, resources are cleaned up concurrently following the graph.
+        Up to `cache_size` cached dependencies are kept, the least recently used are evicted first.
+        Likewise, up to `max_scopes` scopes are kept.
         """
-        async with container.application_context() as app_container:
+        async with container.application_context(
+            task_pool_size=task_pool_size,
+            ambient=ambient,
+            concurrent_init=concurrent_init,
+            concurrent_teardown=concurrent_teardown,
+            teardown_timeout=teardown_timeout,
+            cache_size=cache_size,
+            max_scopes=max_scopes,
+        ) as app_container:
             yield {"app_container": app_container}
 
     return _lifespan
@@ -1,9 +1,13 @@
-from collections.abc import AsyncIterator
-from typing import Annotated, Any
+import functools
+import inspect
+from collections.abc import AsyncIterator, Callable
+from typing import Annotated, Any, get_args, get_origin, get_type_hints
 
 from fastapi.params import Depends
 from fastapi.requests import HTTPConnection
+from starlette.concurrency import run_in_threadpool
 
+from imbue.asgi import TASK_CONTAINER_KEY
 from imbue.contexts.task import TaskContainer
 from imbue.dependency import Interface
 
@@ -14,7 +18,11 @@ async def _task_container(connection: HTTPConnection) -> AsyncIterator[TaskConta
     For more details, see:
         - https://fastapi.tiangolo.com/tutorial/dependencies/global-dependencies/
         - https://fastapi.tiangolo.com/tutorial/dependencies/
+    The task container opened by `imbue.asgi.ImbueMiddleware` is reused if installed.
     """
+    if TASK_CONTAINER_KEY in connection.scope:
+        yield connection.scope[TASK_CONTAINER_KEY]
+        return
     async with connection.state.app_container.task_context() as container:
         yield container
 
@@ -28,3 +36,68 @@ class Dependency(Depends):
             return await container.get(interface)
 
         super().__init__(_get, use_cache=False)
+        # Keep the interface for `inject`, `Depends` can be a frozen dataclass.
+        object.__setattr__(self, "interface", interface)
+
+
+# Name of the parameter replacing injected parameters, unlikely to collide.
+_CONTAINER_PARAMETER = "_imbue_task_container"
+
+
+def _get_interface(annotation: Any) -> Interface | None:
+    """Get the interface from an `Annotated[..., Dependency(...)]` annotation."""
+    if get_origin(annotation) is not Annotated:
+        return None
+    for metadata in get_args(annotation)[1:]:
+        if isinstance(metadata, Dependency):
+            return metadata.interface
+    return None
+
+
+def inject(endpoint: Callable) -> Callable:
+    """Resolve all `Dependency` parameters of an endpoint in a single FastAPI dependency.
+    The endpoint is inspected once, injected parameters are hidden from FastAPI
+    and provided with a single resolution plan from the task container.
+    """
+    hints = get_type_hints(endpoint, include_extras=True)
+    signature = inspect.signature(endpoint)
+    injected: dict[str, Interface] = {}
+    parameters: list[inspect.Parameter] = []
+    for parameter in signature.parameters.values():
+        # Use resolved annotations so that FastAPI does not need the endpoint's globals.
+        annotation = hints.get(parameter.name, parameter.annotation)
+        interface = _get_interface(annotation)
+        if interface is not None:
+            injected[parameter.name] = interface
+        else:
+            parameters.append(parameter.replace(annotation=annotation))
+    names = tuple(injected)
+    interfaces = tuple(injected.values())
+    is_coroutine = inspect.iscoroutinefunction(endpoint)
+
+    @functools.wraps(endpoint)
+    async def _wrapper(**kwargs: Any) -> Any:
+        container: TaskContainer = kwargs.pop(_CONTAINER_PARAMETER)
+        if interfaces:
+            kwargs.update(
+                zip(names, await container.get_many(*interfaces), strict=True)
+            )
+        if is_coroutine:
+            return await endpoint(**kwargs)
+        return await run_in_threadpool(endpoint, **kwargs)
+
+    container_parameter = inspect.Parameter(
+        _CONTAINER_PARAMETER,
+        inspect.Parameter.KEYWORD_ONLY,
+        annotation=Annotated[TaskContainer, request_lifespan],
+    )
+    # Keyword only parameters must be before variadic keyword ones.
+    if parameters and parameters[-1].kind is inspect.Parameter.VAR_KEYWORD:
+        parameters.insert(-1, container_parameter)
+    else:
+        parameters.append(container_parameter)
+    _wrapper.__signature__ = signature.replace(  # ty: ignore[unresolved-attribute]
+        parameters=parameters,
+        return_annotation=hints.get("return", signature.return_annotation),
+    )
+    return _wrapper
@@ -0,0 +1,242 @@
+import contextlib
+import math
+import random
+import time
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from imbue.contexts.base import Context
+from imbue.dependency import Interface
+
+
+class EventKind(Enum):
+    PROVIDE_START = "provide_start"
+    # Carries the time taken to provide, including entering context managers.
+    PROVIDE_END = "provide_end"
+    # Already provided dependency reused.
+    CACHE_HIT = "cache_hit"
+    # Context manager entered or exited, carries the time taken.
+    ENTER = "enter"
+    EXIT = "exit"
+    # Contextualized container closed, carries the time taken to clean up all its resources.
+    TEARDOWN = "teardown"
+
+
+@dataclass(frozen=True)
+class Event:
+    kind: EventKind
+    # Not set for teardown events.
+    interface: Interface | None
+    context: Context
+    # In seconds, not set for start and cache hit events.
+    duration: float | None = None
+    # Raised while providing, for end events.
+    error: BaseException | None = None
+
+
+Hook = Callable[[Event], None]
+
+
+def emit(hooks: Sequence[Hook], event: Event) -> None:
+    for hook in hooks:
+        hook(event)
+
+
+def emit_quietly(hooks: Sequence[Hook], event: Event) -> None:
+    """Emit while an error is raised, errors of hooks must not replace it."""
+    for hook in hooks:
+        with contextlib.suppress(Exception):
+            hook(event)
+
+
+class ObservedAsyncContextManager(AbstractAsyncContextManager):
+    """Emit events when entering and exiting the wrapped context manager."""
+
+    def __init__(
+        self,
+        manager: AbstractAsyncContextManager,
+        hooks: Sequence[Hook],
+        interface: Interface,
+        context: Context,
+    ):
+        self._manager = manager
+        self._hooks = hooks
+        self._interface = interface
+        self._context = context
+
+    async def __aenter__(self) -> Any:
+        start = time.perf_counter()
+        try:
+            entered = await self._manager.__aenter__()
+        except BaseException:
+            self._emit(EventKind.ENTER, start, emit_quietly)
+            raise
+        self._emit(EventKind.ENTER, start)
+        return entered
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool | None:
+        start = time.perf_counter()
+        try:
+            suppress = await self._manager.__aexit__(exc_type, exc_val, exc_tb)
+        except BaseException:
+            self._emit(EventKind.EXIT, start, emit_quietly)
+            raise
+        # Errors of hooks must not replace the one being raised.
+        self._emit(
+            EventKind.EXIT, start, emit_quietly if exc_val and not suppress else emit
+        )
+        return suppress
+
+    def _emit(
+        self,
+        kind: EventKind,
+        start: float,
+        emitter: Callable[[Sequence[Hook], Event], None] = emit,
+    ) -> None:
+        emitter(
+            self._hooks,
+            Event(kind, self._interface, self._context, time.perf_counter() - start),
+        )
+
+
+class ObservedContextManager(AbstractContextManager):
+    """Sync version of ObservedAsyncContextManager."""
+
+    def __init__(
+        self,
+        manager: AbstractContextManager,
+        hooks: Sequence[Hook],
+        interface: Interface,
+        context: Context,
+    ):
+        self._manager = manager
+        self._hooks = hooks
+        self._interface = interface
+        self._context = context
+
+    def __enter__(self) -> Any:
+        start = time.perf_counter()
+        try:
+            entered = self._manager.__enter__()
+        except BaseException:
+            self._emit(EventKind.ENTER, start, emit_quietly)
+            raise
+        self._emit(EventKind.ENTER, start)
+        return entered
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool | None:
+        start = time.perf_counter()
+        try:
+            suppress = self._manager.__exit__(exc_type, exc_val, exc_tb)
+        except BaseException:
+            self._emit(EventKind.EXIT, start, emit_quietly)
+            raise
+        # Errors of hooks must not replace the one being raised.
+        self._emit(
+            EventKind.EXIT, start, emit_quietly if exc_val and not suppress else emit
+        )
+        return suppress
+
+    def _emit(
+        self,
+        kind: EventKind,
+        start: float,
+        emitter: Callable[[Sequence[Hook], Event], None] = emit,
+    ) -> None:
+        emitter(
+            self._hooks,
+            Event(kind, self._interface, self._context, time.perf_counter() - start),
+        )
+
+
+@dataclass(frozen=True)
+class ProviderStats:
+    calls: int
+    cache_hits: int
+    # Time taken to provide, in seconds.
+    # Percentiles are estimated from a sample when there are more calls than its size.
+    p50: float
+    p99: float
+    total: float
+    min: float = 0.0
+    max: float = 0.0
+
+
+@dataclass
+class _Timings:
+    calls: int = 0
+    total: float = 0.0
+    min: float = math.inf
+    max: float = 0.0
+    # Uniform sample of the durations.
+    sample: list[float] = field(default_factory=list)
+
+
+class TimingAggregator:
+    """Hook aggregating provide durations per interface in memory.
+    Memory is bounded: only running totals and a sample of `sample_size` durations
+    per interface are kept, to estimate percentiles.
+    """
+
+    def __init__(self, sample_size: int = 1024):
+        self.sample_size = sample_size
+        self._timings: dict[Interface, _Timings] = defaultdict(_Timings)
+        self._cache_hits: dict[Interface, int] = defaultdict(int)
+        self._random = random.Random()
+
+    def __call__(self, event: Event) -> None:
+        if event.interface is None:
+            return
+        if event.kind is EventKind.PROVIDE_END and event.duration is not None:
+            self._add(self._timings[event.interface], event.duration)
+        elif event.kind is EventKind.CACHE_HIT:
+            self._cache_hits[event.interface] += 1
+
+    def _add(self, timings: _Timings, duration: float) -> None:
+        timings.calls += 1
+        timings.total += duration
+        timings.min = min(timings.min, duration)
+        timings.max = max(timings.max, duration)
+        # Reservoir sampling, each duration has the same chance to be kept.
+        if len(timings.sample) < self.sample_size:
+            timings.sample.append(duration)
+        else:
+            i = self._random.randrange(timings.calls)
+            if i < self.sample_size:
+                timings.sample[i] = duration
+
+    def get_stats(self, interface: Interface) -> ProviderStats:
+        timings = self._timings.get(interface, _Timings())
+        sample = sorted(timings.sample)
+        return ProviderStats(
+            calls=timings.calls,
+            cache_hits=self._cache_hits.get(interface, 0),
+            p50=_percentile(sample, 50),
+            p99=_percentile(sample, 99),
+            total=timings.total,
+            min=timings.min if timings.calls else 0.0,
+            max=timings.max,
+        )
+
+    def summary(self) -> dict[Interface, ProviderStats]:
+        """Stats of all observed interfaces, slowest first."""
+        stats = {
+            interface: self.get_stats(interface)
+            for interface in {*self._timings, *self._cache_hits}
+        }
+        return dict(sorted(stats.items(), key=lambda item: item[1].total, reverse=True))
+
+    def clear(self) -> None:
+        self._timings.clear()
+        self._cache_hits.clear()
+
+
+def _percentile(durations: list[float], percent: float) -> float:
+    """Nearest-rank percentile of sorted durations."""
+    if not durations:
+        return 0.0
+    return durations[max(math.ceil(percent / 100 * len(durations)), 1) - 1]
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from imbue.dependency import MISSING
+
+if TYPE_CHECKING:
+    from imbue.contexts.abstract import (
+        ContextualizedContainer,
+        SyncContextualizedContainer,
+    )
+    from imbue.dependency import Interface
+
+T = TypeVar("T")
+
+
+class Lazy(Generic[T]):
+    """Annotate a dependency with `Lazy[T]` to only provide it when first used.
+    The handle provides it from the container of its dependent,
+    so that its resources are cleaned up with the same context.
+    """
+
+    __slots__ = ("_container", "_interface", "_value")
+
+    def __init__(self, container: ContextualizedContainer, interface: Interface):
+        self._container = container
+        self._interface = interface
+        self._value: Any = MISSING
+
+    async def get(self) -> T:
+        """Provide the dependency on first call, then return the same one."""
+        if self._value is MISSING:
+            self._value = await self._container.get(self._interface)
+        return self._value  # ty: ignore[invalid-return-type]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._interface})"
+
+
+class SyncLazy(Generic[T]):
+    """Sync version of Lazy."""
+
+    __slots__ = ("_container", "_interface", "_value")
+
+    def __init__(self, container: SyncContextualizedContainer, interface: Interface):
+        self._container = container
+        self._interface = interface
+        self._value: Any = MISSING
+
+    def get(self) -> T:
+        """Provide the dependency on first call, then return the same one."""
+        if self._value is MISSING:
+            self._value = self._container.get(self._interface)
+        return self._value  # ty: ignore[invalid-return-type]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._interface})"
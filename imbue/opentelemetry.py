@@ -0,0 +1,57 @@
+from contextvars import ContextVar, Token
+from typing import Any
+
+from imbue.hooks import Event, EventKind
+
+try:
+    from opentelemetry import context, trace
+except ImportError:  # pragma: no cover
+    context = trace = None  # ty: ignore[invalid-assignment]
+
+# Spans being provided in the current context, linked to their parent.
+_current: ContextVar[tuple[Any, Token, Any] | None] = ContextVar(
+    "imbue_span", default=None
+)
+
+
+def _name(interface: Any) -> str:
+    return getattr(interface, "__qualname__", repr(interface))
+
+
+class TracingHook:
+    """Hook emitting a span for each provided dependency, as a child of the current span.
+    This does nothing if opentelemetry is not installed.
+    """
+
+    def __init__(self, tracer_provider: Any = None):
+        self._tracer = (
+            None
+            if trace is None
+            else trace.get_tracer(__name__, tracer_provider=tracer_provider)
+        )
+
+    def __call__(self, event: Event) -> None:
+        if self._tracer is None:
+            return
+        if event.kind is EventKind.PROVIDE_START:
+            name = _name(event.interface)
+            span = self._tracer.start_span(
+                f"provide {name}",
+                attributes={
+                    "imbue.interface": name,
+                    "imbue.context": event.context.name,
+                },
+            )
+            token = context.attach(trace.set_span_in_context(span))
+            _current.set((span, token, _current.get()))
+        elif event.kind is EventKind.PROVIDE_END:
+            current = _current.get()
+            if current is None:
+                return
+            span, token, parent = current
+            _current.set(parent)
+            context.detach(token)
+            if event.error is not None:
+                span.record_exception(event.error)
+                span.set_status(trace.StatusCode.ERROR)
+            span.end()
@@ -1,4 +1,3 @@
-import inspect
 from collections.abc import Iterable, Iterator
 from typing import ClassVar
 
@@ -18,6 +17,40 @@ class Package:
     """
 
     EXTRA_DEPENDENCIES: ClassVar[Iterable[Dependency | ContextualizedDependency]] = ()
+    # Provider methods by name, with the class defining them, collected when the class is defined.
+    _PROVIDERS: ClassVar[dict[str, tuple[type, DelegatedProviderWrapper]]] = {}
+    # Number of attributes of each class of the MRO once collected, to find new ones.
+    _SIZES: ClassVar[tuple[int, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._collect()
+
+    @classmethod
+    def _collect(cls) -> None:
+        """Collect provider methods by name, from the namespaces of the class and its bases.
+        Attributes are not evaluated, so properties are not called.
+        """
+        providers: dict[str, tuple[type, DelegatedProviderWrapper]] = {}
+        # Walk from the base classes so that overrides win.
+        for klass in reversed(cls.__mro__):
+            for name, member in vars(klass).items():
+                if isinstance(member, DelegatedProviderWrapper):
+                    providers[name] = (klass, member)
+                else:
+                    providers.pop(name, None)
+        cls._PROVIDERS = dict(sorted(providers.items()))
+        # Set before measuring, so that it is counted.
+        cls._SIZES = ()
+        cls._SIZES = _sizes(cls)
+
+    @classmethod
+    def _collected(cls) -> bool:
+        """Check that no attribute was added and no provider replaced or removed since collected."""
+        return cls._SIZES == _sizes(cls) and all(
+            vars(klass).get(name) is wrapper
+            for name, (klass, wrapper) in cls._PROVIDERS.items()
+        )
 
     def get_providers(self) -> Iterator[ContextualizedProvider]:
         for dependency in self.EXTRA_DEPENDENCIES:
@@ -25,8 +58,29 @@ class Package:
                 yield from dependency.get_providers()
             else:
                 yield from ContextualizedProvider.from_dependency(dependency)
-        for _, member in inspect.getmembers(self):
-            if not isinstance(member, DelegatedProviderWrapper):
-                continue
+        for wrapper in self._get_wrappers():
             # Now that we have an instance to bind, we can get the final provider.
-            yield member.to_contextualized_provider(instance=self)
+            yield wrapper.to_contextualized_provider(instance=self)
+
+    def _get_wrappers(self) -> list[DelegatedProviderWrapper]:
+        """Get provider methods by name, collected when the class is defined.
+        As a fallback, they are collected again if attributes were assigned to the class since,
+        and the ones assigned to the instance override them.
+        """
+        cls = type(self)
+        if not cls._collected():
+            cls._collect()
+        wrappers = {name: wrapper for name, (_, wrapper) in cls._PROVIDERS.items()}
+        namespace = getattr(self, "__dict__", None)
+        if not namespace:
+            return list(wrappers.values())
+        for name, member in namespace.items():
+            if isinstance(member, DelegatedProviderWrapper):
+                wrappers[name] = member
+            else:
+                wrappers.pop(name, None)
+        return [wrappers[name] for name in sorted(wrappers)]
+
+
+def _sizes(cls: type) -> tuple[int, ...]:
+    return tuple(len(vars(klass)) for klass in cls.__mro__)
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+
+from imbue.contexts.base import Context, ContextualizedProvider
+from imbue.dependency import Interface
+
+
+@dataclass(frozen=True)
+class ResolutionStep:
+    """A single provider call in a resolution plan."""
+
+    provider: ContextualizedProvider
+    # The context in which the dependency will be provided and stored.
+    context: Context
+    # The arguments to pass to the provider, as pairs of name and index of the step providing it.
+    arguments: tuple[tuple[str, int], ...]
+    # Index assigned to the provider at build time, used to store the provided dependency.
+    slot: int
+    # The lazy arguments, as pairs of name and interface, provided on first use.
+    lazy: tuple[tuple[str, Interface], ...] = ()
+    # The factory handles, as pairs of name and interface, prepared on first call.
+    factories: tuple[tuple[str, Interface], ...] = ()
+
+    @property
+    def interface(self) -> Interface:
+        return self.provider.interface
+
+
+@dataclass(frozen=True)
+class ResolutionPlan:
+    """Flat, topologically ordered, list of steps to provide interfaces.
+    Each step only depends on previous steps.
+    Steps are shared between dependencies except in the factory context,
+    where each dependent gets its own instance.
+    """
+
+    steps: tuple[ResolutionStep, ...]
+    # Indexes of the steps providing the requested interfaces.
+    targets: tuple[int, ...]
+    # Groups of independent steps, each group only depends on previous ones.
+    levels: tuple[tuple[int, ...], ...] = ()
+    # Resolve independent steps concurrently, for async containers.
+    concurrent: bool = False
+
+    @property
+    def target(self) -> ResolutionStep:
+        """Get the step providing the first requested interface."""
+        return self.steps[self.targets[0]]
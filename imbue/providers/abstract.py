@@ -20,7 +20,7 @@ A = TypeVar("A", bound=bool)
 Provided: TypeAlias = V | AbstractContextManager[V] | AbstractAsyncContextManager[V]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ProviderResult(Generic[V, A]):
     provided: Final[V | Awaitable[V]]
     awaitable: Final[A]
@@ -36,6 +36,11 @@ class Provider(Generic[T, V], ABC):
     The role of the provider is to expose sub dependencies and provide the dependencies given sub dependencies.
     """
 
+    # The provided value has to be awaited.
+    awaitable: bool = False
+    # The provided value is a context manager to enter.
+    is_context_manager: bool = False
+
     def __init__(self, interface: T):
         self.interface: T = interface
 
@@ -45,8 +50,14 @@ class Provider(Generic[T, V], ABC):
         """Get the dependencies from the interface."""
 
     @abstractmethod
+    def provide(self, **dependencies: Any) -> Provided[V] | Awaitable[Provided[V]]:
+        """Provide the dependency for the interface, to be awaited if `awaitable`."""
+
     def get(self, **dependencies: Any) -> AnyProviderResult[Provided[V]]:
-        """Provide the dependency for the interface."""
+        """Provide the dependency for the interface, wrapped with how to handle it."""
+        return _ProviderResult(  # ty: ignore[invalid-return-type]
+            self.provide(**dependencies), awaitable=self.awaitable
+        )
 
     def __repr__(self) -> str:
         return f"{type(self)}(interface={self.interface})"
@@ -2,11 +2,27 @@ from collections.abc import Callable, Iterator
 from typing import Any
 
 from imbue.dependency import SubDependency
-from imbue.providers.abstract import Provider, ProviderResult, _ProviderResult
-from imbue.utils import get_annotations, partial
+from imbue.providers.abstract import Provider
+from imbue.utils import PartialTemplate, get_annotations
 
 
-class FunctionProvider(Provider[Callable, Callable]):
+class _PartialProvider(Provider[Callable, Callable]):
+    """Provide partials, caching their templates to only introspect once."""
+
+    def __init__(self, interface: Callable):
+        super().__init__(interface)
+        # Injected names are the same on each call, keep a template for each set.
+        self._templates: dict[tuple[str, ...], PartialTemplate] = {}
+
+    def _partial(self, func: Callable, dependencies: dict[str, Any]) -> Callable:
+        names = tuple(dependencies)
+        template = self._templates.get(names)
+        if template is None:
+            template = self._templates[names] = PartialTemplate(func, names)
+        return template.bind(func, dependencies)
+
+
+class FunctionProvider(_PartialProvider):
     """Automatically enrich function arguments with dependencies."""
 
     @property
@@ -18,13 +34,19 @@ class FunctionProvider(Provider[Callable, Callable]):
             # Make all dependencies optional for functions,
             # this will allow to pass other arguments in functions being injected.
             # This will be equivalent to using partial with dependencies already passed.
-            yield SubDependency(name, annotation.annotation, mandatory=False)
+            yield SubDependency(
+                name,
+                annotation.interface,
+                mandatory=False,
+                lazy=annotation.lazy,
+                factory=annotation.factory,
+            )
 
-    def get(self, **dependencies: Any) -> ProviderResult[Callable]:
-        return _ProviderResult(partial(self.interface, **dependencies), awaitable=False)
+    def provide(self, **dependencies: Any) -> Callable:
+        return self._partial(self.interface, dependencies)
 
 
-class MethodProvider(Provider[Callable, Callable]):
+class MethodProvider(_PartialProvider):
     """The class is instantiated with dependencies and the bound method is returned."""
 
     def __init__(self, func: Callable, cls: type):
@@ -43,11 +65,17 @@ class MethodProvider(Provider[Callable, Callable]):
             # Make all dependencies optional for functions,
             # this will allow to pass other arguments in functions being injected.
             # This will be equivalent to using partial with dependencies already passed.
-            yield SubDependency(name, annotation.annotation, mandatory=False)
+            yield SubDependency(
+                name,
+                annotation.interface,
+                mandatory=False,
+                lazy=annotation.lazy,
+                factory=annotation.factory,
+            )
 
-    def get(self, **dependencies: Any) -> ProviderResult[Callable]:
+    def provide(self, **dependencies: Any) -> Callable:
         instance = dependencies.pop("__instance__")
-        return _ProviderResult(
-            partial(getattr(instance, self.interface.__name__), **dependencies),  # ty: ignore[unresolved-attribute]
-            awaitable=False,
+        return self._partial(
+            getattr(instance, self.interface.__name__),  # ty: ignore[unresolved-attribute]
+            dependencies,
         )
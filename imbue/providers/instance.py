@@ -1,20 +1,16 @@
 import inspect
-from collections.abc import Callable, Iterator
+from collections.abc import Awaitable, Callable, Iterator
 from typing import (
     Any,
     Generic,
     TypeVar,
-    cast,
     get_args,
 )
 
 from imbue.dependency import Interfaced, SubDependency
 from imbue.providers.abstract import (
-    AsyncProviderResult,
     Provided,
     Provider,
-    ProviderResult,
-    _ProviderResult,
 )
 from imbue.utils import get_annotations
 
@@ -31,10 +27,16 @@ class InstanceProvider(Provider[type[C], C], Generic[C]):
             with_return=False,
             with_instance=False,
         ).items():
-            yield SubDependency(name, annotation.annotation, annotation.mandatory)
+            yield SubDependency(
+                name,
+                annotation.interface,
+                annotation.mandatory,
+                annotation.lazy,
+                annotation.factory,
+            )
 
-    def get(self, **dependencies: Any) -> ProviderResult[C]:
-        return _ProviderResult(self.interface(**dependencies), awaitable=False)
+    def provide(self, **dependencies: Any) -> C:
+        return self.interface(**dependencies)
 
 
 class InterfacedInstanceProvider(Provider[type[C], C], Generic[C]):
@@ -51,10 +53,16 @@ class InterfacedInstanceProvider(Provider[type[C], C], Generic[C]):
             with_return=False,
             with_instance=False,
         ).items():
-            yield SubDependency(name, annotation.annotation, annotation.mandatory)
+            yield SubDependency(
+                name,
+                annotation.interface,
+                annotation.mandatory,
+                annotation.lazy,
+                annotation.factory,
+            )
 
-    def get(self, **dependencies: Any) -> ProviderResult[C]:
-        return _ProviderResult(self.implementation(**dependencies), awaitable=False)
+    def provide(self, **dependencies: Any) -> C:
+        return self.implementation(**dependencies)
 
 
 class DelegatedInstanceProvider(Provider[type[C], C], Generic[C]):
@@ -66,20 +74,15 @@ class DelegatedInstanceProvider(Provider[type[C], C], Generic[C]):
         is_context_manager: bool,
     ):
         self._provider_func = provider_func
-        self._awaitable: bool = False
         self.is_context_manager = is_context_manager
 
         # Get the proper return type and provider func based on different cases.
         # In case it's a generator, wrap in a context manager and get the underlying return type.
-        return_annotation: type[C]
+        return_annotation: type[C] = get_annotations(provider_func)["return"].annotation
         if is_context_manager:
-            return_annotation, *_ = get_args(
-                get_annotations(provider_func)["return"].annotation
-            )
-        else:
-            return_annotation = get_annotations(provider_func)["return"].annotation
-            if inspect.iscoroutinefunction(provider_func):
-                self._awaitable = True
+            return_annotation, *_ = get_args(return_annotation)
+        elif inspect.iscoroutinefunction(provider_func):
+            self.awaitable = True
         super().__init__(return_annotation)
 
     @property
@@ -89,13 +92,13 @@ class DelegatedInstanceProvider(Provider[type[C], C], Generic[C]):
             with_return=False,
             with_instance=False,
         ).items():
-            yield SubDependency(name, annotation.annotation, annotation.mandatory)
-
-    def get(self, **dependencies: Any) -> AsyncProviderResult[Provided[C]]:
-        return cast(
-            AsyncProviderResult[Provided[C]],
-            _ProviderResult(
-                self._provider_func(**dependencies),
-                awaitable=self._awaitable,
-            ),
-        )
+            yield SubDependency(
+                name,
+                annotation.interface,
+                annotation.mandatory,
+                annotation.lazy,
+                annotation.factory,
+            )
+
+    def provide(self, **dependencies: Any) -> Provided[C] | Awaitable[Provided[C]]:
+        return self._provider_func(**dependencies)
@@ -0,0 +1,162 @@
+import contextlib
+import hashlib
+import inspect
+import json
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from imbue.contexts.base import Context, ContextualizedProvider
+from imbue.dependency import Interface, SubDependency
+
+# Bump when the format changes, older snapshots are then considered stale.
+VERSION = 3
+
+
+def qualified_name(interface: Interface) -> str:
+    """Name identifying an interface in a snapshot."""
+    qualname = getattr(interface, "__qualname__", None)
+    if qualname is None:
+        return repr(interface)
+    return f"{interface.__module__}.{qualname}"
+
+
+def _definitions(provider: ContextualizedProvider) -> Iterator[Any]:
+    """Objects whose source defines the provider and its sub dependencies.
+    Classes come with their bases, which can define the inherited `__init__`.
+    """
+    definitions = [provider.interface]
+    for attribute in ("implementation", "_provider_func", "_cls"):
+        definition = getattr(provider.provider, attribute, None)
+        if definition is not None:
+            definitions.append(definition)
+    for definition in definitions:
+        if isinstance(definition, type):
+            yield from definition.__mro__
+        else:
+            yield definition
+
+
+def _module_digest(name: str) -> bytes:
+    """Hash of the source of a module, only its name if it does not have a file."""
+    module = sys.modules.get(name)
+    path = getattr(module, "__file__", None)
+    if path is None:
+        return name.encode()
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).digest()
+    except OSError:
+        return name.encode()
+
+
+def snapshot_key(providers: Iterable[ContextualizedProvider]) -> str:
+    """Hash of the declared providers and the source of the modules defining them.
+    Source files are read on each call, providers must already be built.
+    """
+    key = hashlib.sha256(f"{VERSION}:{sys.version}".encode())
+    modules: set[str] = set()
+    for provider in providers:
+        context = "" if provider.context is None else provider.context.name
+        key.update(
+            f"{qualified_name(provider.interface)}:{context}:{provider.eager}\n".encode()
+        )
+        for definition in _definitions(provider):
+            module = inspect.getmodule(definition)
+            if module is not None:
+                modules.add(module.__name__)
+    for name in sorted(modules):
+        key.update(name.encode())
+        key.update(_module_digest(name))
+    return key.hexdigest()
+
+
+@dataclass
+class ProviderSnapshot:
+    interface: Interface
+    # Inferred if it was not set.
+    context: Context
+    eager: bool
+    # Only the sub dependencies that have a provider.
+    sub_dependencies: list[SubDependency]
+
+
+@dataclass
+class GraphSnapshot:
+    """Validated graph of sub dependencies, in resolution order."""
+
+    key: str
+    providers: list[ProviderSnapshot]
+
+    def dump(self, path: str | os.PathLike) -> None:
+        """Write the snapshot atomically, so concurrent processes never read a partial file.
+        It is only a cache, failing to write it is ignored.
+        """
+        data = {
+            "version": VERSION,
+            "key": self.key,
+            "providers": [
+                {
+                    "interface": qualified_name(provider.interface),
+                    "context": provider.context.name,
+                    "eager": provider.eager,
+                    "sub_dependencies": [
+                        [
+                            s.name,
+                            qualified_name(s.interface),
+                            s.mandatory,
+                            s.lazy,
+                            s.factory,
+                        ]
+                        for s in provider.sub_dependencies
+                    ],
+                }
+                for provider in self.providers
+            ],
+        }
+        path = Path(path)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(data))
+            os.replace(tmp, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp.unlink(missing_ok=True)
+
+    @classmethod
+    def load(
+        cls,
+        path: str | os.PathLike,
+        key: str,
+        interfaces: dict[str, Interface],
+    ) -> "GraphSnapshot | None":
+        """Read a snapshot, mapping names back to `interfaces`.
+        Return None if missing, unreadable or stale.
+        """
+        try:
+            data = json.loads(Path(path).read_text())
+            if data["version"] != VERSION or data["key"] != key:
+                return None
+            return cls(
+                key=key,
+                providers=[
+                    ProviderSnapshot(
+                        interface=interfaces[provider["interface"]],
+                        context=Context[provider["context"]],
+                        eager=provider["eager"],
+                        sub_dependencies=[
+                            SubDependency(
+                                name, interfaces[interface], mandatory, lazy, factory
+                            )
+                            for name, interface, mandatory, lazy, factory in provider[
+                                "sub_dependencies"
+                            ]
+                        ],
+                    )
+                    for provider in data["providers"]
+                ],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
@@ -1,29 +1,118 @@
+import contextlib
 import functools
 import inspect
-from collections.abc import Callable
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import (
     Any,
+    NamedTuple,
+    get_args,
+    get_origin,
     get_type_hints,
 )
 
 from imbue.exceptions import DependencyError
+from imbue.factory import Factory, SyncFactory
+from imbue.lazy import Lazy, SyncLazy
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Annotation:
     annotation: Any
     mandatory: bool
 
+    @property
+    def lazy(self) -> bool:
+        """Annotated with `Lazy[T]`, to only provide `T` when first used."""
+        return get_origin(self.annotation) in (Lazy, SyncLazy)
 
-def get_annotations(
-    func: Callable,
-    with_return: bool = True,
-    with_instance: bool = True,
-) -> dict[str, Annotation]:
-    """Wrapper around signature and get_type_hints functions.
-    Note: variadic and positional only parameters are excluded as those make injection risky.
+    @property
+    def factory(self) -> bool:
+        """Annotated with `Factory[T]`, to create new instances of `T`."""
+        return get_origin(self.annotation) in (Factory, SyncFactory)
+
+    @property
+    def interface(self) -> Any:
+        """The annotated dependency, unwrapped if lazy or a factory."""
+        if self.lazy or self.factory:
+            return get_args(self.annotation)[0]
+        return self.annotation
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class AnnotationsCache:
+    """Bounded LRU cache of annotations, shared by all providers.
+    Callables are weakly referenced so entries are dropped when they are garbage collected.
+    An entry is also invalidated if the annotations or signature of the callable are replaced.
     """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._entries: OrderedDict[
+            weakref.ref, tuple[Any, Any, dict[str, Annotation]]
+        ] = OrderedDict()
+
+    def get(
+        self,
+        func: Callable,
+        compute: Callable[[Callable], dict[str, Annotation]],
+    ) -> dict[str, Annotation]:
+        """Get the annotations of the callable, computing them if needed."""
+        try:
+            key = weakref.ref(func)
+        except TypeError:
+            # Some builtins cannot be weakly referenced, those are not cached.
+            self._misses += 1
+            return compute(func)
+        fingerprint = (
+            getattr(func, "__annotations__", None),
+            getattr(func, "__signature__", None),
+        )
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry[0] is fingerprint[0]
+            and entry[1] is fingerprint[1]
+        ):
+            self._hits += 1
+            with contextlib.suppress(KeyError):
+                self._entries.move_to_end(key)
+            return entry[2]
+        self._misses += 1
+        annotations = compute(func)
+        self._entries[weakref.ref(func, self._discard)] = (*fingerprint, annotations)
+        while len(self._entries) > self.maxsize:
+            with contextlib.suppress(KeyError):
+                self._entries.popitem(last=False)
+        return annotations
+
+    def _discard(self, key: weakref.ref) -> None:
+        self._entries.pop(key, None)
+
+    def info(self) -> CacheInfo:
+        """Report cache statistics."""
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """Clear the cache and statistics."""
+        self._entries.clear()
+        self._hits = self._misses = 0
+
+
+annotations_cache = AnnotationsCache()
+
+
+def _get_all_annotations(func: Callable) -> dict[str, Annotation]:
     hints = get_type_hints(func)
     signature = inspect.signature(func)
     annotations = {
@@ -40,41 +129,85 @@ def get_annotations(
             inspect.Parameter.VAR_KEYWORD,
             inspect.Parameter.VAR_POSITIONAL,
         )
-        and (with_instance or p.name not in ("self", "cls"))
     }
-    if with_return:
-        annotations["return"] = Annotation(
-            hints["return"] if "return" in hints else signature.return_annotation,
-            mandatory=False,
-        )
+    annotations["return"] = Annotation(
+        hints["return"] if "return" in hints else signature.return_annotation,
+        mandatory=False,
+    )
     return annotations
 
 
-def partial(func: Callable, **kwargs: Any) -> Callable:
-    """Replacement of `functools.partial` to make it work with type hints.
-    Note: this is just smoke to allow programmatically parsing the signature.
+def get_annotations(
+    func: Callable,
+    with_return: bool = True,
+    with_instance: bool = True,
+) -> dict[str, Annotation]:
+    """Wrapper around signature and get_type_hints functions.
+    Note: variadic and positional only parameters are excluded as those make injection risky.
+    Results are cached in `annotations_cache`.
     """
-    if inspect.iscoroutinefunction(func):
+    return {
+        name: annotation
+        for name, annotation in annotations_cache.get(
+            func, _get_all_annotations
+        ).items()
+        if (with_return or name != "return")
+        and (with_instance or name not in ("self", "cls"))
+    }
 
-        @functools.wraps(func)
-        async def _wrapper(*a, **kw):
-            return await func(*a, **kwargs, **kw)
 
-    else:
+class _Partial(functools.partial):
+    """`functools.partial` exposing the signature and annotations of its template,
+    set once on a subclass for each template.
+    """
 
-        @functools.wraps(func)
-        def _wrapper(*a, **kw):
-            return func(*a, **kwargs, **kw)
+    @property
+    def __wrapped__(self) -> Callable:
+        return self.func
 
-    # Update the annotations and signature of the function to remove injected arguments.
-    _wrapper.__annotations__ = {
-        k: v.annotation for k, v in get_annotations(func).items() if k not in kwargs
-    }
-    signature = inspect.signature(func)
-    _wrapper.__signature__ = signature.replace(  # ty: ignore[invalid-assignment]
-        parameters=[p for p in signature.parameters.values() if p.name not in kwargs],
-    )
-    return _wrapper
+
+class PartialTemplate:
+    """Precomputed signature and annotations for `partial`, given the injected argument names.
+    Binding only creates the partial, avoiding introspection and copies for each call.
+    """
+
+    def __init__(self, func: Callable, names: Iterable[str]):
+        names = frozenset(names)
+        signature = inspect.signature(func)
+        attributes = {
+            name: getattr(func, name)
+            for name in ("__module__", "__name__", "__doc__")
+            if hasattr(func, name)
+        }
+        # Update the annotations and signature of the function to remove injected arguments.
+        self._partial = type(
+            "partial",
+            (_Partial,),
+            {
+                **attributes,
+                "__annotations__": {
+                    k: v.annotation
+                    for k, v in get_annotations(func).items()
+                    if k not in names
+                },
+                "__signature__": signature.replace(
+                    parameters=[
+                        p for p in signature.parameters.values() if p.name not in names
+                    ],
+                ),
+            },
+        )
+
+    def bind(self, func: Callable, kwargs: dict[str, Any]) -> Callable:
+        """Create the partial, `func` should have the same signature as the template's."""
+        return self._partial(func, **kwargs)
+
+
+def partial(func: Callable, **kwargs: Any) -> Callable:
+    """Replacement of `functools.partial` to make it work with type hints.
+    Note: this is just smoke to allow programmatically parsing the signature.
+    """
+    return PartialTemplate(func, kwargs).bind(func, kwargs)
 
 
 def extend(
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+import imbue
+from imbue.exceptions import DependencyError
+from tests.contexts.conftest import CMSyncTaskDep, CMTaskDep
+
+
+async def test_ambient_get(container):
+    async def deep_library_code():
+        return await imbue.get(CMTaskDep)
+
+    async with container.application_context(ambient=True) as app_container:
+        async with app_container.task_context() as task_container:
+            assert imbue.current_task_container() is task_container
+            assert await deep_library_code() is await task_container.get(CMTaskDep)
+        with pytest.raises(DependencyError, match="no task container"):
+            await deep_library_code()
+
+
+async def test_ambient_get_concurrent_tasks(container):
+    async with container.application_context(ambient=True) as app_container:
+
+        async def handle():
+            async with app_container.task_context() as task_container:
+                await asyncio.sleep(0)
+                assert imbue.current_task_container() is task_container
+                return await imbue.get(CMTaskDep)
+
+        dep1, dep2 = await asyncio.gather(handle(), handle())
+        assert dep1 is not dep2
+
+
+async def test_ambient_disabled_by_default(container):
+    async with container.application_context() as app_container:
+        async with app_container.task_context():
+            with pytest.raises(DependencyError, match="no task container"):
+                await imbue.get(CMTaskDep)
+
+
+def test_ambient_sync_get(container):
+    with container.sync_application_context(ambient=True) as app_container:
+        with app_container.task_context() as task_container:
+            assert imbue.sync_get(CMSyncTaskDep) is task_container.get(CMSyncTaskDep)
+        with pytest.raises(DependencyError, match="no task container"):
+            imbue.sync_get(CMSyncTaskDep)
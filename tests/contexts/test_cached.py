@@ -0,0 +1,122 @@
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import Mock
+
+import pytest
+
+from imbue import (
+    CacheStats,
+    Container,
+    Context,
+    ContextualizedDependency,
+    Package,
+    cached_context,
+)
+from imbue.exceptions import DependencyError, DependencyResolutionError
+
+CLOSE = Mock()
+
+
+class Config: ...
+
+
+class Keys: ...
+
+
+class Flags: ...
+
+
+class Handler:
+    def __init__(self, keys: Keys):
+        self.keys = keys
+
+
+class CachedPackage(Package):
+    EXTRA_DEPENDENCIES = (Config,)
+
+    @cached_context
+    async def keys(self, config: Config) -> AsyncIterator[Keys]:
+        keys = Keys()
+        yield keys
+        CLOSE(keys)
+
+    @cached_context(ttl=0)
+    def flags(self) -> Flags:
+        return Flags()
+
+
+class SyncCachedPackage(Package):
+    @cached_context
+    def keys(self) -> Iterator[Keys]:
+        keys = Keys()
+        yield keys
+        CLOSE(keys)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks():
+    CLOSE.reset_mock()
+
+
+@pytest.fixture
+def container():
+    return Container(CachedPackage(), Handler)
+
+
+async def test_reused(container):
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            handler = await task_container.get(Handler)
+        async with app_container.task_context() as task_container:
+            assert await task_container.get(Keys) is handler.keys
+        CLOSE.assert_not_called()
+        assert app_container.cache.stats == CacheStats(hits=1, misses=1)
+    CLOSE.assert_called_once_with(handler.keys)
+    assert container.get_provider(Handler).context is Context.TASK
+
+
+async def test_expired(container):
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            flags = await task_container.get(Flags)
+            # Kept for the task.
+            assert await task_container.get(Flags) is flags
+        async with app_container.task_context() as task_container:
+            assert await task_container.get(Flags) is not flags
+        assert app_container.cache.stats.expired == 1
+
+
+async def test_evicted(container):
+    async with container.application_context(cache_size=1) as app_container:
+        async with app_container.task_context() as task_container:
+            keys = await task_container.get(Keys)
+            async with app_container.task_context() as other_task_container:
+                await other_task_container.get(Flags)
+            # Still used by the task.
+            CLOSE.assert_not_called()
+        CLOSE.assert_called_once_with(keys)
+        async with app_container.task_context() as task_container:
+            assert await task_container.get(Keys) is not keys
+        assert app_container.cache.stats.evicted == 2
+
+
+def test_sync():
+    container = Container(SyncCachedPackage())
+    with container.sync_application_context(cache_size=1) as app_container:
+        with app_container.task_context() as task_container:
+            keys = task_container.get(Keys)
+        with app_container.task_context() as task_container:
+            assert task_container.get(Keys) is keys
+        CLOSE.assert_not_called()
+    CLOSE.assert_called_once_with(keys)
+
+
+@pytest.mark.parametrize("context", [Context.THREAD, Context.POOLED])
+def test_dependent_context(context):
+    with pytest.raises(DependencyResolutionError, match="cached dependencies"):
+        Container(CachedPackage(), ContextualizedDependency(Handler, context))
+
+
+async def test_outside_task(container):
+    async with container.application_context() as app_container:
+        with pytest.raises(DependencyError, match="needs a cached container"):
+            await app_container.get(Keys)
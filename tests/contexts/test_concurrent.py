@@ -0,0 +1,177 @@
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+import pytest
+
+from imbue.container import Container
+from imbue.contexts.application import application_context
+from imbue.contexts.base import Context, ContextualizedDependency
+from imbue.contexts.task import task_context
+from imbue.contexts.thread import thread_context
+from imbue.package import Package
+
+
+class ClientA: ...
+
+
+class ClientB: ...
+
+
+class ClientC: ...
+
+
+@dataclass
+class Service:
+    a: ClientA
+    b: ClientB
+    c: ClientC
+
+
+@dataclass
+class Endpoint:
+    service: Service
+
+
+DELAY = 0.05
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+@pytest.fixture
+def package(events):
+    def _client(cls, delay):
+        async def _provide(self) -> AsyncIterator[cls]:
+            events.append(f"enter {cls.__name__}")
+            await asyncio.sleep(delay)
+            events.append(f"ready {cls.__name__}")
+            yield cls()
+            events.append(f"exit {cls.__name__}")
+
+        return task_context(_provide)
+
+    class ClientPackage(Package):
+        # Finish in the reverse order of the plan.
+        a = _client(ClientA, DELAY)
+        b = _client(ClientB, DELAY / 2)
+        c = _client(ClientC, 0)
+
+    return ClientPackage()
+
+
+@pytest.mark.parametrize("per_provider", [False, True])
+async def test_concurrent_resolution(package, events, per_provider):
+    if per_provider:
+        container = Container(
+            package,
+            ContextualizedDependency(Service, Context.TASK, concurrent=True),
+        )
+    else:
+        container = Container(package, Service, concurrent=True)
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            service = await task_container.get(Service)
+            assert isinstance(service.a, ClientA)
+            assert isinstance(service.b, ClientB)
+            assert isinstance(service.c, ClientC)
+    # All clients are entered before any is ready.
+    assert events[:3] == ["enter ClientA", "enter ClientB", "enter ClientC"]
+    # Teardown follows the plan order regardless of completion order.
+    assert events[6:] == ["exit ClientC", "exit ClientB", "exit ClientA"]
+
+
+async def test_concurrent_nested(package, events):
+    container = Container(
+        package,
+        ContextualizedDependency(Service, Context.TASK, concurrent=True),
+        Endpoint,
+    )
+    assert container.get_plan(Endpoint).concurrent
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            await task_container.get(Endpoint)
+    assert events[:3] == ["enter ClientA", "enter ClientB", "enter ClientC"]
+
+
+async def test_concurrent_cancelled(package, events):
+    container = Container(package, Service, concurrent=True)
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            task = asyncio.create_task(task_container.get(Service))
+            # Wait for the client without delay to be entered.
+            while "ready ClientC" not in events:
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+    assert events[-1] == "exit ClientC"
+
+
+async def test_sequential_resolution(package, events):
+    container = Container(package, Service)
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            await task_container.get(Service)
+    # Each client is ready before the next one is entered.
+    assert events[:4] == [
+        "enter ClientA",
+        "ready ClientA",
+        "enter ClientB",
+        "ready ClientB",
+    ]
+
+
+@pytest.mark.parametrize("concurrent_init", [False, True])
+async def test_concurrent_init(events, concurrent_init):
+    class EagerPackage(Package):
+        @application_context(eager=True)
+        async def a(self) -> ClientA:
+            events.append("enter ClientA")
+            await asyncio.sleep(2 * DELAY)
+            events.append("exit ClientA")
+            return ClientA()
+
+        @application_context(eager=True)
+        async def b(self) -> ClientB:
+            events.append("enter ClientB")
+            await asyncio.sleep(0)
+            events.append("exit ClientB")
+            return ClientB()
+
+        @thread_context(eager=True)
+        async def c(self, a: ClientA) -> ClientC:
+            events.append("enter ClientC")
+            return ClientC()
+
+    container = Container(EagerPackage())
+    async with container.application_context(
+        concurrent_init=concurrent_init
+    ) as app_container:
+        if concurrent_init:
+            assert events == [
+                "enter ClientA",
+                "enter ClientB",
+                "exit ClientB",
+                "exit ClientA",
+                "enter ClientC",
+            ]
+            assert set(app_container.init_timings) == {ClientA, ClientB, ClientC}
+            assert (
+                app_container.init_timings[ClientA]
+                > app_container.init_timings[ClientB]
+            )
+        else:
+            assert events == [
+                "enter ClientA",
+                "exit ClientA",
+                "enter ClientB",
+                "exit ClientB",
+                "enter ClientC",
+            ]
+            assert app_container.init_timings == {}
+        # Nothing is provided twice.
+        assert await app_container.get(ClientA) is await app_container.get(ClientA)
@@ -1,9 +1,14 @@
 import asyncio
 import contextlib
+from unittest.mock import Mock
 
 import pytest
 
+from imbue.container import Container
+from imbue.contexts.application import application_context
+from imbue.contexts.base import Context, ContextualizedDependency
 from imbue.exceptions import DependencyError
+from imbue.package import Package
 from tests.contexts.conftest import (
     CMFactoryDep,
     CMSyncApplicationDep,
@@ -97,3 +102,74 @@ class TestRegistry:
         with container.sync_application_context() as application_container:
             with pytest.raises(DependencyError, match="async dependency"):
                 application_container.get(CMThreadDep)
+
+    async def test_falsy_dependency_is_reused(self):
+        class EmptyRegistry:
+            def __len__(self) -> int:
+                return 0
+
+        provide = Mock(side_effect=EmptyRegistry)
+
+        class FalsyPackage(Package):
+            @application_context
+            def registry(self) -> EmptyRegistry:
+                return provide()
+
+        container = Container(FalsyPackage())
+        async with container.application_context() as app_container:
+            registry = await app_container.get(EmptyRegistry)
+            assert not registry
+            async with app_container.task_context() as task_container:
+                assert await task_container.get(EmptyRegistry) is registry
+        provide.assert_called_once()
+
+    async def test_get_many(self, container):
+        async with container.application_context() as app_container:
+            async with app_container.task_context() as task_container:
+                app_dep, task_dep, fact_dep1, fact_dep2 = await task_container.get_many(
+                    CMSyncApplicationDep, CMTaskDep, CMFactoryDep, CMFactoryDep
+                )
+                assert app_dep is await app_container.get(CMSyncApplicationDep)
+                assert task_dep is await task_container.get(CMTaskDep)
+                assert fact_dep1 is not fact_dep2
+
+    async def test_provided_skips_plan(self, container, mocker):
+        async with container.application_context() as app_container:
+            app_dep = await app_container.get(CMSyncApplicationDep)
+            get_plan = mocker.spy(container, "get_plan")
+            async with app_container.task_context() as task_container:
+                assert await task_container.get(CMSyncApplicationDep) is app_dep
+            assert await app_container.get(CMSyncApplicationDep) is app_dep
+            get_plan.assert_not_called()
+
+    def test_sync_provided_skips_plan(self, container, mocker):
+        with container.sync_application_context() as app_container:
+            app_dep = app_container.get(CMSyncApplicationDep)
+            get_plan = mocker.spy(container, "get_plan")
+            with app_container.task_context() as task_container:
+                assert task_container.get(CMSyncApplicationDep) is app_dep
+            assert app_container.get(CMSyncApplicationDep) is app_dep
+            get_plan.assert_not_called()
+
+    async def test_provided_arguments_not_visited(self):
+        class Leaf: ...
+
+        class Node:
+            def __init__(self, leaf: Leaf):
+                self.leaf = leaf
+
+        class Root:
+            def __init__(self, node: Node):
+                self.node = node
+
+        container = Container(
+            Leaf, Node, ContextualizedDependency(Root, Context.FACTORY)
+        )
+        plan = container.get_plan(Root)
+        async with container.application_context() as app_container:
+            async with app_container.task_context() as task_container:
+                root = await task_container.get(Root)
+                values, needed = task_container._prepare(plan)
+        # Only the target and its provided argument are looked up, not the leaf.
+        assert needed == [2]
+        assert values == [None, root.node, None]
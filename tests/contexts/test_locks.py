@@ -0,0 +1,104 @@
+import asyncio
+import threading
+
+from imbue.container import Container
+from imbue.contexts.application import application_context
+from imbue.contexts.locks import HybridLock
+from imbue.package import Package
+
+
+class Slow: ...
+
+
+def make_container(calls: list[Slow]) -> Container:
+    class SlowPackage(Package):
+        @application_context
+        async def slow(self) -> Slow:
+            await asyncio.sleep(0.05)
+            slow = Slow()
+            calls.append(slow)
+            return slow
+
+    return Container(SlowPackage())
+
+
+async def test_hybrid_lock_does_not_block_event_loop():
+    lock = HybridLock()
+    held = threading.Event()
+    release = threading.Event()
+    events: list[str] = []
+
+    def hold():
+        with lock:
+            held.set()
+            # Only times out if the event loop is blocked.
+            release.wait(5)
+            events.append("released")
+
+    async def acquire():
+        async with lock:
+            events.append("acquired")
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    held.wait()
+    task = asyncio.create_task(acquire())
+    await asyncio.sleep(0)
+    # The event loop keeps running while waiting for the thread.
+    events.append("loop running")
+    release.set()
+    await task
+    thread.join()
+    assert events == ["loop running", "released", "acquired"]
+
+
+def test_hybrid_lock_across_threads():
+    lock = HybridLock()
+    inside = 0
+    overlaps = 0
+
+    async def hold():
+        nonlocal inside, overlaps
+        async with lock:
+            inside += 1
+            if inside > 1:
+                overlaps += 1
+            await asyncio.sleep(0.01)
+            inside -= 1
+
+    threads = [threading.Thread(target=asyncio.run, args=(hold(),)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert overlaps == 0
+
+
+async def test_application_singleton_concurrent_tasks():
+    calls: list[Slow] = []
+    async with make_container(calls).application_context() as app_container:
+
+        async def get():
+            async with app_container.task_context() as task_container:
+                return await task_container.get(Slow)
+
+        results = await asyncio.gather(get(), get(), app_container.get(Slow))
+    assert len(calls) == 1
+    assert all(r is calls[0] for r in results)
+
+
+async def test_application_singleton_concurrent_threads():
+    calls: list[Slow] = []
+    async with make_container(calls).application_context() as app_container:
+
+        async def get_in_thread():
+            async with app_container.thread_context() as thread_container:
+                async with thread_container.task_context() as task_container:
+                    return await task_container.get(Slow)
+
+        results = await asyncio.gather(
+            *(asyncio.to_thread(asyncio.run, get_in_thread()) for _ in range(3)),
+            app_container.get(Slow),
+        )
+    assert len(calls) == 1
+    assert all(r is calls[0] for r in results)
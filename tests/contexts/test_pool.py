@@ -0,0 +1,51 @@
+from imbue.contexts.task import TaskPoolStats
+from tests.contexts.conftest import CMFactoryDep, CMSyncTaskDep, CMTaskDep
+
+
+async def test_task_containers_are_recycled(container):
+    async with container.application_context(task_pool_size=1) as app_container:
+        async with app_container.task_context() as task_container:
+            task_dep = await task_container.get(CMTaskDep)
+            fact_dep = await task_container.get(CMFactoryDep)
+        task_dep.close.assert_awaited_once()
+        fact_dep.close.assert_awaited_once()
+        async with app_container.task_context() as recycled:
+            assert recycled is task_container
+            # Provided dependencies are forgotten.
+            assert await recycled.get(CMTaskDep) is not task_dep
+            fact_dep = await recycled.get(CMFactoryDep)
+        fact_dep.close.assert_awaited_once()
+        async with app_container.task_context() as first:
+            async with app_container.task_context() as second:
+                assert second is not first
+        assert app_container.task_pool.stats == TaskPoolStats(
+            hits=2, misses=2, discarded=1
+        )
+
+
+async def test_thread_task_containers_are_recycled(container):
+    async with container.application_context(task_pool_size=1) as app_container:
+        async with app_container.thread_context() as thread_container:
+            async with thread_container.task_context() as task_container:
+                pass
+            async with thread_container.task_context() as recycled:
+                assert recycled is task_container
+
+
+async def test_task_containers_are_not_recycled_by_default(container):
+    async with container.application_context() as app_container:
+        assert app_container.task_pool.max_size == 0
+        async with app_container.task_context() as task_container:
+            pass
+        async with app_container.task_context() as other:
+            assert other is not task_container
+
+
+def test_sync_task_containers_are_recycled(container):
+    with container.sync_application_context(task_pool_size=1) as app_container:
+        with app_container.task_context() as task_container:
+            task_dep = task_container.get(CMSyncTaskDep)
+        task_dep.close.assert_called_once()
+        with app_container.task_context() as recycled:
+            assert recycled is task_container
+            assert recycled.get(CMSyncTaskDep) is not task_dep
@@ -0,0 +1,178 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import Mock
+
+import pytest
+
+from imbue import (
+    Container,
+    Context,
+    ContextualizedDependency,
+    Package,
+    PoolStats,
+    pooled_context,
+    task_context,
+)
+from imbue.exceptions import DependencyError, DependencyResolutionError
+
+RESET = Mock()
+CLOSE = Mock()
+
+
+class Config: ...
+
+
+class Parser:
+    def __init__(self, config: Config):
+        self.config = config
+
+
+class Handler:
+    def __init__(self, parser: Parser):
+        self.parser = parser
+
+
+class Buffer: ...
+
+
+class PooledPackage(Package):
+    EXTRA_DEPENDENCIES = (Config,)
+
+    @pooled_context(size=1, reset=RESET)
+    def parser(self, config: Config) -> Parser:
+        return Parser(config)
+
+    @pooled_context(size=2)
+    async def buffer(self) -> AsyncIterator[Buffer]:
+        yield Buffer()
+        CLOSE()
+
+
+class SyncPooledPackage(Package):
+    EXTRA_DEPENDENCIES = (Config,)
+
+    @pooled_context(size=1, timeout=0.01)
+    def parser(self, config: Config) -> Iterator[Parser]:
+        yield Parser(config)
+        CLOSE()
+
+
+class FailingResetPackage(Package):
+    @pooled_context(size=1, reset=RESET, timeout=0.01)
+    async def buffer(self) -> AsyncIterator[Buffer]:
+        yield Buffer()
+        CLOSE()
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks():
+    RESET.reset_mock(side_effect=True)
+    CLOSE.reset_mock()
+
+
+@pytest.fixture
+def container():
+    return Container(PooledPackage(), Handler)
+
+
+async def test_borrowed_per_task(container):
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            handler = await task_container.get(Handler)
+            assert await task_container.get(Parser) is handler.parser
+            RESET.assert_not_called()
+        RESET.assert_called_once_with(handler.parser)
+        async with app_container.task_context() as task_container:
+            assert await task_container.get(Parser) is handler.parser
+        assert app_container.pools[Parser].stats == PoolStats(created=1, reused=1)
+    assert container.get_provider(Handler).context is Context.TASK
+
+
+async def test_wait_when_exhausted(container):
+    async with container.application_context() as app_container:
+        first = app_container.task_context()
+        await first.__aenter__()
+        parser = await first.get(Parser)
+
+        async def _borrow():
+            async with app_container.task_context() as task_container:
+                return await task_container.get(Parser)
+
+        waiting = asyncio.create_task(_borrow())
+        await asyncio.sleep(0)
+        assert not waiting.done()
+        await first.__aexit__(None, None, None)
+        assert await waiting is parser
+        stats = app_container.pools[Parser].stats
+        assert stats.exhausted == 1
+        assert stats.waited > 0
+
+
+async def test_resources_closed_with_application(container):
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            await task_container.get(Buffer)
+        CLOSE.assert_not_called()
+    CLOSE.assert_called_once()
+
+
+async def test_discarded_closed():
+    RESET.side_effect = [ValueError("broken"), None]
+    container = Container(FailingResetPackage())
+    async with container.application_context() as app_container:
+        with pytest.raises(ValueError, match="broken"):
+            async with app_container.task_context() as task_container:
+                buffer = await task_container.get(Buffer)
+        CLOSE.assert_called_once()
+        async with app_container.task_context() as task_container:
+            assert await task_container.get(Buffer) is not buffer
+        assert app_container.pools[Buffer].stats.discarded == 1
+    assert CLOSE.call_count == 2
+
+
+async def test_acquire_timeout():
+    container = Container(FailingResetPackage())
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            buffer = await task_container.get(Buffer)
+            async with app_container.task_context() as other:
+                with pytest.raises(DependencyError, match="no pooled"):
+                    await other.get(Buffer)
+        # The pool still works once timed out.
+        async with app_container.task_context() as task_container:
+            assert await task_container.get(Buffer) is buffer
+        assert app_container.pools[Buffer].stats.exhausted == 1
+
+
+def test_sync():
+    container = Container(SyncPooledPackage())
+    with container.sync_application_context() as app_container:
+        with app_container.task_context() as task_container:
+            parser = task_container.get(Parser)
+        with app_container.task_context() as task_container:
+            assert task_container.get(Parser) is parser
+            with (
+                app_container.task_context() as other,
+                pytest.raises(DependencyError, match="no pooled"),
+            ):
+                other.get(Parser)
+        CLOSE.assert_not_called()
+    CLOSE.assert_called_once()
+
+
+@pytest.mark.parametrize("context", [Context.THREAD, Context.POOLED])
+def test_dependent_context(context):
+    with pytest.raises(DependencyResolutionError, match="pooled dependencies"):
+        Container(PooledPackage(), ContextualizedDependency(Handler, context))
+
+
+def test_dependency_context():
+    class TaskPackage(PooledPackage):
+        EXTRA_DEPENDENCIES = ()
+
+        @task_context
+        def config(self) -> Config:
+            return Config()
+
+    with pytest.raises(DependencyResolutionError, match="context error"):
+        Container(TaskPackage())
@@ -0,0 +1,134 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import Mock
+
+import pytest
+
+from imbue import (
+    Container,
+    Context,
+    ContextualizedDependency,
+    Package,
+    scope_context,
+)
+from imbue.exceptions import DependencyError, DependencyResolutionError
+
+CLOSE = Mock()
+
+
+class Config: ...
+
+
+class Pool: ...
+
+
+class Handler:
+    def __init__(self, pool: Pool):
+        self.pool = pool
+
+
+class ScopePackage(Package):
+    EXTRA_DEPENDENCIES = (Config,)
+
+    @scope_context
+    async def pool(self, config: Config) -> AsyncIterator[Pool]:
+        pool = Pool()
+        yield pool
+        CLOSE(pool)
+
+
+class SyncScopePackage(Package):
+    @scope_context
+    def pool(self) -> Iterator[Pool]:
+        pool = Pool()
+        yield pool
+        CLOSE(pool)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks():
+    CLOSE.reset_mock(side_effect=True)
+
+
+@pytest.fixture
+def container():
+    return Container(ScopePackage(), Handler)
+
+
+async def test_scope(container):
+    async with container.application_context() as app_container:
+        scope = app_container.scope("a")
+        assert app_container.scope("a") is scope
+        async with scope.task_context() as task_container:
+            handler = await task_container.get(Handler)
+        async with scope.task_context() as task_container:
+            assert await task_container.get(Pool) is handler.pool
+        assert await scope.get(Pool) is handler.pool
+        assert await app_container.scope("b").get(Pool) is not handler.pool
+        CLOSE.assert_not_called()
+    assert CLOSE.call_count == 2
+    assert container.get_provider(Handler).context is Context.SCOPE
+
+
+async def test_scope_thread(container):
+    async with container.application_context() as app_container:
+        async with (
+            app_container.thread_context() as thread_container,
+            app_container.scope("a").task_context(thread_container) as task_container,
+        ):
+            await task_container.get(Handler)
+
+
+async def test_evicted(container):
+    async with container.application_context(max_scopes=1) as app_container:
+        async with app_container.scope("a").task_context() as task_container:
+            pool = await task_container.get(Pool)
+            other = await app_container.scope("b").get(Pool)
+            # Still used by the task.
+            CLOSE.assert_not_called()
+        CLOSE.assert_called_once_with(pool)
+        app_container.scope("c")
+        await asyncio.sleep(0)
+        CLOSE.assert_called_with(other)
+        assert len(app_container.scopes) == 1
+
+
+def test_sync():
+    container = Container(SyncScopePackage())
+    with container.sync_application_context(max_scopes=1) as app_container:
+        with app_container.scope("a").task_context() as task_container:
+            pool = task_container.get(Pool)
+        app_container.scope("b")
+        CLOSE.assert_called_once_with(pool)
+
+
+async def test_evicted_error(container):
+    CLOSE.side_effect = [ValueError("evicted"), None]
+    app_container = container.application_context(max_scopes=1)
+    await app_container.__aenter__()
+    await app_container.scope("a").get(Pool)
+    app_container.scope("b")
+    while app_container._closing:
+        await asyncio.sleep(0)
+    CLOSE.assert_called_once()
+    with pytest.raises(ValueError, match="evicted"):
+        await app_container.__aexit__(None, None, None)
+
+
+def test_eager():
+    with pytest.raises(DependencyResolutionError, match="cannot be eager"):
+        Container(ContextualizedDependency(Config, Context.SCOPE, eager=True))
+
+
+def test_thread_dependent():
+    with pytest.raises(DependencyResolutionError, match="scope dependencies"):
+        Container(ScopePackage(), ContextualizedDependency(Handler, Context.THREAD))
+
+
+async def test_outside_scope(container):
+    async with container.application_context() as app_container:
+        with pytest.raises(DependencyError, match="needs a scope container"):
+            await app_container.get(Pool)
+        async with app_container.task_context() as task_container:
+            with pytest.raises(DependencyError, match="needs a scope container"):
+                await task_container.get(Handler)
@@ -0,0 +1,122 @@
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+import pytest
+
+from imbue.container import Container
+from imbue.contexts.application import application_context
+from imbue.contexts.thread import thread_context
+from imbue.package import Package
+
+
+class PoolA: ...
+
+
+class PoolB: ...
+
+
+class Stuck: ...
+
+
+@dataclass
+class Service:
+    a: PoolA
+
+
+@dataclass
+class Handler:
+    service: Service
+    b: PoolB
+
+
+DELAY = 0.05
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+@pytest.fixture
+def container(events) -> Container:
+    def _resource(cls, delay, context=application_context):
+        async def _provide(self) -> AsyncIterator[cls]:
+            yield cls()
+            events.append(f"closing {cls.__name__}")
+            await asyncio.sleep(delay)
+            events.append(f"closed {cls.__name__}")
+
+        return context(_provide)
+
+    class ResourcePackage(Package):
+        a = _resource(PoolA, DELAY)
+        b = _resource(PoolB, DELAY)
+        stuck = _resource(Stuck, 10 * DELAY)
+
+        @application_context
+        async def service(self, a: PoolA) -> AsyncIterator[Service]:
+            yield Service(a)
+            events.append("closed Service")
+
+        @thread_context
+        async def handler(self, service: Service, b: PoolB) -> AsyncIterator[Handler]:
+            yield Handler(service, b)
+            events.append("closed Handler")
+
+    return Container(ResourcePackage())
+
+
+async def test_concurrent_teardown(container, events):
+    async with container.application_context(concurrent_teardown=True) as app_container:
+        await app_container.get(Handler)
+        await app_container.get(PoolB)
+    # Thread dependencies first, then dependents before their dependencies.
+    assert events[:2] == ["closed Handler", "closed Service"]
+    # Independent resources are cleaned up concurrently.
+    assert events[2:] == [
+        "closing PoolB",
+        "closing PoolA",
+        "closed PoolB",
+        "closed PoolA",
+    ]
+    report = app_container.teardown_report
+    assert report is not None
+    assert set(report.timings) == {Service, PoolA, PoolB}
+    assert report.timed_out == []
+    assert [interface for interface, _ in report.slowest(2)] in (
+        [PoolA, PoolB],
+        [PoolB, PoolA],
+    )
+
+
+async def test_concurrent_teardown_timeout(container, events):
+    async with container.application_context(
+        concurrent_teardown=True, teardown_timeout=2 * DELAY
+    ) as app_container:
+        await app_container.get(Stuck)
+        await app_container.get(Service)
+    # Other resources are not blocked by the stuck one.
+    assert events == [
+        "closing Stuck",
+        "closed Service",
+        "closing PoolA",
+        "closed PoolA",
+    ]
+    report = app_container.teardown_report
+    assert report is not None
+    assert report.timed_out == [Stuck]
+
+
+async def test_sequential_teardown_by_default(container, events):
+    async with container.application_context() as app_container:
+        await app_container.get(Service)
+        await app_container.get(PoolB)
+    assert app_container.teardown_report is None
+    assert events == [
+        "closing PoolB",
+        "closed PoolB",
+        "closed Service",
+        "closing PoolA",
+        "closed PoolA",
+    ]
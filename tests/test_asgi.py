@@ -0,0 +1,132 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Annotated
+
+import pytest
+from fastapi import FastAPI
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route, WebSocketRoute
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocket
+
+from imbue import Container, Package, auto_context, task_context
+from imbue.asgi import ImbueMiddleware, get_task_container
+from imbue.exceptions import DependencyError
+from imbue.fastapi import Dependency, request_lifespan
+
+
+@dataclass
+class DepA:
+    exited: bool = field(default=False, init=False)
+
+
+@dataclass
+class DepB:
+    a: DepA
+    exited: bool = field(default=False, init=False)
+
+
+@pytest.fixture(scope="session")
+def container() -> Container:
+    class TestPackage(Package):
+        @auto_context
+        async def a(self) -> AsyncIterator[DepA]:
+            dep = DepA()
+            yield dep
+            dep.exited = True
+
+        @task_context
+        async def b(self, a: DepA) -> AsyncIterator[DepB]:
+            dep = DepB(a)
+            yield dep
+            dep.exited = True
+
+    return Container(TestPackage())
+
+
+def test_starlette(container: Container):
+    provided: list[DepB] = []
+
+    async def endpoint(request: Request) -> JSONResponse:
+        b = await get_task_container(request.scope).get(DepB)
+        provided.append(b)
+        assert request.state.app_container is not None
+        return JSONResponse({"exited": b.exited})
+
+    async def websocket_endpoint(websocket: WebSocket) -> None:
+        await websocket.accept()
+        b = await get_task_container(websocket.scope).get(DepB)
+        provided.append(b)
+        await websocket.send_json({"exited": b.exited})
+        await websocket.close()
+
+    app = Starlette(
+        routes=[Route("/", endpoint), WebSocketRoute("/ws", websocket_endpoint)],
+        middleware=[Middleware(ImbueMiddleware, container=container)],
+    )
+
+    with TestClient(app) as client:
+        assert client.get("/").json() == {"exited": False}
+        assert provided[0].exited
+        with client.websocket_connect("/ws") as websocket:
+            assert websocket.receive_json() == {"exited": False}
+        assert provided[1].exited
+        assert provided[1] is not provided[0]
+        assert provided[1].a is provided[0].a
+        assert not provided[0].a.exited
+
+    assert provided[0].a.exited
+
+
+def test_fastapi_reuses_task_container(container: Container):
+    app = FastAPI(dependencies=[request_lifespan])
+    app.add_middleware(ImbueMiddleware, container=container)
+
+    @app.get("/")
+    async def get(
+        request: Request,
+        b: Annotated[DepB, Dependency(DepB)],
+    ) -> dict[str, bool]:
+        return {"same": await get_task_container(request.scope).get(DepB) is b}
+
+    with TestClient(app) as client:
+        assert client.get("/").json() == {"same": True}
+
+
+def test_bare_app(container: Container):
+    provided: list[DepB] = []
+
+    async def app(scope, receive, send) -> None:
+        assert scope["type"] == "http"
+        provided.append(await get_task_container(scope).get(DepB))
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    with TestClient(ImbueMiddleware(app, container=container)) as client:
+        assert client.get("/").status_code == 204
+        assert provided[0].exited
+        assert not provided[0].a.exited
+
+    assert provided[0].a.exited
+
+
+def test_options(container: Container):
+    async def app(scope, receive, send) -> None:
+        app_container = scope["state"]["app_container"]
+        assert app_container.cache.max_size == 3
+        assert app_container.scopes.max_size == 2
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    with TestClient(
+        ImbueMiddleware(app, container=container, cache_size=3, max_scopes=2)
+    ) as client:
+        assert client.get("/").status_code == 204
+
+
+def test_missing_task_container():
+    with pytest.raises(DependencyError):
+        get_task_container({"type": "http"})
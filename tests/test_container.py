@@ -1,3 +1,6 @@
+import sys
+from dataclasses import make_dataclass
+
 import pytest
 
 from imbue.container import Container
@@ -51,6 +54,26 @@ class TestContainer:
         ):
             Container(package_int)
 
+    def test_resolve_circular_chain(
+        self, provider_int, provider_str, package_int, package_str
+    ):
+        provider_int.sub_dependencies = iter([SubDependency("s", str)])
+        with pytest.raises(DependencyResolutionError) as exc_info:
+            Container(package_int, package_str)
+        assert str(exc_info.value) == (
+            "circular dependency found:\n"
+            f"-> {int} ({Context.TASK})\n"
+            f" -> {str} ({Context.TASK})\n"
+            f"  -> {int} ({Context.TASK})"
+        )
+
+    def test_resolve_deep(self):
+        classes = [make_dataclass("Node0", [])]
+        for i in range(1, 2 * sys.getrecursionlimit()):
+            classes.append(make_dataclass(f"Node{i}", [("previous", classes[-1])]))
+        registry = Container(*classes)
+        assert len(registry.get_plan(classes[-1]).steps) == len(classes)
+
     def test_resolve_not_found(self, package_str):
         with pytest.raises(DependencyResolutionError, match="no provider found"):
             Container(package_str)
@@ -90,3 +113,82 @@ class TestContainer:
         Container(package_int, package_str)
         assert provider_int.context == Context.APPLICATION
         assert provider_str.context == Context.APPLICATION
+
+    def test_plan(self, provider_int, provider_str, package_int, package_str):
+        registry = Container(package_int, package_str)
+        plan = registry.get_plan(str)
+        assert [s.interface for s in plan.steps] == [int, str]
+        assert plan.target.arguments == (("i", 0),)
+
+    def test_plan_factory_not_shared(self, mocker, provider_int, package_int):
+        provider_int.context = Context.FACTORY
+        providers = []
+        for interface in (str, bytes):
+            provider = mocker.Mock(spec=ContextualizedProvider)
+            provider.interface = interface
+            provider.sub_dependencies = iter([SubDependency("i", int)])
+            provider.context = Context.FACTORY
+            provider.eager = False
+            providers.append(provider)
+        provider_float = mocker.Mock(spec=ContextualizedProvider)
+        provider_float.interface = float
+        provider_float.sub_dependencies = iter(
+            [SubDependency("s", str), SubDependency("b", bytes)]
+        )
+        provider_float.context = Context.FACTORY
+        provider_float.eager = False
+        package = mocker.Mock(spec=Package)
+        package.get_providers.return_value = [*providers, provider_float]
+        registry = Container(package_int, package)
+        plan = registry.get_plan(float)
+        assert [s.interface for s in plan.steps] == [int, str, int, bytes, float]
+        assert plan.target.arguments == (("s", 1), ("b", 3))
+
+    def test_plan_unknown(self):
+        with pytest.raises(DependencyResolutionError, match="unknow interface"):
+            Container().get_plan(int)
+
+    def test_batch_plan(self, package_int, package_str):
+        registry = Container(package_int, package_str)
+        plan = registry.get_batch_plan((str, int))
+        assert [s.interface for s in plan.steps] == [int, str]
+        assert plan.targets == (1, 0)
+        assert registry.get_batch_plan((str, int)) is plan
+
+    def test_lazy(self, mocker, provider_int, package_int, package_str):
+        provider_int.context = None
+        provider_int.eager = True
+        resolve = mocker.spy(Container, "_resolve")
+        registry = Container(package_int, package_str, lazy=True)
+        resolve.assert_not_called()
+        assert [s.interface for s in registry.get_plan(str).steps] == [int, str]
+        assert resolve.call_count == 1
+        assert list(registry.get_eager_providers(Context.APPLICATION)) == [provider_int]
+        assert resolve.call_count == 1
+
+    def test_lazy_resolved(self, mocker, package_int, package_str):
+        registry = Container(package_int, package_str, lazy=True)
+        registry.get_plan(int)
+        lock = registry._lock = mocker.MagicMock()
+        registry.get_provider(int)
+        lock.__enter__.assert_not_called()
+        registry.get_provider(str)
+        lock.__enter__.assert_called_once()
+        registry.get_provider(str)
+        lock.__enter__.assert_called_once()
+
+    def test_lazy_eager(self, provider_int, package_int):
+        provider_int.context = None
+        provider_int.eager = True
+        registry = Container(package_int, lazy=True)
+        assert list(registry.get_eager_providers(Context.APPLICATION)) == [provider_int]
+
+    def test_lazy_not_found(self, package_str):
+        registry = Container(package_str, lazy=True)
+        with pytest.raises(DependencyResolutionError, match="no provider found"):
+            registry.get_plan(str)
+
+    def test_lazy_validate(self, package_str):
+        registry = Container(package_str, lazy=True)
+        with pytest.raises(DependencyResolutionError, match="no provider found"):
+            registry.validate()
@@ -0,0 +1,147 @@
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import Mock
+
+import pytest
+
+from imbue import (
+    Container,
+    Context,
+    ContextualizedDependency,
+    Factory,
+    Package,
+    SyncFactory,
+    factory_context,
+    get_annotations,
+    task_context,
+)
+from imbue.exceptions import DependencyResolutionError
+
+OPEN = Mock()
+CLOSE = Mock()
+
+
+class Config: ...
+
+
+class Session: ...
+
+
+class Buffer: ...
+
+
+class Item:
+    def __init__(self, config: Config, session: Session):
+        self.config = config
+        self.session = session
+
+
+class Row:
+    def __init__(self, buffer: Buffer):
+        self.buffer = buffer
+
+
+class Batch:
+    def __init__(self, make_item: Factory[Item], make_row: Factory[Row]):
+        self.make_item = make_item
+        self.make_row = make_row
+
+
+class SyncBatch:
+    def __init__(self, make_item: SyncFactory[Item]):
+        self.make_item = make_item
+
+
+class FactoryPackage(Package):
+    EXTRA_DEPENDENCIES = (Config,)
+
+    @task_context
+    def session(self) -> Session:
+        OPEN()
+        return Session()
+
+    @factory_context
+    def item(self, config: Config, session: Session) -> Item:
+        return Item(config, session)
+
+    @factory_context
+    async def buffer(self) -> AsyncIterator[Buffer]:
+        buffer = Buffer()
+        yield buffer
+        CLOSE(buffer)
+
+    @factory_context
+    def row(self, buffer: Buffer) -> Row:
+        return Row(buffer)
+
+
+class SyncFactoryPackage(Package):
+    EXTRA_DEPENDENCIES = (Config, Session)
+
+    @factory_context
+    def item(self, config: Config, session: Session) -> Iterator[Item]:
+        item = Item(config, session)
+        yield item
+        CLOSE(item)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks():
+    OPEN.reset_mock()
+    CLOSE.reset_mock()
+
+
+def test_annotations():
+    annotation = get_annotations(Batch.__init__)["make_item"]
+    assert annotation.factory
+    assert annotation.interface is Item
+
+
+async def test_factory():
+    container = Container(FactoryPackage(), Batch)
+    assert container.get_provider(Batch).context is Context.TASK
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            batch = await task_container.get(Batch)
+            OPEN.assert_not_called()
+            first, second = await batch.make_item(), await batch.make_item()
+            assert first is not second
+            assert first.session is second.session
+            assert first.session is await task_container.get(Session)
+            OPEN.assert_called_once()
+
+
+async def test_not_reusable():
+    container = Container(FactoryPackage(), Batch)
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            batch = await task_container.get(Batch)
+            first, second = await batch.make_row(), await batch.make_row()
+            assert first.buffer is not second.buffer
+            CLOSE.assert_not_called()
+        assert CLOSE.call_count == 2
+
+
+def test_sync():
+    container = Container(SyncFactoryPackage(), SyncBatch)
+    with container.sync_application_context() as app_container:
+        with app_container.task_context() as task_container:
+            batch = task_container.get(SyncBatch)
+            item = batch.make_item()
+            assert batch.make_item() is not item
+            CLOSE.assert_not_called()
+        CLOSE.assert_any_call(item)
+
+
+def test_not_factory():
+    class Client:
+        def __init__(self, make_session: Factory[Session]): ...
+
+    with pytest.raises(DependencyResolutionError, match="only provide factory"):
+        Container(FactoryPackage(), Client)
+
+
+def test_dependent_context():
+    with pytest.raises(DependencyResolutionError, match="only be used by task"):
+        Container(
+            FactoryPackage(), ContextualizedDependency(Batch, Context.APPLICATION)
+        )
@@ -1,9 +1,11 @@
+import inspect
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Annotated, cast
 
 import pytest
 from fastapi import FastAPI
+from starlette.requests import Request
 from starlette.testclient import TestClient
 
 from imbue import (
@@ -12,7 +14,7 @@ from imbue import (
     auto_context,
     task_context,
 )
-from imbue.fastapi import Dependency, app_lifespan, request_lifespan
+from imbue.fastapi import Dependency, app_lifespan, inject, request_lifespan
 
 
 @dataclass
@@ -93,3 +95,49 @@ def test(app: FastAPI):
         assert cast(DepB, prev_b).exited
 
     assert cast(DepA, prev_a).exited
+
+
+def test_app_lifespan_options(container: Container):
+    app = FastAPI(lifespan=app_lifespan(container, cache_size=3, max_scopes=2))
+
+    @app.get("/")
+    async def get(request: Request) -> dict[str, int | None]:
+        app_container = request.state.app_container
+        return {
+            "cache_size": app_container.cache.max_size,
+            "max_scopes": app_container.scopes.max_size,
+        }
+
+    with TestClient(app) as client:
+        assert client.get("/").json() == {"cache_size": 3, "max_scopes": 2}
+
+
+@pytest.mark.parametrize("is_async", [True, False])
+def test_inject(app: FastAPI, is_async: bool):
+    def endpoint(
+        q: str,
+        a: Annotated[DepA, Dependency(DepA)],
+        b: Annotated[DepB, Dependency(DepB)],
+    ) -> dict[str, bool]:
+        assert b.a is a
+        return {"q": q == "test", "entered": a.entered and b.entered}
+
+    async def async_endpoint(
+        q: str,
+        a: Annotated[DepA, Dependency(DepA)],
+        b: Annotated[DepB, Dependency(DepB)],
+    ) -> dict[str, bool]:
+        return endpoint(q, a, b)
+
+    injected = inject(async_endpoint if is_async else endpoint)
+    assert list(inspect.signature(injected).parameters) == [
+        "q",
+        "_imbue_task_container",
+    ]
+    app.get("/")(injected)
+
+    with TestClient(app) as client:
+        response = client.get("/", params={"q": "test"})
+        assert response.status_code == 200
+        assert response.json() == {"q": True, "entered": True}
+        assert client.get("/").status_code == 422
@@ -0,0 +1,148 @@
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from imbue import (
+    Container,
+    Context,
+    Event,
+    EventKind,
+    Package,
+    TimingAggregator,
+    application_context,
+    task_context,
+)
+
+
+class Client: ...
+
+
+class SyncClient: ...
+
+
+class Handler:
+    def __init__(self, client: Client):
+        self.client = client
+
+
+class HookedPackage(Package):
+    @application_context
+    async def client(self) -> AsyncIterator[Client]:
+        yield Client()
+
+    @application_context
+    def sync_client(self) -> Iterator[SyncClient]:
+        yield SyncClient()
+
+    @task_context
+    def handler(self, client: Client) -> Handler:
+        return Handler(client)
+
+
+@pytest.fixture
+def events() -> list[Event]:
+    return []
+
+
+@pytest.fixture
+def container(events) -> Container:
+    return Container(HookedPackage(), hooks=[events.append])
+
+
+async def test_events(container, events):
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            await task_container.get(Handler)
+            await task_container.get(Handler)
+    assert [(e.kind, e.interface, e.context) for e in events] == [
+        (EventKind.PROVIDE_START, Client, Context.APPLICATION),
+        (EventKind.ENTER, Client, Context.APPLICATION),
+        (EventKind.PROVIDE_END, Client, Context.APPLICATION),
+        (EventKind.PROVIDE_START, Handler, Context.TASK),
+        (EventKind.PROVIDE_END, Handler, Context.TASK),
+        (EventKind.CACHE_HIT, Handler, Context.TASK),
+        (EventKind.TEARDOWN, None, Context.FACTORY),
+        (EventKind.TEARDOWN, None, Context.POOLED),
+        (EventKind.TEARDOWN, None, Context.CACHED),
+        (EventKind.TEARDOWN, None, Context.TASK),
+        (EventKind.EXIT, Client, Context.APPLICATION),
+        (EventKind.TEARDOWN, None, Context.THREAD),
+        (EventKind.TEARDOWN, None, Context.APPLICATION),
+    ]
+    for event in events:
+        if event.kind in (EventKind.PROVIDE_START, EventKind.CACHE_HIT):
+            assert event.duration is None
+        else:
+            assert event.duration is not None
+            assert event.duration >= 0
+
+
+def test_sync_events(container, events):
+    with container.sync_application_context() as app_container:
+        app_container.get(SyncClient)
+    assert [(e.kind, e.interface) for e in events] == [
+        (EventKind.PROVIDE_START, SyncClient),
+        (EventKind.ENTER, SyncClient),
+        (EventKind.PROVIDE_END, SyncClient),
+        (EventKind.EXIT, SyncClient),
+        (EventKind.TEARDOWN, None),
+        (EventKind.TEARDOWN, None),
+    ]
+
+
+async def test_add_hook(container, events):
+    other: list[Event] = []
+    container.add_hook(other.append)
+    async with container.application_context() as app_container:
+        await app_container.get(Client)
+    assert other == events
+
+
+async def test_timing_aggregator():
+    aggregator = TimingAggregator()
+    container = Container(HookedPackage(), hooks=[aggregator])
+    async with container.application_context() as app_container:
+        for _ in range(3):
+            async with app_container.task_context() as task_container:
+                await task_container.get(Handler)
+                await task_container.get(Handler)
+    summary = aggregator.summary()
+    assert set(summary) == {Client, Handler}
+    handler = summary[Handler]
+    assert handler.calls == 3
+    assert handler.cache_hits == 3
+    assert 0 <= handler.p50 <= handler.p99 <= handler.total
+    # Client is reused from the application container when providing handlers.
+    assert summary[Client].calls == 1
+    assert summary[Client].cache_hits == 2
+    aggregator.clear()
+    assert aggregator.summary() == {}
+
+
+def test_timing_aggregator_bounded():
+    aggregator = TimingAggregator(sample_size=2)
+    for duration in (0.3, 0.1, 0.4, 0.2):
+        aggregator(Event(EventKind.PROVIDE_END, Client, Context.TASK, duration))
+    stats = aggregator.get_stats(Client)
+    assert stats.calls == 4
+    assert stats.total == pytest.approx(1.0)
+    assert (stats.min, stats.max) == (0.1, 0.4)
+    assert len(aggregator._timings[Client].sample) == 2
+    assert stats.min <= stats.p50 <= stats.p99 <= stats.max
+
+
+async def test_hook_error_does_not_replace_provider_error():
+    class BrokenPackage(Package):
+        @application_context
+        async def client(self) -> AsyncIterator[Client]:
+            raise ValueError("provider")
+            yield Client()
+
+    def hook(event: Event) -> None:
+        if event.kind in (EventKind.ENTER, EventKind.PROVIDE_END):
+            raise RuntimeError("hook")
+
+    container = Container(BrokenPackage(), hooks=[hook])
+    async with container.application_context() as app_container:
+        with pytest.raises(ValueError, match="provider"):
+            await app_container.get(Client)
@@ -0,0 +1,110 @@
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import Mock
+
+import pytest
+
+from imbue import (
+    Container,
+    Context,
+    ContextualizedDependency,
+    Lazy,
+    Package,
+    SyncLazy,
+    application_context,
+    cached_context,
+    get_annotations,
+    task_context,
+)
+from imbue.exceptions import DependencyResolutionError
+
+OPEN = Mock()
+CLOSE = Mock()
+
+
+class Client: ...
+
+
+class Session: ...
+
+
+class Handler:
+    def __init__(self, client: Lazy[Client], session: Lazy[Session]):
+        self.client = client
+        self.session = session
+
+
+class SyncHandler:
+    def __init__(self, client: SyncLazy[Client]):
+        self.client = client
+
+
+class LazyPackage(Package):
+    @application_context
+    def client(self) -> Iterator[Client]:
+        client = Client()
+        OPEN(client)
+        yield client
+        CLOSE(client)
+
+    @task_context
+    async def session(self) -> AsyncIterator[Session]:
+        session = Session()
+        OPEN(session)
+        yield session
+        CLOSE(session)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks():
+    OPEN.reset_mock()
+    CLOSE.reset_mock()
+
+
+def test_annotations():
+    annotation = get_annotations(Handler.__init__)["client"]
+    assert annotation.lazy
+    assert annotation.interface is Client
+
+
+async def test_lazy():
+    container = Container(LazyPackage(), Handler)
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            handler = await task_container.get(Handler)
+            OPEN.assert_not_called()
+            session = await handler.session.get()
+            assert await handler.session.get() is session
+            assert await task_container.get(Session) is session
+        CLOSE.assert_called_once_with(session)
+        async with app_container.task_context() as task_container:
+            handler = await task_container.get(Handler)
+            client = await handler.client.get()
+            assert await app_container.get(Client) is client
+        CLOSE.assert_called_once_with(session)
+    CLOSE.assert_called_with(client)
+
+
+def test_sync():
+    container = Container(LazyPackage(), SyncHandler)
+    with container.sync_application_context() as app_container:
+        with app_container.task_context() as task_container:
+            handler = task_container.get(SyncHandler)
+            OPEN.assert_not_called()
+            client = handler.client.get()
+            assert handler.client.get() is client
+    CLOSE.assert_called_once_with(client)
+
+
+def test_context_error():
+    with pytest.raises(DependencyResolutionError, match="context error"):
+        Container(LazyPackage(), ContextualizedDependency(Handler, Context.APPLICATION))
+
+
+def test_borrowed_dependent():
+    class CachedPackage(LazyPackage):
+        @cached_context
+        def handler(self, client: Lazy[Client]) -> Handler:
+            return Handler(client, client)  # ty: ignore[invalid-argument-type]
+
+    with pytest.raises(DependencyResolutionError, match="cannot have lazy ones"):
+        Container(CachedPackage())
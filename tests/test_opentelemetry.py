@@ -0,0 +1,85 @@
+from collections.abc import AsyncIterator
+
+import pytest
+
+from imbue import Container, Package, application_context, task_context
+from imbue.opentelemetry import TracingHook
+
+sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+export = pytest.importorskip("opentelemetry.sdk.trace.export")
+in_memory = pytest.importorskip(
+    "opentelemetry.sdk.trace.export.in_memory_span_exporter"
+)
+
+
+class Client: ...
+
+
+class Handler:
+    def __init__(self, client: Client):
+        self.client = client
+
+
+class Broken: ...
+
+
+class TestPackage(Package):
+    @application_context
+    async def client(self) -> AsyncIterator[Client]:
+        yield Client()
+
+    @task_context
+    def handler(self, client: Client) -> Handler:
+        return Handler(client)
+
+    @task_context
+    def broken(self) -> Broken:
+        raise ValueError("broken")
+
+
+@pytest.fixture
+def exporter():
+    return in_memory.InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer_provider(exporter):
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+    return provider
+
+
+async def test_spans(exporter, tracer_provider):
+    container = Container(TestPackage(), hooks=[TracingHook(tracer_provider)])
+    tracer = tracer_provider.get_tracer(__name__)
+    async with container.application_context() as app_container:
+        async with app_container.task_context() as task_container:
+            with tracer.start_as_current_span("endpoint"):
+                await task_container.get(Handler)
+                with pytest.raises(ValueError, match="broken"):
+                    await task_container.get(Broken)
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert set(spans) == {
+        "endpoint",
+        "provide Client",
+        "provide Handler",
+        "provide Broken",
+    }
+    endpoint = spans["endpoint"]
+    for name in ("provide Client", "provide Handler", "provide Broken"):
+        assert spans[name].parent.span_id == endpoint.context.span_id
+    assert spans["provide Client"].attributes == {
+        "imbue.interface": "Client",
+        "imbue.context": "APPLICATION",
+    }
+    assert spans["provide Handler"].status.status_code.name == "UNSET"
+    assert spans["provide Broken"].status.status_code.name == "ERROR"
+    assert spans["provide Broken"].events[0].name == "exception"
+
+
+async def test_no_opentelemetry(monkeypatch, exporter, tracer_provider):
+    monkeypatch.setattr("imbue.opentelemetry.trace", None)
+    container = Container(TestPackage(), hooks=[TracingHook(tracer_provider)])
+    async with container.application_context() as app_container:
+        await app_container.get(Client)
+    assert exporter.get_finished_spans() == ()
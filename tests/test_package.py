@@ -33,3 +33,57 @@ class TestPackage:
         for provider in providers:
             assert isinstance(provider, ContextualizedProvider)
             assert provider.context is Context.THREAD
+
+    async def test_get_providers_inherited(self, package):
+        class SubPackage(type(package)):
+            @property
+            def not_evaluated(self):
+                raise AssertionError
+
+            @thread_context
+            def provide_other(self) -> int:
+                return 1
+
+        class OverridingPackage(SubPackage):
+            provide_other = None
+
+        assert [p.interface for p in SubPackage().get_providers()] == [
+            async_func,
+            StandaloneDep,
+            int,
+        ]
+        assert [p.interface for p in OverridingPackage().get_providers()] == [
+            async_func,
+            StandaloneDep,
+        ]
+
+    async def test_get_providers_assigned(self, package):
+        class AssignedPackage(type(package)): ...
+
+        def provide_other(self) -> int:
+            return 1
+
+        def provide_instance(self) -> str:
+            return ""
+
+        AssignedPackage.provide_other = thread_context(provide_other)
+        instance = AssignedPackage()
+        instance.provide_instance = thread_context(provide_instance)
+        assert [p.interface for p in instance.get_providers()] == [
+            async_func,
+            str,
+            StandaloneDep,
+            int,
+        ]
+
+    async def test_get_providers_collected_once(self, package):
+        collected = type(package)._PROVIDERS
+        assert len(list(package.get_providers())) == 2
+        assert type(package)._PROVIDERS is collected
+
+        def provide_other(self) -> int:
+            return 1
+
+        type(package).provide_method = thread_context(provide_other)
+        assert [p.interface for p in package.get_providers()] == [async_func, int]
+        assert type(package)._PROVIDERS is not collected
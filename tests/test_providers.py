@@ -129,6 +129,16 @@ class TestProviders:
         assert isinstance(provided, NestedDep)
         assert provided.standalone is standalone
 
+    async def test_provide(self, nested_async_function_provider, nested_provider):
+        standalone = StandaloneDep()
+        assert nested_async_function_provider.awaitable
+        provided = await nested_async_function_provider.provide(standalone=standalone)
+        assert isinstance(provided, NestedDep)
+        assert not nested_provider.awaitable
+        assert not nested_provider.is_context_manager
+        provided = nested_provider.provide(standalone=standalone)
+        assert isinstance(provided, NestedDep)
+
     async def test_get_async_func(self, async_func_provider):
         standalone = StandaloneDep()
         result = async_func_provider.get(standalone=standalone)
@@ -164,3 +174,11 @@ class TestProviders:
         output, arg = result.provided(arg=True)
         assert output is standalone
         assert arg is True
+
+    def test_partial_template_reused(self, blocking_meth_provider, tasks_provider):
+        instance = tasks_provider.get(standalone=StandaloneDep()).provided
+        first = blocking_meth_provider.get(__instance__=instance).provided
+        second = blocking_meth_provider.get(__instance__=instance).provided
+        assert first is not second
+        assert len(blocking_meth_provider._templates) == 1
+        assert first(arg=True) == second(arg=True)
@@ -0,0 +1,128 @@
+import importlib
+import json
+
+import pytest
+
+from imbue import Container, Context, ContextualizedDependency, Package, task_context
+from imbue.snapshot import qualified_name
+
+
+class Client: ...
+
+
+class Handler:
+    def __init__(self, client: Client):
+        self.client = client
+
+
+class Settings: ...
+
+
+class HandlerPackage(Package):
+    EXTRA_DEPENDENCIES = (ContextualizedDependency(Client, eager=True),)
+
+    @task_context
+    def handler(self, client: Client) -> Handler:
+        return Handler(client)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "graph.json"
+
+
+@pytest.fixture
+def resolve(mocker):
+    return mocker.spy(Container, "_resolve")
+
+
+def test_export(path, resolve):
+    Container(HandlerPackage(), snapshot=path)
+    assert resolve.call_count == 2
+    data = json.loads(path.read_text())
+    assert data["providers"] == [
+        {
+            "interface": qualified_name(Client),
+            "context": "APPLICATION",
+            "eager": True,
+            "sub_dependencies": [],
+        },
+        {
+            "interface": qualified_name(Handler),
+            "context": "TASK",
+            "eager": False,
+            "sub_dependencies": [
+                ["client", qualified_name(Client), True, False, False]
+            ],
+        },
+    ]
+
+
+async def test_import(path, resolve):
+    Container(HandlerPackage(), snapshot=path)
+    resolve.reset_mock()
+    container = Container(HandlerPackage(), snapshot=path)
+    resolve.assert_not_called()
+    assert container.get_provider(Client).context is Context.APPLICATION
+    assert list(container.get_eager_providers(Context.APPLICATION)) == [
+        container.get_provider(Client)
+    ]
+    async with (
+        container.application_context() as app_container,
+        app_container.task_context() as task_container,
+    ):
+        handler = await task_container.get(Handler)
+        assert handler.client is await app_container.get(Client)
+
+
+def test_stale(path, resolve):
+    Container(HandlerPackage(), snapshot=path)
+    resolve.reset_mock()
+    # The declared providers changed.
+    Container(HandlerPackage(), Settings, snapshot=path)
+    assert resolve.call_count == 3
+    assert qualified_name(Settings) in path.read_text()
+
+
+def test_stale_base(path, resolve, tmp_path, monkeypatch):
+    source = tmp_path / "snapshot_base.py"
+    source.write_text("class Base:\n    def __init__(self): ...\n")
+    monkeypatch.syspath_prepend(tmp_path)
+    base = importlib.import_module("snapshot_base")
+
+    class Derived(base.Base): ...
+
+    Container(Derived, snapshot=path)
+    resolve.reset_mock()
+    # The inherited `__init__` changed.
+    source.write_text("class Base:\n    def __init__(self, client: int): ...\n")
+    Container(Derived, snapshot=path)
+    resolve.assert_called_once()
+
+
+def test_invalid(path, resolve):
+    path.write_text("{")
+    Container(HandlerPackage(), snapshot=path)
+    assert resolve.call_count == 2
+    assert json.loads(path.read_text())["providers"]
+
+
+def test_lazy_stale(path, resolve):
+    container = Container(HandlerPackage(), snapshot=path, lazy=True)
+    resolve.assert_not_called()
+    assert not path.exists()
+    container.validate()
+    resolve.reset_mock()
+    container = Container(HandlerPackage(), snapshot=path, lazy=True)
+    assert container.get_provider(Handler).context is Context.TASK
+    resolve.assert_not_called()
+
+
+def test_not_writable(tmp_path, resolve):
+    path = tmp_path / "missing" / "graph.json"
+    Container(HandlerPackage(), snapshot=path)
+    assert resolve.call_count == 2
+    assert not tmp_path.joinpath("missing").exists()
+    (tmp_path / "directory").mkdir()
+    Container(HandlerPackage(), snapshot=tmp_path / "directory")
+    assert [p.name for p in tmp_path.iterdir()] == ["directory"]
@@ -1,10 +1,21 @@
+import functools
+import gc
 import inspect
 from typing import get_type_hints
+from unittest.mock import Mock
 
 import pytest
 
 from imbue.exceptions import DependencyError
-from imbue.utils import Annotation, extend, get_annotations, partial
+from imbue.utils import (
+    Annotation,
+    AnnotationsCache,
+    CacheInfo,
+    PartialTemplate,
+    extend,
+    get_annotations,
+    partial,
+)
 
 
 @pytest.fixture
@@ -72,6 +83,28 @@ async def test_partial_async_call(async_func):
     assert await partial(async_func, a=1, b="1")() == "1-1"
 
 
+def test_partial_template(func):
+    template = PartialTemplate(func, ["a"])
+    bound1 = template.bind(func, {"a": 1})
+    bound2 = template.bind(func, {"a": 2})
+    assert bound1(b="1") == "1-1"
+    assert bound2(b="1") == "2-1"
+    assert get_type_hints(bound1) == {"b": str, "return": str}
+    assert list(inspect.signature(bound2).parameters) == ["b"]
+    assert inspect.signature(bound1) is inspect.signature(bound2)
+    # Only the partial is created when binding.
+    assert isinstance(bound1, functools.partial)
+    assert bound1.__name__ == func.__name__  # ty: ignore[unresolved-attribute]
+    assert inspect.unwrap(bound1) is func
+
+
+async def test_partial_template_async(async_func):
+    template = PartialTemplate(async_func, ["a"])
+    bound = template.bind(async_func, {"a": 1})
+    assert inspect.iscoroutinefunction(bound)
+    assert await bound(b="1") == "1-1"
+
+
 def test_get_annotations(func):
     assert get_annotations(func) == {
         "a": Annotation(int, True),
@@ -105,6 +138,37 @@ def test_get_annotations_class_method():
     }
 
 
+def test_annotations_cache(func):
+    cache = AnnotationsCache(maxsize=1)
+    compute = Mock(side_effect=get_annotations)
+    assert cache.get(func, compute) == get_annotations(func)
+    assert cache.get(func, compute) == get_annotations(func)
+    compute.assert_called_once_with(func)
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=1, currsize=1)
+    # Replacing the annotations invalidates the entry.
+    func.__annotations__ = {"a": str, "b": str, "return": str}
+    assert cache.get(func, compute)["a"] == Annotation(str, True)
+    assert cache.info().misses == 2
+
+
+def test_annotations_cache_bounded(func, async_func):
+    cache = AnnotationsCache(maxsize=1)
+    cache.get(func, get_annotations)
+    cache.get(async_func, get_annotations)
+    assert cache.info().currsize == 1
+
+
+def test_annotations_cache_weak():
+    def f(a: int) -> None: ...
+
+    cache = AnnotationsCache()
+    cache.get(f, get_annotations)
+    assert cache.info().currsize == 1
+    del f
+    gc.collect()
+    assert cache.info().currsize == 0
+
+
 def test_extend_remove_instance():
     @extend(A.f, remove_instance=True)
     def wrapped(*args, **kwargs):